@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""Run the docstring and disable statement checks in a single pass.
+
+check_docstrings.py and disable_statements_check.py each walk the tree
+and read their files in a separate interpreter. This driver walks the
+directories once and hands every file to the checker it belongs to:
+Python files are validated by check_docstrings.py and JavaScript and
+TypeScript files are scanned by DisableStatementsChecker. Each file is
+read once, by the checker that owns it. Files are checked in a process
+pool and reported in a deterministic order, followed by the totals of
+both checks, and the exit code is 1 if either check found anything.
+
+Directories such as node_modules and .venv are pruned from the walk as
+in check_docstrings.py.
+
+Usage:
+    python check_all.py --repo api --directories src .github
+    python check_all.py --repo api --files src/index.ts scripts/tool.py
+    python check_all.py --repo api --jobs 0
+"""
+
+import argparse
+import os
+import sys
+
+import check_docstrings
+from disable_statements_check import (
+    DisableStatementsChecker,
+    load_rule_selector,
+)
+from process_pool import map_in_pool, resolve_jobs, share, shared
+
+# Kinds of results produced by check_file
+DOCSTRINGS = "docstrings"
+DISABLE_STATEMENTS = "disable_statements"
+
+
+def discover(
+    directories: list[str],
+    exclude_dirs: list[str] = None,
+    use_git: bool = False,
+) -> list[str]:
+    """Find the files of both checks in a single walk.
+
+    Args:
+        directories: Directories to scan.
+        exclude_dirs: Directory names or paths to exclude.
+        use_git: List files with git so .gitignore is honoured.
+
+    Returns:
+        file_paths: Paths of the Python, JavaScript and TypeScript files.
+    """
+    return list(
+        check_docstrings.discover_directories(
+            directories,
+            exclude_dirs=exclude_dirs,
+            use_git=use_git,
+            extensions=check_docstrings.PYTHON_EXTENSIONS
+            + DisableStatementsChecker.SOURCE_EXTENSIONS,
+        )
+    )
+
+
+def check_file(
+    file_path: str,
+    repo: str = "admin",
+    engine: str = "line",
+    checker: DisableStatementsChecker = None,
+) -> tuple:
+    """Check a file with the checker it belongs to.
+
+    Args:
+        file_path: Path of the file.
+        repo: Repository type ("api" or "admin").
+        engine: Name of the check_docstrings.py engine.
+        checker: Disable statements checker. Defaults to the checker of
+            the worker process.
+
+    Returns:
+        result: Tuple of (kind, violations). Python files have a list of
+            check_docstrings.Violation, other files a list of messages.
+    """
+    if file_path.endswith(check_docstrings.PYTHON_EXTENSIONS):
+        violations, _ = check_docstrings.validate_file(file_path, engine)
+        return DOCSTRINGS, violations
+    checker = shared() if checker is None else checker
+    return DISABLE_STATEMENTS, checker.check_file(file_path, repo=repo)
+
+
+def check_files(
+    file_paths: list[str],
+    checker: DisableStatementsChecker,
+    repo: str = "admin",
+    engine: str = "line",
+    jobs: int = 1,
+):
+    """Check files with both checkers, optionally in a process pool.
+
+    Args:
+        file_paths: Paths of the files to check.
+        checker: Disable statements checker for non-Python files.
+        repo: Repository type ("api" or "admin").
+        engine: Name of the check_docstrings.py engine.
+        jobs: Number of worker processes. 0 uses every CPU.
+
+    Returns:
+        results: Generator of (file_path, kind, violations) tuples in the
+            order of file_paths.
+    """
+    jobs = resolve_jobs(jobs)
+
+    # Check in this process when a pool cannot help
+    if jobs == 1 or len(file_paths) < 2:
+        for file_path in file_paths:
+            yield (file_path,) + check_file(file_path, repo, engine, checker)
+        return
+
+    # Every worker checks with its own copy of the checker
+    results = map_in_pool(
+        check_file,
+        jobs,
+        file_paths,
+        [repo] * len(file_paths),
+        [engine] * len(file_paths),
+        initializer=share,
+        initargs=(checker,),
+    )
+    try:
+        for file_path, result in zip(file_paths, results):
+            yield (file_path,) + result
+    finally:
+        # Stop the pool when the consumer stops early
+        results.close()
+
+
+def report(results, stream=None) -> tuple:
+    """Write the merged report of both checks.
+
+    Args:
+        results: Iterable of (file_path, kind, violations) tuples.
+        stream: Text stream the report is written to. Defaults to stdout.
+
+    Returns:
+        totals: Tuple of the number of docstring violations and of
+            disable statement violations.
+    """
+    stream = sys.stdout if stream is None else stream
+    reporter = check_docstrings.TextReporter(stream)
+    disable_statements = 0
+
+    for file_path, kind, violations in results:
+        if kind == DOCSTRINGS:
+            reporter.report(file_path, violations)
+            continue
+        for violation in violations:
+            print(violation, file=stream)
+            disable_statements += 1
+
+    return reporter.finish(), disable_statements
+
+
+def main() -> None:
+    """Run both checks and exit with a single status.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(
+        description="Check docstrings and disable statements in one pass"
+    )
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument(
+        "--directories",
+        nargs="+",
+        default=["."],
+        help="Directories to check recursively (default: .)",
+    )
+    group.add_argument("--files", nargs="+", help="Files to check")
+    parser.add_argument(
+        "--repo",
+        choices=["api", "admin"],
+        default="admin",
+        help="Repository type (determines which disable checks to run)",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=sorted(check_docstrings.ENGINES),
+        default="line",
+        help="Engine used to locate functions and docstrings",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of processes checking files. 0 uses every CPU.",
+    )
+    parser.add_argument(
+        "--exclude",
+        action="append",
+        default=[],
+        help="Directory name or path to skip. May be repeated.",
+    )
+    parser.add_argument(
+        "--no-default-excludes",
+        action="store_true",
+        help="Also search directories such as node_modules and .venv",
+    )
+    parser.add_argument(
+        "--use-git",
+        action="store_true",
+        help="List files with git ls-files so .gitignore is honoured",
+    )
+    parser.add_argument(
+        "--config",
+        default="pyproject.toml" if os.path.isfile("pyproject.toml") else None,
+        help="TOML file with a [tool.disable_statements] table "
+        "(default: ./pyproject.toml if present)",
+    )
+    args = parser.parse_args()
+    if args.jobs < 0:
+        parser.error("--jobs must be 0 or more")
+
+    try:
+        rule_selector = load_rule_selector(
+            DisableStatementsChecker.rule_names(), args.config
+        )
+    except (OSError, ValueError, RuntimeError) as e:
+        parser.error(f"invalid rule configuration: {e}")
+    checker = DisableStatementsChecker(rule_selector=rule_selector)
+
+    exclude_dirs = list(args.exclude)
+    if not args.no_default_excludes:
+        exclude_dirs.extend(check_docstrings.DEFAULT_EXCLUDE_DIRS)
+
+    if args.files:
+        file_paths = [_ for _ in args.files if os.path.isfile(_)]
+    else:
+        file_paths = discover(args.directories, exclude_dirs, args.use_git)
+
+    docstrings, disable_statements = report(
+        check_files(
+            file_paths,
+            checker,
+            repo=args.repo,
+            engine=args.engine,
+            jobs=args.jobs,
+        )
+    )
+
+    if bool(docstrings) or bool(disable_statements):
+        print(
+            f"Found {docstrings} docstring violations and "
+            f"{disable_statements} disable statements ({args.repo} checks)."
+        )
+        sys.exit(1)
+    print(
+        "No docstring violations or disable statements found "
+        f"({args.repo} checks)."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,48 +1,532 @@
 #!/usr/bin/env python3
-"""Script to check for docstrings."""
-
+"""Script to check for docstrings.
+
+Two engines locate functions and their docstrings. The default "line"
+engine scans the file line by line. The "ast" engine parses each file
+once with the ast module, falls back to the line engine for files that do
+not parse, and lets a result cache reuse the results of unchanged
+functions.
+"""
+
+import bisect
+import hashlib
+import itertools
+import json
 import os
 import re
 import sys
+import time
 import argparse
-from collections import namedtuple
-from docstring_parser import parse
+from abc import ABC, abstractmethod
+from collections import OrderedDict, namedtuple
+
+from process_pool import map_in_pool, resolve_jobs
+
+# Issue and corrective action of each rule. The messages of rules with
+# parameters are completed with str.format()
+MESSAGES = {
+    "DOC001": (
+        "Missing docstring",
+        "Add a Google-style docstring to describe this function.",
+    ),
+    "DOC002": (
+        "Single line docstring without 'Args:' or 'Results:' sections "
+        "defined.",
+        "Define the 'Args:' or 'Results:' sections.",
+    ),
+    "DOC003": (
+        "Unclosed docstring",
+        "Ensure the docstring is properly closed with triple quotes.",
+    ),
+    "DOC004": (
+        "Docstring parsing error",
+        "Ensure the docstring is properly formatted: {0}",
+    ),
+    "DOC101": (
+        "Docstring doesn't have a valid description",
+        "Add a docstring description to the first line.",
+    ),
+    "DOC102": (
+        "The Docstring's short description on the first line doesn't have "
+        "a blank line after it.",
+        "Add the trailing blank line.",
+    ),
+    "DOC201": (
+        "Missing 'Args' section",
+        "Add an 'Args:' section listing the arguments this function "
+        "accepts.",
+    ),
+    "DOC202": (
+        "Docstring doesn't have a valid 'Args:' section",
+        "Add an 'Args:' section with values to the function's docstring",
+    ),
+    "DOC203": (
+        "Docstring has no 'Args:' section variable name and description.",
+        "Add an 'Args:' section with a variable name and description to "
+        "the function's docstring",
+    ),
+    "DOC204": (
+        "Docstring 'Args:' section variable '{0}' needs a description.",
+        "Add description to the variable.",
+    ),
+    "DOC205": (
+        "The arguments defined in the docstring don't match those of the "
+        "function.",
+        "Adjust your docstring to match the listed function arguments.",
+    ),
+    "DOC206": (
+        "Argument '{0}' defined in the docstring is not an argument in the "
+        "function",
+        "Remove argument '{0}' from the docstring",
+    ),
+    "DOC207": (
+        "Argument '{0}' defined in the function is not an argument in the "
+        "docstring",
+        "Add argument '{0}' to the Docstring",
+    ),
+    "DOC301": (
+        "Missing 'Returns:' section",
+        "Add a 'Returns:' section describing the return value.",
+    ),
+    "DOC302": (
+        "Docstring has improperly formatted 'Returns:' section",
+        "Add a correctly formatted 'Returns:' section to the function's "
+        "docstring",
+    ),
+    "DOC303": (
+        "Docstring 'Returns:' section with no description",
+        "Add a description to the 'Returns:' section to the function's "
+        "docstring",
+    ),
+    "DOC304": (
+        "Docstring has no 'Returns:' section",
+        "Add a 'Returns:' section to the function's docstring",
+    ),
+    "DOC305": (
+        "Docstring has no 'Returns:' section variable name and description. "
+        "If the return value is 'None', then use 'None'",
+        "Add a 'Returns:' section with a variable name and description to "
+        "the function's docstring",
+    ),
+    "DOC306": (
+        "Docstring 'Returns:' section variable '{0}' needs a description.",
+        "Add description to the variable.",
+    ),
+}
+
+
+class Violation(namedtuple("Violation", "line function code params")):
+    """Docstring violation identified by a rule code.
+
+    Only the code and its parameters are stored. The messages are looked
+    up in MESSAGES when they are read.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, line, function, code, params=()):
+        """Create a violation.
+
+        Args:
+            line (int): Line number the violation was found on.
+            function (str): Name of the function.
+            code (str): Rule code in MESSAGES.
+            params (tuple): Values completing the rule's messages.
+
+        Returns:
+            Violation: The new violation
+
+        """
+        return super().__new__(cls, line, function, code, tuple(params))
+
+    @property
+    def issue(self):
+        """Describe the problem.
+
+        Args:
+            None
+
+        Returns:
+            str: The issue message of the rule
+
+        """
+        return MESSAGES[self.code][0].format(*self.params)
+
+    @property
+    def action(self):
+        """Describe how to fix the problem.
+
+        Args:
+            None
+
+        Returns:
+            str: The corrective action message of the rule
+
+        """
+        return MESSAGES[self.code][1].format(*self.params)
+
+
+Function = namedtuple("Function", "name arguments")
+Docstring = namedtuple(
+    "Docstring", "violations docstring parser arguments fatal"
+)
+LineIndex = namedtuple("LineIndex", "length delimiters quotes parentheses")
+DocstringSections = namedtuple(
+    "DocstringSections",
+    "parser has_args args_none has_returns returns_none returns_name",
+)
+
+# Leading characters of a 'Returns:' description that make it valid
+RETURNS_NAME = re.compile(r"[a-zA-Z0-9_]*")
+
+# Default bound on the number of files kept in the result cache
+CACHE_MAX_ENTRIES = 10000
+
+# Default bound on the number of parsed docstrings kept in memory
+PARSE_CACHE_MAX_ENTRIES = 1024
+
+# Files shorter than this are scanned forward instead of indexed
+LINE_INDEX_MIN_LINES = 2000
+
+# Directory names never searched for Python files unless asked to
+DEFAULT_EXCLUDE_DIRS = (
+    ".eggs",
+    ".git",
+    ".mypy_cache",
+    ".nox",
+    ".pytest_cache",
+    ".tox",
+    ".venv",
+    "__pycache__",
+    "build",
+    "coverage",
+    "dist",
+    "node_modules",
+    "venv",
+)
+
+
+class Tracer:
+    """Record timed spans in the Chrome trace event format."""
+
+    def __init__(self):
+        """Start an empty trace.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        self.events = []
+        self.origin = time.perf_counter_ns()
+
+    def record(self, name, detail, start, end):
+        """Record a completed span.
+
+        Args:
+            name (str): Name of the phase.
+            detail (str): Optional file or function the span is about.
+            start (int): Start time from time.perf_counter_ns().
+            end (int): End time from time.perf_counter_ns().
+
+        Returns:
+            None
+
+        """
+        event = {
+            "name": name,
+            "ph": "X",
+            "ts": (start - self.origin) / 1000,
+            "dur": (end - start) / 1000,
+            "pid": os.getpid(),
+            "tid": 1,
+        }
+        if detail is not None:
+            event["args"] = {"detail": detail}
+        self.events.append(event)
+
+    def counter(self, name, values):
+        """Record the values of counters at the current time.
+
+        Args:
+            name (str): Name of the group of counters.
+            values (dict): Counter values keyed by counter name.
+
+        Returns:
+            None
+
+        """
+        self.events.append(
+            {
+                "name": name,
+                "ph": "C",
+                "ts": (time.perf_counter_ns() - self.origin) / 1000,
+                "pid": os.getpid(),
+                "args": dict(values),
+            }
+        )
+
+    def write(self, path):
+        """Write the trace for chrome://tracing or Perfetto.
+
+        Args:
+            path (str): Location of the JSON trace file.
+
+        Returns:
+            None
+
+        """
+        with open(path, "w", encoding="utf-8") as fh_:
+            json.dump(
+                {"traceEvents": self.events, "displayTimeUnit": "ms"}, fh_
+            )
+
+    def summary(self, top=10):
+        """Summarize the phases taking the most time.
+
+        Args:
+            top (int): Number of phases to list.
+
+        Returns:
+            str: Table of the calls, total and mean time of each phase
+
+        """
+        # Add up the durations of each phase
+        totals = {}
+        counters = []
+        for event in self.events:
+            if event["ph"] == "C":
+                values = ", ".join(
+                    f"{k}={v}" for k, v in event["args"].items()
+                )
+                counters.append(f"{event['name']}: {values}")
+                continue
+            calls, total = totals.get(event["name"], (0, 0.0))
+            totals[event["name"]] = (calls + 1, total + event["dur"])
+
+        lines = [f"{'phase':<32}{'calls':>8}{'total ms':>12}{'mean us':>10}"]
+        for name, (calls, total) in sorted(
+            totals.items(), key=lambda item: item[1][1], reverse=True
+        )[:top]:
+            lines.append(
+                f"{name:<32}{calls:>8}{total / 1000:>12.2f}"
+                f"{total / calls:>10.1f}"
+            )
+        return "\n".join(lines + counters)
+
+
+class _Span:
+    """Context manager recording the duration and memory of a phase."""
+
+    __slots__ = ("tracer", "memory", "name", "detail", "start")
+
+    def __init__(self, tracer, memory, name, detail):
+        """Prepare the span.
+
+        Args:
+            tracer (Tracer): Trace the span is recorded in, or None.
+            memory (MemoryReport): Report the span is measured in, or None.
+            name (str): Name of the phase.
+            detail (str): Optional file or function the span is about.
+
+        Returns:
+            None
+
+        """
+        self.tracer = tracer
+        self.memory = memory
+        self.name = name
+        self.detail = detail
+        self.start = 0
+
+    def __enter__(self):
+        """Start timing.
+
+        Args:
+            None
+
+        Returns:
+            _Span: This span
+
+        """
+        if self.memory is not None:
+            self.memory.begin()
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        """Stop timing and record the span.
+
+        Args:
+            *exc_info: Exception details, if any.
+
+        Returns:
+            bool: False, so exceptions propagate
+
+        """
+        if self.tracer is not None:
+            self.tracer.record(
+                self.name, self.detail, self.start, time.perf_counter_ns()
+            )
+        if self.memory is not None:
+            detail = self.detail if self.name in FILE_SPANS else None
+            self.memory.end(self.name, detail)
+        return False
+
+
+class _NoSpan:
+    """Context manager doing nothing while tracing is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        """Do nothing.
+
+        Args:
+            None
+
+        Returns:
+            _NoSpan: This span
+
+        """
+        return self
+
+    def __exit__(self, *exc_info):
+        """Do nothing.
+
+        Args:
+            *exc_info: Exception details, if any.
+
+        Returns:
+            bool: False, so exceptions propagate
+
+        """
+        return False
+
+
+# Trace the spans are recorded in. None disables tracing.
+_TRACER = None
+# Memory report the spans are measured in. None disables it.
+_MEMORY = None
+_NO_SPAN = _NoSpan()
+
+# Extensions of the files discovered by default
+PYTHON_EXTENSIONS = (".py",)
+
+# Spans whose detail is the path of the file being checked
+FILE_SPANS = frozenset(("file", "read", "ast.parse", "report"))
+
+
+def set_tracer(tracer):
+    """Enable or disable tracing.
+
+    Args:
+        tracer (Tracer): Trace to record spans in, or None to disable.
+
+    Returns:
+        None
+
+    """
+    global _TRACER
+    _TRACER = tracer
+
+
+def set_memory_report(memory):
+    """Enable or disable measuring the memory of each phase.
+
+    Args:
+        memory (MemoryReport): Report to measure spans in, or None to
+            disable. The caller starts and stops tracemalloc.
+
+    Returns:
+        None
+
+    """
+    global _MEMORY
+    _MEMORY = memory
+
+
+def span(name, detail=None):
+    """Time a phase of the checker when tracing or measuring memory.
+
+    Args:
+        name (str): Name of the phase.
+        detail (str): Optional file or function the span is about.
+
+    Returns:
+        object: Context manager timing the enclosed code
 
-Violation = namedtuple("Violation", "line function issue action")
+    """
+    if _TRACER is None and _MEMORY is None:
+        return _NO_SPAN
+    return _Span(_TRACER, _MEMORY, name, detail)
 
 
-def validate_docstring(file_path):
+def validate_docstring(file_path, indexed=None):
     """Validate docstrings in a file for compliance with the Google style guide.
 
     Args:
         file_path (str): Path to the Python file to validate.
+        indexed (bool): Locate docstrings and signature ends with a
+            LineIndex built once per file instead of scanning forward
+            from every function. None indexes files of at least
+            LINE_INDEX_MIN_LINES lines.
 
     Returns:
         list: List of violations found in the file, with details about
             the issue and corrective action.
 
     """
-    # Initialize key variables
-    violations = []
+    return list(iter_violations(file_path, indexed=indexed))
+
+
+def iter_violations(file_path, indexed=None):
+    """Validate docstrings in a file, one function at a time.
+
+    Args:
+        file_path (str): Path to the Python file to validate.
+        indexed (bool): Locate docstrings and signature ends with a
+            LineIndex built once per file. None indexes files of at
+            least LINE_INDEX_MIN_LINES lines.
 
+    Returns:
+        generator: Yields each violation as soon as its function has been
+            evaluated.
+
+    """
     # Read the file for processing
     try:
-        with open(file_path, "r", encoding="utf-8") as fh_:
-            lines_with_hard_returns = fh_.readlines()
+        with span("read", file_path):
+            with open(file_path, "r", encoding="utf-8") as fh_:
+                lines_with_hard_returns = fh_.readlines()
 
     except Exception:
-        return violations
+        return
 
     # Remove hard returns at the end of each line read
     lines = [_.rstrip() for _ in lines_with_hard_returns]
 
+    # The index only pays for itself on long files, where scanning
+    # forward from undocumented functions becomes quadratic
+    if indexed is None:
+        indexed = len(lines) >= LINE_INDEX_MIN_LINES
+    index = None
+    if bool(indexed):
+        with span("build_line_index"):
+            index = build_line_index(lines)
+
     # Evaluate each line
     for line_number, line in enumerate(lines):
 
         # Identify sections of the file that are functions or methods
         if re.match(r"^\s*def ", line):
             # Get the function name and its arguments
-            function = extract_function_arguments(line_number, lines)
+            with span("extract_function_arguments"):
+                function = extract_function_arguments(
+                    line_number, lines, index
+                )
 
             # Ignore test functions in test files
             if ignore_function(function, file_path):
@@ -55,24 +539,345 @@ def validate_docstring(file_path):
                     continue
 
             # Get the docstring
-            docstring = extract_docstring(function.name, line_number, lines)
+            with span("extract_docstring", function.name):
+                docstring = extract_docstring(
+                    function.name, line_number, lines, index
+                )
             if bool(docstring.violations):
-                # Add the violation to the list
-                violations.extend(docstring.violations)
+                # Yield the violations as they are found
+                yield from docstring.violations
 
             # Evaluate the relationship between the
             # declared variables and the docstring
             if bool(docstring.fatal) is False:
-                bad = match_arguments_to_docstring(
-                    function, docstring, line_number
-                )
+                with span("match_arguments_to_docstring"):
+                    bad = match_arguments_to_docstring(
+                        function, docstring, line_number
+                    )
                 if bool(bad):
-                    violations.extend(bad)
+                    yield from bad
+
+
+def validate_docstring_ast(file_path):
+    """Validate docstrings in a file using a single parse of the file.
+
+    Functions, their arguments and their docstrings are read from the
+    syntax tree instead of being searched for line by line. Files that
+    are not valid Python, for example because of an unclosed docstring,
+    are validated with the line based engine instead.
+
+    Args:
+        file_path (str): Path to the Python file to validate.
+
+    Returns:
+        list: List of violations found in the file, with details about
+            the issue and corrective action.
+
+    """
+    violations, _ = validate_functions_ast(file_path, None)
+    return violations
+
+
+def validate_functions_ast(file_path, known):
+    """Validate docstrings in a file, reusing earlier function results.
+
+    Each function is fingerprinted. Functions whose fingerprint is in
+    known are not evaluated again and their violations are moved to the
+    function's current line.
+
+    Args:
+        file_path (str): Path to the Python file to validate.
+        known (dict): Violations of earlier validations keyed by function
+            fingerprint, as returned by this function. None skips the
+            fingerprints when there is no cache to reuse them from.
+
+    Returns:
+        tuple: List of violations found in the file, and a dict of the
+            violations of each function keyed by fingerprint. The dict is
+            None if known is None or the file had to be validated by the
+            line engine.
+
+    """
+    # Initialize key variables
+    violations = []
+    functions = None if known is None else {}
+
+    for fingerprint, line, found in iter_functions_ast(file_path, known):
+        violations.extend(found)
+        if fingerprint is None:
+            functions = None
+        elif functions is not None:
+            functions[fingerprint] = [
+                [_.line - line, _.function, _.code, list(_.params)]
+                for _ in found
+            ]
+
+    # Return
+    return violations, functions
+
+
+def iter_violations_ast(file_path):
+    """Validate docstrings in a file with the AST engine, one at a time.
+
+    Args:
+        file_path (str): Path to the Python file to validate.
+
+    Returns:
+        generator: Yields each violation as soon as its function has been
+            evaluated.
+
+    """
+    for _, _, found in iter_functions_ast(file_path, None):
+        yield from found
+
+
+def iter_functions_ast(file_path, known):
+    """Evaluate the functions of a file in the order of the file.
+
+    Files that are not valid Python are validated by the line engine,
+    whose violations are produced one at a time without a fingerprint.
+
+    Args:
+        file_path (str): Path to the Python file to validate.
+        known (dict): Violations of earlier validations keyed by function
+            fingerprint. Matching functions are not evaluated again. None
+            disables fingerprinting.
+
+    Returns:
+        generator: Yields a (fingerprint, line, violations) tuple per
+            function, where line is the line of the def statement. The
+            fingerprint is None when known is None.
+
+    """
+    # Only the AST engine pays for importing ast
+    import ast
+
+    # Read the file for processing
+    try:
+        with span("read", file_path):
+            with open(file_path, "r", encoding="utf-8") as fh_:
+                source = fh_.read()
+
+    except Exception:
+        return
+
+    try:
+        with span("ast.parse", file_path):
+            tree = ast.parse(source, filename=file_path)
+    except (SyntaxError, ValueError):
+        for violation in iter_violations(file_path):
+            yield None, None, [violation]
+        return
+
+    # Keep line numbering identical to the line based engine
+    lines = [_.rstrip() for _ in source.split("\n")]
+
+    # Evaluate each function or method in the order of the file
+    nodes = sorted(
+        (
+            node
+            for node in ast.walk(tree)
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+        ),
+        key=lambda node: (node.lineno, node.col_offset),
+    )
+    for node in nodes:
+        line_number = node.lineno - 1
+        function = Function(name=node.name, arguments=ast_arguments(node))
+
+        # Ignore test functions in test files
+        if ignore_function(function, file_path):
+            continue
+
+        # Skip if there are python decorator exceptions
+        decorator = function_has_decorator(line_number, lines)
+        if bool(decorator):
+            if decorator_in_docstring_exception_list(decorator):
+                continue
+
+        # Reuse the results of unchanged functions at their new line
+        fingerprint = None
+        if known is not None:
+            fingerprint = function_fingerprint(
+                function, decorator, node, lines
+            )
+        if fingerprint is not None and fingerprint in known:
+            found = [
+                Violation(node.lineno + offset, name, code, params)
+                for offset, name, code, params in known[fingerprint]
+            ]
+        else:
+            found = evaluate_function_ast(function, node, lines)
+        yield fingerprint, node.lineno, found
+
+
+def evaluate_function_ast(function, node, lines):
+    """Evaluate the docstring of a function read from its syntax tree.
+
+    Args:
+        function (Function): Name and arguments of the function.
+        node (ast.AST): ast.FunctionDef or ast.AsyncFunctionDef node.
+        lines (list): The file as a list of strings split by a new line
+            separator.
+
+    Returns:
+        list: Violations found in the function
+
+    """
+    # Initialize key variables
+    violations = []
+
+    # Get the docstring
+    with span("ast_docstring", function.name):
+        docstring = ast_docstring(function.name, node, lines)
+    if bool(docstring.violations):
+        violations.extend(docstring.violations)
+
+    # Evaluate the relationship between the
+    # declared variables and the docstring
+    if bool(docstring.fatal) is False:
+        with span("match_arguments_to_docstring"):
+            bad = match_arguments_to_docstring(
+                function, docstring, node.lineno - 1
+            )
+        if bool(bad):
+            violations.extend(bad)
 
     # Return
     return violations
 
 
+def function_fingerprint(function, decorator, node, lines):
+    """Identify everything the violations of a function depend on.
+
+    The fingerprint covers the name, arguments and decorator of the
+    function, its docstring text and the docstring's position relative
+    to the def line. The function body is left out as it cannot change
+    the violations.
+
+    Args:
+        function (Function): Name and arguments of the function.
+        decorator (str): Decorator found before the function, if any.
+        node (ast.AST): ast.FunctionDef or ast.AsyncFunctionDef node.
+        lines (list): The file as a list of strings split by a new line
+            separator.
+
+    Returns:
+        str: Hex digest of the function's fingerprint
+
+    """
+    # Initialize key variables
+    first = ast_docstring_node(node)
+    docstring = None
+
+    if first is not None:
+        docstring = (
+            first.lineno - node.lineno,
+            lines[first.lineno - 1 : first.end_lineno],
+        )
+    text = repr((function.name, function.arguments, decorator, docstring))
+    return hashlib.sha256(text.encode()).hexdigest()[:24]
+
+
+def ast_docstring_node(node):
+    """Find the docstring expression of a function.
+
+    Args:
+        node (ast.AST): ast.FunctionDef or ast.AsyncFunctionDef node.
+
+    Returns:
+        ast.Expr: The docstring statement, or None without a docstring
+
+    """
+    # Already imported by the caller that built the node
+    import ast
+
+    first = node.body[0] if bool(node.body) else None
+    if (
+        isinstance(first, ast.Expr)
+        and isinstance(first.value, ast.Constant)
+        and isinstance(first.value.value, str)
+    ):
+        return first
+    return None
+
+
+def ast_arguments(node):
+    """Extract the argument names of a function from its syntax tree.
+
+    Args:
+        node: ast.FunctionDef or ast.AsyncFunctionDef node
+
+    Returns:
+        result: List of argument names, with '*' and '**' prefixes for
+            variadic arguments and without 'self' or 'cls'
+
+    """
+    # Initialize key variables
+    args = node.args
+    arguments = [_.arg for _ in args.posonlyargs + args.args]
+    method_keywords = ["self", "cls"]
+
+    # Variadic and keyword-only arguments
+    if args.vararg is not None:
+        arguments.append(f"*{args.vararg.arg}")
+    arguments.extend(_.arg for _ in args.kwonlyargs)
+    if args.kwarg is not None:
+        arguments.append(f"**{args.kwarg.arg}")
+
+    # Fix arguments for methods
+    for keyword in method_keywords:
+        if keyword in arguments:
+            arguments.remove(keyword)
+
+    # Return
+    return arguments
+
+
+def ast_docstring(func_name, node, lines):
+    """Evaluate the docstring of a function read from its syntax tree.
+
+    Args:
+        func_name: Name of the function for the docstring
+        node: ast.FunctionDef or ast.AsyncFunctionDef node
+        lines: The file as a list of strings split by a new line separator
+
+    Returns:
+        result: Docstring object
+
+    """
+    # Initialize key variables
+    first = ast_docstring_node(node)
+
+    # Ensure there is a docstring
+    if first is None:
+        return Docstring(
+            docstring="",
+            violations=[
+                Violation(line=node.lineno, function=func_name, code="DOC001")
+            ],
+            parser=None,
+            arguments=[],
+            fatal=True,
+        )
+
+    # Check to make sure there are defined arguments
+    if first.lineno == first.end_lineno:
+        return Docstring(
+            docstring="",
+            violations=[
+                Violation(line=node.lineno, function=func_name, code="DOC002")
+            ],
+            parser=None,
+            arguments=[],
+            fatal=True,
+        )
+
+    # Evaluate the lines of the docstring
+    docstring = "\n".join(lines[first.lineno - 1 : first.end_lineno])
+    return evaluate_docstring(func_name, first.lineno - 1, docstring)
+
+
 def ignore_function(function, file_path):
     """Extract the docstring from a list of lines read from a file.
 
@@ -120,12 +925,7 @@ def match_arguments_to_docstring(function, docstring, line_number):
     if sorted(arguments_function) != sorted(arguments_docstring):
         violations.append(
             Violation(
-                line=line_number + 1,
-                function=function.name,
-                issue="""\
-The arguments defined in the docstring don't match those of the function.""",
-                action="""\
-Adjust your docstring to match the listed function arguments.""",
+                line=line_number + 1, function=function.name, code="DOC205"
             )
         )
         return violations
@@ -144,11 +944,8 @@ Adjust your docstring to match the listed function arguments.""",
                     Violation(
                         line=line_number + 1,
                         function=function.name,
-                        issue=f"""\
-Argument '{argument_docstring}' defined in the docstring is not \
-an argument in the function""",
-                        action=f"""\
-Remove argument '{argument_docstring}' from the docstring""",
+                        code="DOC206",
+                        params=(argument_docstring,),
                     )
                 )
                 bad_argument_function = True
@@ -168,11 +965,8 @@ Remove argument '{argument_docstring}' from the docstring""",
                         Violation(
                             line=line_number + 1,
                             function=function.name,
-                            issue=f"""\
-    Argument '{argument_function}' defined in the function is not \
-    an argument in the docstring""",
-                            action=f"""\
-    Add argument '{argument_function}' to the Docstring""",
+                            code="DOC207",
+                            params=(argument_function,),
                         )
                     )
                     bad_argument_docstring = True
@@ -237,22 +1031,23 @@ def decorator_in_docstring_exception_list(item):
     return result
 
 
-def extract_function_arguments(start, lines):
+def extract_function_arguments(start, lines, index=None):
     """Extract the arguments of a function read from a file.
 
     Args:
         start: Starting line to process
         lines: List of lines in the file
+        index: Optional LineIndex of the lines
 
     Returns:
         result: Function object
 
     """
     # Initialize key variables
-    func = ""
-    possibles = lines[start:]
+    parts = []
+    stop = len(lines) if index is None else signature_end(start, index)
+    possibles = lines[start:stop]
     arguments = []
-    Function = namedtuple("Function", "name arguments")
     method_keywords = ["self", "cls"]
 
     # Process the function
@@ -260,9 +1055,10 @@ def extract_function_arguments(start, lines):
         if bool(line) is False:
             continue
         elif ("'''" not in line) and ('"""' not in line):
-            func = f"{func}{line.strip()}"
+            parts.append(line.strip())
         else:
             break
+    func = "".join(parts)
 
     # Get the arguments
     items = func.split("(")[1].split(",")
@@ -283,13 +1079,14 @@ def extract_function_arguments(start, lines):
     return result
 
 
-def extract_docstring(func_name, line_number, lines):
+def extract_docstring(func_name, line_number, lines, index=None):
     """Extract the docstring from a list of lines read from a file.
 
     Args:
         line_number: Line where the function starts
         lines: The file as a list of strings split by a new line separator
         func_name: Name of the function for the docstring
+        index: Optional LineIndex of the lines
 
     Returns:
         result: namedtuple containing the docstring, and status
@@ -299,43 +1096,49 @@ def extract_docstring(func_name, line_number, lines):
     violations = []
     parser = None
     fatal = False
-    Docstring = namedtuple(
-        "Docstring", "violations docstring parser arguments fatal"
-    )
     docstring = ""
     arguments = []
     found_start = False
     found_end = False
 
     # Process Docstring
-    docstring_start = line_number
-    while docstring_start < len(lines):
-        if bool(is_docstring_delimiter(lines[docstring_start])) is False:
-            docstring_start += 1
-        else:
-            found_start = True
-            break
+    if index is None:
+        docstring_start = line_number
+        while docstring_start < len(lines):
+            if bool(is_docstring_delimiter(lines[docstring_start])) is False:
+                docstring_start += 1
+            else:
+                found_start = True
+                break
+    else:
+        position = bisect.bisect_left(index.delimiters, line_number)
+        found_start = position < len(index.delimiters)
+        docstring_start = (
+            index.delimiters[position] if found_start else len(lines)
+        )
 
     # Identify the start of the Docstring
     if bool(found_start) is True:
         # Identify the end of the docstring
-        docstring_end = docstring_start + 1
-        while docstring_end < len(lines):
-            if bool(is_docstring_delimiter(lines[docstring_end])) is False:
-                docstring_end += 1
-            else:
-                found_end = True
-                break
+        if index is None:
+            docstring_end = docstring_start + 1
+            while docstring_end < len(lines):
+                if bool(is_docstring_delimiter(lines[docstring_end])) is False:
+                    docstring_end += 1
+                else:
+                    found_end = True
+                    break
+        else:
+            found_end = position + 1 < len(index.delimiters)
+            docstring_end = (
+                index.delimiters[position + 1] if found_end else len(lines)
+            )
 
         # Check to make sure there are defined arguments
         if bool(found_end) is False:
             violations.append(
                 Violation(
-                    line=line_number + 1,
-                    function=func_name,
-                    issue="""\
-Single line docstring without 'Args:' or 'Results:' sections defined.""",
-                    action="""Define the 'Args:' or 'Results:' sections.""",
+                    line=line_number + 1, function=func_name, code="DOC002"
                 )
             )
             fatal = True
@@ -349,85 +1152,284 @@ Single line docstring without 'Args:' or 'Results:' sections defined.""",
             # Convert the docstring lines to a string
             docstring = "\n".join(valid_lines)
 
-            # Parse the docstring
-            try:
-                parser = parse(docstring)
-
-            except Exception as e:
-                violations.append(
-                    Violation(
-                        line=docstring_start,
-                        function=func_name,
-                        issue="Docstring parsing error",
-                        action=f"""\
-Ensure the docstring is properly formatted: {e}""",
-                    )
-                )
-
-            # Evaluate Docstring description
-            docstring_evaluation = evaluate_docstring_description(
-                func_name, docstring_start, parser
-            )
-            if bool(docstring_evaluation):
-                violations.extend(docstring_evaluation)
-
-            # Evaluate the Args: section
-            argument_evaluation = evaluate_docstring_args(
-                func_name, docstring_start, docstring, parser
+            # Evaluate the docstring
+            evaluation = evaluate_docstring(
+                func_name, docstring_start, docstring
             )
-            if bool(argument_evaluation.violations):
-                violations.extend(argument_evaluation.violations)
-            else:
-                # Update docstring arguments as they are valid
-                arguments = argument_evaluation.arguments
-
-                # Evaluate the Returns: section
-                bad_returns = evaluate_docstring_returns(
-                    func_name, docstring_start, docstring, parser
-                )
-                if bool(bad_returns):
-                    violations.extend(bad_returns)
+            if bool(evaluation.violations):
+                violations.extend(evaluation.violations)
+            parser = evaluation.parser
+            arguments = evaluation.arguments
+            fatal = fatal or evaluation.fatal
 
         else:
             violations.append(
                 Violation(
-                    line=docstring_start,
-                    function=func_name,
-                    issue="Unclosed docstring",
-                    action="""\
-Ensure the docstring is properly closed with triple quotes.""",
+                    line=docstring_start, function=func_name, code="DOC003"
                 )
             )
 
     else:
+        violations.append(
+            Violation(line=docstring_start, function=func_name, code="DOC001")
+        )
+        fatal = True
+
+    # Return result
+    result = Docstring(
+        docstring=docstring,
+        violations=violations if bool(violations) else None,
+        parser=parser,
+        arguments=arguments,
+        fatal=fatal,
+    )
+    return result
+
+
+def evaluate_docstring(func_name, docstring_start, docstring):
+    """Parse a docstring and evaluate its sections.
+
+    Args:
+        func_name: Name of the function for the docstring
+        docstring_start: Line in file on which the docstring starts
+        docstring: Text of the docstring including its delimiters
+
+    Returns:
+        result: Docstring object
+
+    """
+    # Initialize key variables
+    violations = []
+    parser = None
+    arguments = []
+
+    # Parse the docstring
+    try:
+        with span("docstring_parser.parse"):
+            parser = parse_docstring(docstring)
+
+    except Exception as e:
         violations.append(
             Violation(
                 line=docstring_start,
                 function=func_name,
-                issue="Missing docstring",
-                action="""\
-Add a Google-style docstring to describe this function.""",
+                code="DOC004",
+                params=(str(e),),
             )
         )
 
-    # Return result
+    # The sections cannot be evaluated without a parsed docstring
+    if parser is not None:
+        with span("docstring_sections"):
+            sections = docstring_sections(docstring, parser)
+
+        # Evaluate Docstring description
+        with span("evaluate_docstring_description"):
+            docstring_evaluation = evaluate_docstring_description(
+                func_name, docstring_start, sections
+            )
+        if bool(docstring_evaluation):
+            violations.extend(docstring_evaluation)
+
+        # Evaluate the Args: section
+        with span("evaluate_docstring_args"):
+            argument_evaluation = evaluate_docstring_args(
+                func_name, docstring_start, sections
+            )
+        if bool(argument_evaluation.violations):
+            violations.extend(argument_evaluation.violations)
+        else:
+            # Update docstring arguments as they are valid
+            arguments = argument_evaluation.arguments
+
+            # Evaluate the Returns: section
+            with span("evaluate_docstring_returns"):
+                bad_returns = evaluate_docstring_returns(
+                    func_name, docstring_start, sections
+                )
+            if bool(bad_returns):
+                violations.extend(bad_returns)
+
+    # Return result. Arguments cannot be matched without a parser.
     result = Docstring(
         docstring=docstring,
         violations=violations if bool(violations) else None,
         parser=parser,
         arguments=arguments,
-        fatal=fatal,
+        fatal=parser is None,
     )
     return result
 
 
-def evaluate_docstring_description(func_name, docstring_start, parser):
+def parse_docstring(docstring):
+    """Parse a docstring, importing docstring_parser on first use.
+
+    docstring_parser takes longer to import than the rest of this script,
+    so runs that find no files, or only cached ones, never import it.
+    Results are shared through the parse cache when it is enabled.
+
+    Args:
+        docstring (str): Docstring text.
+
+    Returns:
+        docstring_parser.Docstring: The parsed docstring
+
+    """
+    if _PARSE_CACHE is not None:
+        return _PARSE_CACHE.parse(docstring)
+
+    from docstring_parser import parse
+
+    return parse(docstring)
+
+
+class ParseCache:
+    """Bounded LRU cache of parsed docstrings.
+
+    Docstrings are keyed by their inspect.cleandoc() text, which is what
+    docstring_parser parses, so copies of a docstring at any indentation
+    share an entry. Parsing errors are cached too and raised again.
+    """
+
+    def __init__(self, max_entries=PARSE_CACHE_MAX_ENTRIES):
+        """Create an empty cache.
+
+        Args:
+            max_entries (int): Maximum number of docstrings to remember.
+
+        Returns:
+            None
+
+        """
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def parse(self, docstring):
+        """Parse a docstring, reusing the result for identical text.
+
+        Args:
+            docstring (str): Docstring text.
+
+        Returns:
+            docstring_parser.Docstring: The parsed docstring
+
+        """
+        # docstring_parser imports inspect, so this costs nothing extra
+        from docstring_parser import parse
+        from inspect import cleandoc
+
+        # Reuse earlier results
+        key = cleandoc(docstring)
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            parsed, error = self.entries[key]
+        else:
+            self.misses += 1
+            parsed = error = None
+            try:
+                parsed = parse(key)
+            except Exception as e:
+                error = e
+            self.entries[key] = (parsed, error)
+            if len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+        # Return
+        if error is not None:
+            raise error.with_traceback(None)
+        return parsed
+
+
+# Cache of parsed docstrings shared by every file of a run. None disables.
+_PARSE_CACHE = ParseCache()
+
+
+def configure_parse_cache(max_entries):
+    """Replace the parse cache with an empty one of a given size.
+
+    Args:
+        max_entries (int): Maximum number of docstrings to remember. 0
+            disables the cache.
+
+    Returns:
+        ParseCache: The new cache, or None when disabled
+
+    """
+    global _PARSE_CACHE
+    _PARSE_CACHE = ParseCache(max_entries) if max_entries > 0 else None
+    return _PARSE_CACHE
+
+
+def docstring_sections(docstring, parser):
+    """Find the sections of a docstring in a single pass over its words.
+
+    The checks only depend on the sequence of whitespace separated words,
+    so the docstring is split once instead of being normalised and
+    searched again for each section.
+
+    Args:
+        docstring: Text of the docstring including its delimiters
+        parser: Parsed docstring from docstring_parser
+
+    Returns:
+        sections: DocstringSections object
+
+    """
+    # Initialize key variables
+    words = docstring.split()
+    count = len(words)
+    has_args = args_none = has_returns = returns_none = False
+    returns_name = None
+
+    for position, word in enumerate(words):
+        if "Args:" in word:
+            has_args = True
+        if "Returns:" in word:
+            has_returns = True
+
+        # The section markers must be followed by two more words
+        if position + 2 >= count:
+            continue
+        following = words[position + 1]
+
+        # 'Args: None' or 'Returns: None' declare empty sections
+        if following == "None":
+            if word.endswith("Args:"):
+                args_none = True
+            if word.endswith("Returns:"):
+                returns_none = True
+
+        # The last 'Returns: VARIABLE: description' in the docstring. The
+        # parser fails on it when the 'Args:' section is set to None.
+        if (
+            position >= 1
+            and word == "Returns:"
+            and len(following) > 1
+            and following.endswith(":")
+        ):
+            returns_name = RETURNS_NAME.match(words[position + 2]).group()
+
+    # Return
+    return DocstringSections(
+        parser=parser,
+        has_args=has_args,
+        args_none=args_none,
+        has_returns=has_returns,
+        returns_none=returns_none,
+        returns_name=returns_name,
+    )
+
+
+def evaluate_docstring_description(func_name, docstring_start, sections):
     """Evaluate the Docstring description for validity.
 
     Args:
         func_name: Function name
         docstring_start: Line in file on which the docstring starts
-        parser: Docstring parser
+        sections: DocstringSections object
 
     Returns:
         violations: List of Violations objects
@@ -435,6 +1437,7 @@ def evaluate_docstring_description(func_name, docstring_start, parser):
     """
     # Initialize key variables
     violations = []
+    parser = sections.parser
 
     # Ensure there is an Docstring description
     short_description = (
@@ -442,39 +1445,24 @@ def evaluate_docstring_description(func_name, docstring_start, parser):
     )
     if bool(short_description) is False:
         violations.append(
-            Violation(
-                line=docstring_start,
-                function=func_name,
-                issue="Docstring doesn't have a valid description",
-                action="""\
-Add a docstring description to the first line.""",
-            )
+            Violation(line=docstring_start, function=func_name, code="DOC101")
         )
 
     if bool(parser.blank_after_short_description) is False:
         violations.append(
-            Violation(
-                line=docstring_start,
-                function=func_name,
-                issue="\
-The Docstring's short description on the first line doesn't \
-have a blank line after it.",
-                action="""\
-Add the trailing blank line.""",
-            )
+            Violation(line=docstring_start, function=func_name, code="DOC102")
         )
 
     return violations
 
 
-def evaluate_docstring_args(func_name, docstring_start, docstring, parser):
+def evaluate_docstring_args(func_name, docstring_start, sections):
     """Evaluate the Docstring arguments for validity.
 
     Args:
         func_name: Function name
         docstring_start: Line in file on which the docstring starts
-        docstring: Docstring
-        parser: Docstring parser
+        sections: DocstringSections object
 
     Returns:
         result: DocstringEvaluation object
@@ -486,20 +1474,16 @@ def evaluate_docstring_args(func_name, docstring_start, docstring, parser):
     )
     violations = []
     arguments = []
-    docstring_no_multiple_white_space = " ".join(docstring.split())
+    parser = sections.parser
 
-    if "Args: None " in docstring_no_multiple_white_space:
+    if bool(sections.args_none):
         return DocstringEvaluation(violations=violations, arguments=arguments)
     else:
         # Check for Args section
-        if "Args:" not in docstring:
+        if bool(sections.has_args) is False:
             violations.append(
                 Violation(
-                    line=docstring_start,
-                    function=func_name,
-                    issue="Missing 'Args' section",
-                    action="""\
-Add an 'Args:' section listing the arguments this function accepts.""",
+                    line=docstring_start, function=func_name, code="DOC201"
                 )
             )
         else:
@@ -507,11 +1491,7 @@ Add an 'Args:' section listing the arguments this function accepts.""",
             if bool(parser.params) is False:
                 violations.append(
                     Violation(
-                        line=docstring_start,
-                        function=func_name,
-                        issue="Docstring doesn't have a valid 'Args:' section",
-                        action="""\
-Add an 'Args:' section with values to the function's docstring""",
+                        line=docstring_start, function=func_name, code="DOC202"
                     )
                 )
             else:
@@ -522,11 +1502,7 @@ Add an 'Args:' section with values to the function's docstring""",
                             Violation(
                                 line=docstring_start,
                                 function=func_name,
-                                issue="""\
-Docstring has no 'Args:' section variable name and description.""",
-                                action="""\
-Add an 'Args:' section with a variable name and description to \
-the function's docstring""",
+                                code="DOC203",
                             )
                         )
                     if bool(argument.description) is False:
@@ -534,10 +1510,8 @@ the function's docstring""",
                             Violation(
                                 line=docstring_start,
                                 function=func_name,
-                                issue=f"""\
-Docstring 'Args:' section variable '{argument.arg_name}' \
-needs a description.""",
-                                action="Add description to the variable.",
+                                code="DOC204",
+                                params=(argument.arg_name,),
                             )
                         )
 
@@ -550,14 +1524,13 @@ needs a description.""",
     return result
 
 
-def evaluate_docstring_returns(func_name, docstring_start, docstring, parser):
+def evaluate_docstring_returns(func_name, docstring_start, sections):
     """Determine whether string is docstring start or stop.
 
     Args:
         func_name: Function name
         docstring_start: Line in file on which the docstring starts
-        docstring: Docstring
-        parser: Docstring parser
+        sections: DocstringSections object
 
     Returns:
         violations: list of violations
@@ -565,48 +1538,32 @@ def evaluate_docstring_returns(func_name, docstring_start, docstring, parser):
     """
     # Initialize key variables
     violations = []
-    docstring_no_multiple_white_space = " ".join(docstring.split())
+    parser = sections.parser
 
     # Check for Returns section
-    if "Returns:" not in docstring:
+    if bool(sections.has_returns) is False:
         violations.append(
-            Violation(
-                line=docstring_start,
-                function=func_name,
-                issue="Missing 'Returns:' section",
-                action="""\
-Add a 'Returns:' section describing the return value.""",
-            )
+            Violation(line=docstring_start, function=func_name, code="DOC301")
         )
-    elif "Returns: None " not in docstring_no_multiple_white_space:
+    elif bool(sections.returns_none) is False:
 
         # The parser fails if the 'Args:' section is set to None AND there
         # is a valid 'Returns:' section
-        # This is a workaround where we search for 'Returns: VARIABLE: '
-        regex = r"^.*\s+Returns: (\S+): ([a-zA-Z0-9_]*).*$"
-        regex_match = re.match(regex, docstring_no_multiple_white_space)
+        # This is a workaround using the 'Returns: VARIABLE: ' section
         if bool(parser.params) is False:
-            if bool(regex_match) is False:
+            if sections.returns_name is None:
                 violations.append(
                     Violation(
-                        line=docstring_start,
-                        function=func_name,
-                        issue="""\
-Docstring has improperly formatted 'Returns:' section""",
-                        action="""\
-Add a correctly formatted 'Returns:' section to the function's docstring""",
+                        line=docstring_start, function=func_name, code="DOC302"
                     )
                 )
             else:
-                if bool(regex_match.group(2)) is False:
+                if bool(sections.returns_name) is False:
                     violations.append(
                         Violation(
                             line=docstring_start,
                             function=func_name,
-                            issue="""\
-Docstring 'Returns:' section with no description""",
-                            action="""\
-Add a description to the 'Returns:' section to the function's docstring""",
+                            code="DOC303",
                         )
                     )
             return violations
@@ -615,11 +1572,7 @@ Add a description to the 'Returns:' section to the function's docstring""",
         if bool(parser.returns) is False:
             violations.append(
                 Violation(
-                    line=docstring_start,
-                    function=func_name,
-                    issue="Docstring has no 'Returns:' section",
-                    action="""\
-Add a 'Returns:' section to the function's docstring""",
+                    line=docstring_start, function=func_name, code="DOC304"
                 )
             )
             return violations
@@ -628,14 +1581,7 @@ Add a 'Returns:' section to the function's docstring""",
         if bool(parser.returns.type_name) is False:
             violations.append(
                 Violation(
-                    line=docstring_start,
-                    function=func_name,
-                    issue="""\
-Docstring has no 'Returns:' section variable name and description. \
-If the return value is 'None', then use 'None'""",
-                    action="""\
-Add a 'Returns:' section with a variable name and description to \
-the function's docstring""",
+                    line=docstring_start, function=func_name, code="DOC305"
                 )
             )
 
@@ -644,10 +1590,8 @@ the function's docstring""",
                 Violation(
                     line=docstring_start,
                     function=func_name,
-                    issue=f"""\
-Docstring 'Returns:' section variable \
-'{parser.returns.type_name}' needs a description.""",
-                    action="""Add description to the variable.""",
+                    code="DOC306",
+                    params=(parser.returns.type_name,),
                 )
             )
 
@@ -655,6 +1599,73 @@ Docstring 'Returns:' section variable \
     return violations
 
 
+def build_line_index(lines):
+    """Index the lines that bound signatures and docstrings in one pass.
+
+    Args:
+        lines: The file as a list of strings split by a new line separator
+
+    Returns:
+        result: LineIndex with the number of lines and the sorted line
+            numbers of docstring delimiters, of lines containing triple
+            quotes, and of every opening parenthesis (one entry each)
+
+    """
+    # Initialize key variables
+    delimiters = []
+    quotes = []
+    parentheses = []
+
+    # Process the lines
+    for line_number, line in enumerate(lines):
+        if is_docstring_delimiter(line):
+            delimiters.append(line_number)
+        if ("'''" in line) or ('"""' in line):
+            quotes.append(line_number)
+        parentheses.extend([line_number] * line.count("("))
+
+    # Return
+    result = LineIndex(
+        length=len(lines),
+        delimiters=delimiters,
+        quotes=quotes,
+        parentheses=parentheses,
+    )
+    return result
+
+
+def signature_end(start, index):
+    """Find the line after which a signature no longer affects its parsing.
+
+    extract_function_arguments only uses the text up to the second opening
+    parenthesis after the start of the function, and never reads past the
+    next line with triple quotes.
+
+    Args:
+        start: Line where the function starts
+        index: LineIndex of the file
+
+    Returns:
+        result: Exclusive end line for extract_function_arguments
+
+    """
+    # Next line containing triple quotes
+    position = bisect.bisect_left(index.quotes, start)
+    result = (
+        index.quotes[position]
+        if position < len(index.quotes)
+        else index.length
+    )
+
+    # Line holding the second parenthesis from the start
+    position = bisect.bisect_left(index.parentheses, start) + 1
+    if position < len(index.parentheses):
+        result = min(result, index.parentheses[position] + 1)
+
+    # Return
+    return result
+
+
 def is_docstring_delimiter(line):
     """Determine whether string is docstring start or stop.
 
@@ -672,46 +1683,1017 @@ def is_docstring_delimiter(line):
     return result
 
 
-def check_directory(directory, exclude_dirs=None):
-    """Check all Python files in a directory for docstring compliance.
+def checker_version(engine):
+    """Identify the checker so cached results expire when it changes.
 
-    Specified directories are excluded.
+    Args:
+        engine (str): Name of the engine in ENGINES the results came from.
+
+    Returns:
+        str: Digest of this script's source, the engine name and the
+            installed docstring_parser version.
+
+    """
+    # Hash the script itself, so any change invalidates the cache
+    with open(os.path.abspath(__file__), "rb") as fh_:
+        digest = hashlib.sha256(fh_.read())
+    digest.update(engine.encode())
+
+    # Parsing rules change with the docstring_parser release
+    parser_version = installed_version("docstring_parser")
+    digest.update(parser_version.encode())
+    return digest.hexdigest()[:16]
+
+
+def installed_version(distribution):
+    """Find the version of an installed distribution without importing it.
+
+    importlib.metadata takes longer to import than a cached run takes, so
+    the .dist-info directories on sys.path are looked up directly.
+
+    Args:
+        distribution (str): Normalized name of the distribution.
+
+    Returns:
+        str: Version of the first match on sys.path, or "unknown".
+
+    """
+    prefix = f"{distribution.lower()}-"
+    for directory in sys.path:
+        try:
+            names = os.listdir(directory or ".")
+        except OSError:
+            continue
+        for name in names:
+            lowered = name.lower()
+            if lowered.startswith(prefix) and lowered.endswith(".dist-info"):
+                return name[len(prefix) : -len(".dist-info")]
+    return "unknown"
+
+
+class ResultCache:
+    """On-disk cache of the violations found in each file.
+
+    Entries are keyed by absolute path and validated by content hash.
+    A matching modification time and size skips the hashing, so an
+    unchanged file costs one stat call. The least recently used entries
+    are dropped when the cache grows beyond max_entries.
+    """
+
+    def __init__(self, path, version, max_entries=CACHE_MAX_ENTRIES):
+        """Load the cache file.
+
+        Args:
+            path (str): Location of the JSON cache file.
+            version (str): Checker version the results must belong to.
+            max_entries (int): Maximum number of files to remember.
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self.path = path
+        self.version = version
+        self.max_entries = max_entries
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self._pending = {}
+
+        # Discard caches of other versions, or ones that cannot be read
+        try:
+            with open(path, "r", encoding="utf-8") as fh_:
+                data = json.load(fh_)
+            if data.get("version") == version:
+                self.entries = data.get("entries", {})
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def get(self, file_path):
+        """Return the cached violations of an unchanged file.
+
+        Args:
+            file_path (str): Path of the Python file.
+
+        Returns:
+            list: Cached violations, or None if the file must be validated
+
+        """
+        # Initialize key variables
+        key = os.path.abspath(file_path)
+        entry = self.entries.get(key)
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            self.misses += 1
+            return None
+
+        # Quick check on the modification time and size
+        if (
+            entry is None
+            or entry["mtime_ns"] != stat.st_mtime_ns
+            or entry["size"] != stat.st_size
+        ):
+            digest = file_digest(file_path)
+            if entry is None or entry["sha256"] != digest:
+                self._pending[key] = (stat, digest)
+                self.misses += 1
+                return None
+            entry["mtime_ns"] = stat.st_mtime_ns
+            entry["size"] = stat.st_size
+
+        # Return
+        entry["used"] = time.time()
+        self.hits += 1
+        return [Violation(*_) for _ in entry["violations"]]
+
+    def functions(self, file_path):
+        """Return the function results of a file's previous version.
+
+        Args:
+            file_path (str): Path of the Python file.
+
+        Returns:
+            dict: Violations keyed by function fingerprint, as returned
+                by validate_functions_ast
+
+        """
+        entry = self.entries.get(os.path.abspath(file_path))
+        return {} if entry is None else entry.get("functions", {})
+
+    def put(self, file_path, violations, functions=None):
+        """Remember the violations of a file validated after a miss.
+
+        Args:
+            file_path (str): Path of the Python file.
+            violations (list): Violations found in the file.
+            functions (dict): Violations keyed by function fingerprint.
+
+        Returns:
+            None
+
+        """
+        # Only files looked up with get() have a known digest
+        key = os.path.abspath(file_path)
+        pending = self._pending.pop(key, None)
+        if pending is None:
+            return
+        stat, digest = pending
+        self.entries[key] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": digest,
+            "used": time.time(),
+            "violations": [list(_) for _ in violations],
+            "functions": functions if bool(functions) else {},
+        }
+
+    def save(self):
+        """Write the cache, keeping the most recently used entries.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Evict the least recently used entries
+        if len(self.entries) > self.max_entries:
+            keep = sorted(
+                self.entries,
+                key=lambda key: self.entries[key]["used"],
+                reverse=True,
+            )[: self.max_entries]
+            self.entries = {key: self.entries[key] for key in keep}
+
+        # Replace the file atomically so concurrent runs never see half
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        temporary = f"{self.path}.{os.getpid()}.tmp"
+        with open(temporary, "w", encoding="utf-8") as fh_:
+            json.dump({"version": self.version, "entries": self.entries}, fh_)
+        os.replace(temporary, self.path)
+
+
+def file_digest(file_path):
+    """Hash the content of a file.
+
+    Args:
+        file_path (str): Path of the file.
+
+    Returns:
+        str: Hex SHA-256 digest of the content, or None if unreadable
+
+    """
+    try:
+        with open(file_path, "rb") as fh_:
+            return hashlib.sha256(fh_.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def validate_files(file_paths, engine="line", jobs=1, cache=None):
+    """Validate the docstrings of several files.
+
+    With more than one job the files are validated in a process pool.
+    Results are always produced in the order of file_paths, so reports
+    stay deterministic whatever the number of jobs.
+
+    Args:
+        file_paths (iterable): Paths of the Python files to validate.
+            They are consumed lazily when there is a single job.
+        engine (str): Name of the engine in ENGINES to validate with.
+        jobs (int): Number of worker processes. 0 uses every CPU.
+        cache (ResultCache): Optional cache of earlier results. Unchanged
+            files are not validated again.
+
+    Returns:
+        generator: Yields a (file_path, violations) tuple per file.
+
+    """
+    # Validate files as they are discovered when there is no pool
+    jobs = resolve_jobs(jobs)
+    if jobs == 1:
+        for file_path in file_paths:
+            violations = cache.get(file_path) if cache is not None else None
+            if violations is None:
+                known = None if cache is None else cache.functions(file_path)
+                with span("file", file_path):
+                    violations, functions = validate_file(
+                        file_path, engine, known
+                    )
+                if cache is not None:
+                    cache.put(file_path, violations, functions)
+            yield file_path, violations
+        return
+
+    # Initialize key variables
+    file_paths = list(file_paths)
+    cached = {}
+    misses = []
+
+    # Only validate the files the cache cannot answer for
+    for file_path in file_paths:
+        violations = cache.get(file_path) if cache is not None else None
+        if violations is None:
+            misses.append(file_path)
+        else:
+            cached[file_path] = violations
+
+    # Merge cached and fresh results in the original order
+    knowns = [None if cache is None else cache.functions(_) for _ in misses]
+    results = _validate_uncached(misses, engine, jobs, knowns)
+    for file_path in file_paths:
+        if file_path in cached:
+            yield file_path, cached[file_path]
+            continue
+        _, (violations, functions) = next(results)
+        if cache is not None:
+            cache.put(file_path, violations, functions)
+        yield file_path, violations
+
+
+def stream_violations(file_paths, engine="line", jobs=1, cache=None):
+    """Validate files, producing the violations of each file lazily.
+
+    With a single job, no cache, no tracing and no memory report, the
+    functions of a file are only evaluated as its violations are
+    consumed, so a consumer that stops early skips the remaining work.
+    Otherwise whole files are validated by validate_files.
+
+    Args:
+        file_paths (iterable): Paths of the Python files to validate.
+        engine (str): Name of the engine in ENGINES to validate with.
+        jobs (int): Number of worker processes. 0 uses every CPU.
+        cache (ResultCache): Optional cache of earlier results.
+
+    Returns:
+        generator: Yields a (file_path, violations) tuple per file, where
+            violations is an iterable that must be consumed before the
+            next file is requested.
+
+    """
+    jobs = resolve_jobs(jobs)
+    if jobs == 1 and cache is None and _TRACER is None and _MEMORY is None:
+        iterate = ITER_ENGINES[engine]
+        for file_path in file_paths:
+            yield file_path, iterate(file_path)
+        return
+    yield from validate_files(
+        file_paths, engine=engine, jobs=jobs, cache=cache
+    )
+
+
+def validate_file(file_path, engine, known=None):
+    """Validate a file, reusing earlier function results if possible.
+
+    Args:
+        file_path (str): Path of the Python file to validate.
+        engine (str): Name of the engine in ENGINES to validate with.
+        known (dict): Violations of the file's previous version keyed by
+            function fingerprint. None disables function results.
+
+    Returns:
+        tuple: List of violations, and a dict of the violations of each
+            function keyed by fingerprint, or None if unavailable
+
+    """
+    if known is not None and engine == "ast":
+        return validate_functions_ast(file_path, known)
+    return ENGINES[engine](file_path), None
+
+
+def _validate_uncached(file_paths, engine, jobs, knowns):
+    """Run an engine over files, optionally in a process pool.
+
+    Args:
+        file_paths (list): Paths of the Python files to validate.
+        engine (str): Name of the engine in ENGINES to validate with.
+        jobs (int): Number of worker processes. 0 uses every CPU.
+        knowns (list): Earlier function results of each file, as passed
+            to validate_file.
+
+    Returns:
+        generator: Yields a (file_path, (violations, functions)) tuple
+            per file, in the order of file_paths.
+
+    """
+    # Initialize key variables
+    engines = [engine] * len(file_paths)
+    jobs = resolve_jobs(jobs)
+
+    # Validate in this process when a pool cannot help
+    if jobs == 1 or len(file_paths) < 2:
+        for file_path, known in zip(file_paths, knowns):
+            yield file_path, validate_file(file_path, engine, known)
+        return
+
+    # Each worker keeps a parse cache of the size used by this process
+    size = 0 if _PARSE_CACHE is None else _PARSE_CACHE.max_entries
+    results = map_in_pool(
+        validate_file,
+        jobs,
+        file_paths,
+        engines,
+        knowns,
+        initializer=configure_parse_cache,
+        initargs=(size,),
+    )
+    try:
+        yield from zip(file_paths, results)
+    finally:
+        # Stop the pool when the consumer stops early
+        results.close()
+
+
+def discover_files(
+    directory, exclude_dirs=None, use_git=False, extensions=PYTHON_EXTENSIONS
+):
+    """Find the Python files, or files of another kind, in a directory.
+
+    Excluded directories are pruned, so their content is never listed.
+    Files are produced lazily: the files of each directory in name order,
+    then its subdirectories in name order.
 
     Args:
         directory (str): Directory to scan.
-        exclude_dirs (list): List of directories to exclude.
+        exclude_dirs (list): Directory names, or paths joined to their
+            parent directory, to exclude.
+        use_git (bool): List files with git so .gitignore is honoured.
+            The file system is walked when git cannot be used.
+        extensions (tuple): File name endings to find.
 
     Returns:
-        dict: Dictionary of file violations.
+        generator: Yields the path of each matching file.
+
     """
     # Initialize key variables
-    all_violations = {}
-    _exclude_dirs = exclude_dirs if bool(exclude_dirs) else []
+    _exclude_dirs = set(exclude_dirs if bool(exclude_dirs) else [])
+
+    # Let git apply the ignore rules when possible
+    if bool(use_git):
+        file_paths = git_files(directory, extensions)
+        if file_paths is not None:
+            for file_path in file_paths:
+                parts = os.path.dirname(file_path).split(os.sep)
+                if not _exclude_dirs.intersection(parts) and os.path.isfile(
+                    file_path
+                ):
+                    yield file_path
+            return
 
     # Recursive directory search for files
     for root, dirs, files in os.walk(directory):
         # Skip excluded directories
-        dirs[:] = [
-            d for d in dirs if os.path.join(root, d) not in _exclude_dirs
-        ]
+        dirs[:] = sorted(
+            d
+            for d in dirs
+            if d not in _exclude_dirs
+            and os.path.join(root, d) not in _exclude_dirs
+        )
 
         # Process files in each directory
-        for file in files:
-            if file.endswith(".py"):
-                # Print start of processing
-                file_path = os.path.join(root, file)
+        for file in sorted(files):
+            if file.endswith(extensions):
+                yield os.path.join(root, file)
+
+
+def git_files(directory, extensions=PYTHON_EXTENSIONS):
+    """List the tracked and untracked, not ignored, files of a kind.
+
+    Args:
+        directory (str): Directory inside a git work tree.
+        extensions (tuple): File name endings to list.
+
+    Returns:
+        list: Sorted file paths, or None if git cannot list them
+
+    """
+    # Ask git, relative to the directory
+    output = run_git(
+        [
+            "ls-files",
+            "--cached",
+            "--others",
+            "--exclude-standard",
+            "-z",
+            "--",
+        ]
+        + [f"*{_}" for _ in extensions],
+        cwd=directory,
+    )
+    if output is None:
+        return None
+
+    # Return
+    names = sorted(set(output.split("\0")) - {""})
+    return [os.path.join(directory, os.path.normpath(_)) for _ in names]
+
+
+def run_git(arguments, cwd=None):
+    """Run a git command.
+
+    Args:
+        arguments (list): Arguments following 'git'.
+        cwd (str): Directory to run git in. Defaults to the current one.
+
+    Returns:
+        str: Standard output, or None if git failed or is unavailable
+
+    """
+    # Only runs that use git pay for importing subprocess
+    import subprocess
+
+    try:
+        result = subprocess.run(
+            ["git", *arguments], cwd=cwd, capture_output=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.decode("utf-8", errors="replace")
+
+
+def changed_files(ref):
+    """List the Python files changed since a git reference.
+
+    Modified and added files of the work tree are listed, as well as
+    untracked files that are not ignored. Deleted files are left out.
+
+    Args:
+        ref (str): Commit, branch or tag to compare the work tree with.
+
+    Returns:
+        list: Sorted paths relative to the current directory, or None if
+            git cannot compare with the reference
+
+    """
+    # Git reports paths relative to the top of the work tree
+    top = run_git(["rev-parse", "--show-toplevel"])
+    changed = run_git(
+        ["diff", "--name-only", "--diff-filter=d", "-z", ref, "--", "*.py"]
+    )
+    untracked = run_git(
+        [
+            "ls-files",
+            "--others",
+            "--exclude-standard",
+            "--full-name",
+            "-z",
+            "--",
+            "*.py",
+        ]
+    )
+    if top is None or changed is None or untracked is None:
+        return None
+
+    # Return
+    names = set(changed.split("\0")) | set(untracked.split("\0"))
+    return sorted(
+        os.path.relpath(os.path.join(top.strip(), _)) for _ in names if bool(_)
+    )
+
+
+def changed_lines(ref, file_paths):
+    """Find the line ranges of files changed since a git reference.
+
+    Args:
+        ref (str): Commit, branch or tag to compare the work tree with.
+        file_paths (list): Paths of the files of interest.
+
+    Returns:
+        dict: Lists of inclusive (first, last) line ranges keyed by real
+            file path. Untracked files map to None as they are entirely
+            new. Files git has no changes for are left out.
+
+    """
+    # Initialize key variables
+    ranges = {}
+    current = None
+    hunk = re.compile(r"^@@ -\S+ \+(\d+)(?:,(\d+))? @@")
+
+    # Zero lines of context reduce each hunk to the changed lines
+    paths = [os.path.abspath(_) for _ in file_paths]
+    top = run_git(["rev-parse", "--show-toplevel"])
+    output = run_git(
+        ["diff", "-U0", "--no-color", "--no-ext-diff", "--no-prefix", ref]
+        + ["--"]
+        + paths
+    )
+    untracked = run_git(
+        ["ls-files", "--others", "--exclude-standard", "--full-name", "-z"]
+        + ["--"]
+        + paths
+    )
+    if top is None or output is None or untracked is None:
+        return {os.path.realpath(_): None for _ in paths}
+
+    for name in untracked.split("\0"):
+        if bool(name):
+            ranges[os.path.realpath(os.path.join(top.strip(), name))] = None
+
+    for line in output.splitlines():
+        if line.startswith("+++ "):
+            name = line[4:].rstrip("\t")
+            current = (
+                None
+                if name == "/dev/null"
+                else os.path.realpath(os.path.join(top.strip(), name))
+            )
+            continue
+        match = hunk.match(line)
+        if match is not None and current is not None:
+            # Deletions have no new lines but still touch their function
+            first = int(match.group(1))
+            count = 1 if match.group(2) is None else int(match.group(2))
+            ranges.setdefault(current, []).append(
+                (first, first + max(count, 1) - 1)
+            )
+
+    # Return
+    return ranges
+
+
+def function_spans(file_path):
+    """Find the lines covered by each function of a file.
+
+    Args:
+        file_path (str): Path of the Python file.
+
+    Returns:
+        list: (name, first, last) tuples, where first includes the
+            decorators. None if the file cannot be parsed.
+
+    """
+    # Only --since runs pay for importing ast
+    import ast
+
+    try:
+        with open(file_path, "r", encoding="utf-8") as fh_:
+            tree = ast.parse(fh_.read(), filename=file_path)
+    except (OSError, SyntaxError, ValueError):
+        return None
+
+    # Return
+    return [
+        (
+            node.name,
+            min([node.lineno] + [_.lineno for _ in node.decorator_list]),
+            node.end_lineno,
+        )
+        for node in ast.walk(tree)
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+    ]
+
+
+def changed_violations(file_path, violations, ranges):
+    """Keep the violations of functions that overlap changed lines.
 
-                # Identify violations in the file
-                violations = validate_docstring(file_path)
+    Violations that cannot be attributed to a function are kept.
 
-                # Add any found violations
-                if violations:
-                    all_violations[file_path] = violations
+    Args:
+        file_path (str): Path of the validated file.
+        violations (list): Violations found in the file.
+        ranges (list): Inclusive (first, last) changed line ranges. None
+            treats the whole file as changed.
+
+    Returns:
+        list: The violations of changed functions
+
+    """
+    # Initialize key variables
+    spans = function_spans(file_path) if bool(violations) else None
+    if ranges is None or spans is None:
+        return violations
+    result = []
+
+    for violation in violations:
+        owners = [
+            (first, last)
+            for name, first, last in spans
+            if name == violation.function and first <= violation.line <= last
+        ]
+        if not owners or any(
+            first <= changed_last and changed_first <= last
+            for first, last in owners
+            for changed_first, changed_last in ranges
+        ):
+            result.append(violation)
+
+    # Return
+    return result
+
+
+def within_directories(file_paths, directories):
+    """Keep the files located in any of several directories.
+
+    Args:
+        file_paths (list): File paths to filter.
+        directories (list): Directories the files must be in.
+
+    Returns:
+        list: The file paths inside the directories
+
+    """
+    # Compare real paths so relative and linked directories match
+    roots = [os.path.join(os.path.realpath(_), "") for _ in directories]
+    return [
+        file_path
+        for file_path in file_paths
+        if any(os.path.realpath(file_path).startswith(root) for root in roots)
+    ]
+
+
+def discover_directories(
+    directories, exclude_dirs=None, use_git=False, extensions=PYTHON_EXTENSIONS
+):
+    """Find the Python files of several directories, each once.
+
+    Overlapping directories and symbolic links can reach the same file
+    through several paths. Only the first path to each real file is
+    produced.
+
+    Args:
+        directories (list): Directories to scan.
+        exclude_dirs (list): Directory names or paths to exclude.
+        use_git (bool): List files with git so .gitignore is honoured.
+        extensions (tuple): File name endings to find.
+
+    Returns:
+        generator: Yields the path of each distinct matching file.
+
+    """
+    # Initialize key variables
+    seen = set()
+
+    for directory in directories:
+        for file_path in discover_files(
+            directory,
+            exclude_dirs=exclude_dirs,
+            use_git=use_git,
+            extensions=extensions,
+        ):
+            real_path = os.path.realpath(file_path)
+            if real_path not in seen:
+                seen.add(real_path)
+                yield file_path
+
+
+def check_directories(
+    directories,
+    engine="line",
+    jobs=1,
+    cache=None,
+    exclude_dirs=None,
+    use_git=False,
+):
+    """Check the Python files of several directories in a single run.
+
+    Args:
+        directories (list): Directories to scan.
+        engine (str): Name of the engine in ENGINES to validate with.
+        jobs (int): Number of worker processes. 0 uses every CPU.
+        cache (ResultCache): Optional cache of earlier results.
+        exclude_dirs (list): Directory names or paths to skip.
+        use_git (bool): List files with git so .gitignore is honoured.
+
+    Returns:
+        dict: Dictionary of file violations.
+
+    """
+    # Initialize key variables
+    all_violations = {}
+    file_paths = discover_directories(
+        directories, exclude_dirs=exclude_dirs, use_git=use_git
+    )
+
+    # Identify violations in the files
+    for file_path, violations in validate_files(
+        file_paths, engine=engine, jobs=jobs, cache=cache
+    ):
+        # Add any found violations
+        if violations:
+            all_violations[file_path] = violations
 
     # Return
     return all_violations
 
 
+def check_directory(
+    directory,
+    exclude_dirs=None,
+    engine="line",
+    jobs=1,
+    cache=None,
+    use_git=False,
+):
+    """Check all Python files in a directory for docstring compliance.
+
+    Specified directories are excluded.
+
+    Args:
+        directory (str): Directory to scan.
+        exclude_dirs (list): List of directories to exclude.
+        engine (str): Name of the engine in ENGINES to validate with.
+        jobs (int): Number of worker processes. 0 uses every CPU.
+        cache (ResultCache): Optional cache of earlier results.
+        use_git (bool): List files with git so .gitignore is honoured.
+
+    Returns:
+        dict: Dictionary of file violations.
+    """
+    return check_directories(
+        [directory],
+        engine=engine,
+        jobs=jobs,
+        cache=cache,
+        exclude_dirs=exclude_dirs,
+        use_git=use_git,
+    )
+
+
+class Reporter(ABC):
+    """Write violations to a stream as files are validated."""
+
+    def __init__(self, stream):
+        """Start the report.
+
+        Args:
+            stream (file): Text stream the report is written to.
+
+        Returns:
+            None
+
+        """
+        self.stream = stream
+        self.total = 0
+
+    def report(self, file_path, violations):
+        """Write the violations of a file.
+
+        Args:
+            file_path (str): Path of the validated file.
+            violations (list): Violations found in the file.
+
+        Returns:
+            None
+
+        """
+        for violation in violations:
+            self.total += 1
+            self.write(file_path, violation)
+
+    @abstractmethod
+    def write(self, file_path, violation):
+        """Write a single violation.
+
+        Args:
+            file_path (str): Path of the file with the violation.
+            violation (Violation): Violation to write.
+
+        Returns:
+            None
+
+        """
+
+    def finish(self):
+        """Complete the report.
+
+        Args:
+            None
+
+        Returns:
+            int: Total number of violations reported
+
+        """
+        return self.total
+
+
+class TextReporter(Reporter):
+    """Readable report of each violation and the total."""
+
+    def write(self, file_path, violation):
+        """Write a single violation.
+
+        Args:
+            file_path (str): Path of the file with the violation.
+            violation (Violation): Violation to write.
+
+        Returns:
+            None
+
+        """
+        if self.total == 1:
+            print("", file=self.stream)
+        print(
+            f"""\
+File Docstring Error: {file_path}
+Line : {violation.line}
+Function: {violation.function}
+Issue: [{violation.code}] {violation.issue}
+Corrective Action: {violation.action}
+""",
+            file=self.stream,
+        )
+
+    def finish(self):
+        """Complete the report with the total.
+
+        Args:
+            None
+
+        Returns:
+            int: Total number of violations reported
+
+        """
+        if bool(self.total):
+            print(
+                f"""\
+Follow the online 'Google Python Style Guide' for our docstring expectations.
+There are {self.total} docstring violations
+""",
+                file=self.stream,
+            )
+        return self.total
+
+
+class JsonReporter(Reporter):
+    """JSON array with an object per violation."""
+
+    def __init__(self, stream):
+        """Start the report.
+
+        Args:
+            stream (file): Text stream the report is written to.
+
+        Returns:
+            None
+
+        """
+        super().__init__(stream)
+        self.stream.write("[")
+
+    def write(self, file_path, violation):
+        """Write a single violation.
+
+        Args:
+            file_path (str): Path of the file with the violation.
+            violation (Violation): Violation to write.
+
+        Returns:
+            None
+
+        """
+        separator = "\n" if self.total == 1 else ",\n"
+        item = {
+            "path": file_path,
+            "line": violation.line,
+            "function": violation.function,
+            "code": violation.code,
+            "issue": violation.issue,
+            "action": violation.action,
+        }
+        self.stream.write(separator + json.dumps(item))
+
+    def finish(self):
+        """Close the array.
+
+        Args:
+            None
+
+        Returns:
+            int: Total number of violations reported
+
+        """
+        self.stream.write("\n]\n" if bool(self.total) else "]\n")
+        return self.total
+
+
+class SarifReporter(Reporter):
+    """SARIF 2.1.0 log for code scanning and annotation tools."""
+
+    def __init__(self, stream):
+        """Start the report.
+
+        Args:
+            stream (file): Text stream the report is written to.
+
+        Returns:
+            None
+
+        """
+        super().__init__(stream)
+        self.stream.write(
+            '{"version": "2.1.0", "$schema": '
+            '"https://json.schemastore.org/sarif-2.1.0.json", '
+            '"runs": [{"results": ['
+        )
+
+    def write(self, file_path, violation):
+        """Write a single violation.
+
+        Args:
+            file_path (str): Path of the file with the violation.
+            violation (Violation): Violation to write.
+
+        Returns:
+            None
+
+        """
+        separator = "\n" if self.total == 1 else ",\n"
+        uri = os.path.relpath(file_path).replace(os.sep, "/")
+        result = {
+            "ruleId": violation.code,
+            "level": "error",
+            "message": {
+                "text": f"{violation.function}: {violation.issue} "
+                f"{violation.action}"
+            },
+            "locations": [
+                {
+                    "physicalLocation": {
+                        "artifactLocation": {"uri": uri},
+                        "region": {"startLine": max(1, violation.line)},
+                    }
+                }
+            ],
+        }
+        self.stream.write(separator + json.dumps(result))
+
+    def finish(self):
+        """Close the log with the description of the rules.
+
+        Args:
+            None
+
+        Returns:
+            int: Total number of violations reported
+
+        """
+        rules = [
+            {
+                "id": code,
+                "shortDescription": {"text": issue},
+                "help": {"text": action},
+            }
+            for code, (issue, action) in sorted(MESSAGES.items())
+        ]
+        tool = {"driver": {"name": "check_docstrings", "rules": rules}}
+        self.stream.write(f'], "tool": {json.dumps(tool)}}}]}}\n')
+        return self.total
+
+
+# Engines that validate the docstrings of a file
+ENGINES = {"ast": validate_docstring_ast, "line": validate_docstring}
+ITER_ENGINES = {"ast": iter_violations_ast, "line": iter_violations}
+REPORTERS = {
+    "json": JsonReporter,
+    "sarif": SarifReporter,
+    "text": TextReporter,
+}
+
+
 def main():
     """Start checking the docstrings.
 
@@ -738,32 +2720,235 @@ Google Docstring 'Args' and 'Returns' sections.""",
         type=str,
         help="Directories to scan for docsctring compliant python files.",
     )
+    parser.add_argument(
+        "--engine",
+        required=False,
+        default="line",
+        choices=sorted(ENGINES),
+        help="Engine used to locate functions and docstrings.",
+    )
+    parser.add_argument(
+        "--jobs",
+        required=False,
+        default=1,
+        type=int,
+        help="Number of processes validating files. 0 uses every CPU.",
+    )
+    parser.add_argument(
+        "--cache-file",
+        required=False,
+        default=None,
+        type=str,
+        help="JSON file caching results so unchanged files are skipped. "
+        "With --engine ast, unchanged functions of changed files are "
+        "reused too.",
+    )
+    parser.add_argument(
+        "--cache-size",
+        required=False,
+        default=CACHE_MAX_ENTRIES,
+        type=int,
+        help="Maximum number of files kept in the cache.",
+    )
+    parser.add_argument(
+        "--exclude",
+        action="append",
+        default=[],
+        help="Directory name or path to skip. May be repeated.",
+    )
+    parser.add_argument(
+        "--no-default-excludes",
+        action="store_true",
+        help="Also search directories such as node_modules and .venv.",
+    )
+    parser.add_argument(
+        "--use-git",
+        action="store_true",
+        help="List files with git ls-files so .gitignore is honoured.",
+    )
+    parser.add_argument(
+        "--format",
+        required=False,
+        default="text",
+        choices=sorted(REPORTERS),
+        help="Output format of the report.",
+    )
+    parser.add_argument(
+        "--files",
+        required=False,
+        default=None,
+        nargs="*",
+        type=str,
+        help="Python files to validate instead of the directories.",
+    )
+    parser.add_argument(
+        "--since",
+        required=False,
+        default=None,
+        type=str,
+        help="Only validate Python files changed since this git reference.",
+    )
+    parser.add_argument(
+        "--changed-functions",
+        action="store_true",
+        help="""\
+Only report functions whose lines changed since the --since reference, or
+HEAD without it.""",
+    )
+    parser.add_argument(
+        "--trace",
+        required=False,
+        default=None,
+        type=str,
+        help="""\
+Write a Chrome trace of the phases to this JSON file. Files are then
+validated in a single process.""",
+    )
+    parser.add_argument(
+        "--trace-top",
+        required=False,
+        default=10,
+        type=int,
+        help="Number of phases listed in the trace summary.",
+    )
+    parser.add_argument(
+        "--memory-report",
+        action="store_true",
+        help="""\
+Print the peak memory of each phase and of the largest files. Files are
+then validated in a single process.""",
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop at the first violation.",
+    )
+    parser.add_argument(
+        "--max-violations",
+        required=False,
+        default=0,
+        type=int,
+        help="Stop after reporting this many violations. 0 reports all.",
+    )
+    parser.add_argument(
+        "--parse-cache-size",
+        required=False,
+        default=PARSE_CACHE_MAX_ENTRIES,
+        type=int,
+        help="Parsed docstrings kept in memory for reuse. 0 disables.",
+    )
     args = parser.parse_args()
+    if args.jobs < 0:
+        parser.error("--jobs must be 0 or more")
+    if args.max_violations < 0:
+        parser.error("--max-violations must be 0 or more")
+    if args.cache_size < 1:
+        parser.error("--cache-size must be 1 or more")
+    exclude_dirs = list(args.exclude)
+    if not args.no_default_excludes:
+        exclude_dirs.extend(DEFAULT_EXCLUDE_DIRS)
+    parse_cache = configure_parse_cache(args.parse_cache_size)
+    limit = 1 if args.fail_fast else args.max_violations
+
+    # Spans are only recorded in this process
+    tracer = None
+    if bool(args.trace):
+        tracer = Tracer()
+        set_tracer(tracer)
+        args.jobs = 1
+    memory = None
+    if args.memory_report:
+        try:
+            from memory_report import MemoryReport
+        except ImportError:
+            parser.error(
+                "--memory-report needs memory_report.py next to this script"
+            )
 
-    # Process the directories
-    for directory in args.directories:
-        violations = check_directory(directory, exclude_dirs=None)
+        memory = MemoryReport()
+        set_memory_report(memory)
+        memory.start()
+        args.jobs = 1
+
+    # Load results of earlier runs
+    cache = None
+    if bool(args.cache_file):
+        cache = ResultCache(
+            args.cache_file,
+            checker_version(args.engine),
+            max_entries=args.cache_size,
+        )
 
-        if violations:
-            total_violations = sum(
-                len(issues) for issues in violations.values()
-            )
-            print("")
-            for file, issues in sorted(violations.items()):
-                for issue in issues:
-                    print(f"""\
-File Docstring Error: {file}
-Line : {issue.line}
-Function: {issue.function}
-Issue: {issue.issue}
-Corrective Action: {issue.action}
-""")
-            print(f"""\
-Follow the online 'Google Python Style Guide' for our docstring expectations.
-There are {total_violations} docstring violations
-""")
+    # Select the files to validate in a stable order. Discovery sorts each
+    # directory as it walks, so it stays lazy and can stop early.
+    if args.files is not None:
+        file_paths = sorted(
+            _ for _ in args.files if _.endswith(".py") and os.path.isfile(_)
+        )
+    elif bool(args.since):
+        file_paths = changed_files(args.since)
+        if file_paths is None:
+            parser.error(f"cannot compare with git reference {args.since}")
+        file_paths = within_directories(file_paths, args.directories)
+    else:
+        file_paths = discover_directories(
+            args.directories, exclude_dirs=exclude_dirs, use_git=args.use_git
+        )
+
+    # Find the changed lines of the files, which git needs up front
+    ranges = None
+    if args.changed_functions:
+        file_paths = list(file_paths)
+        ranges = changed_lines(args.since or "HEAD", file_paths)
 
-            sys.exit(1)
+    # Report each violation as soon as it is found
+    reporter = REPORTERS[args.format](sys.stdout)
+    stream = stream_violations(
+        file_paths, engine=args.engine, jobs=args.jobs, cache=cache
+    )
+    try:
+        for file_path, violations in stream:
+            if ranges is not None:
+                violations = changed_violations(
+                    file_path,
+                    list(violations),
+                    ranges.get(os.path.realpath(file_path), []),
+                )
+            if bool(limit):
+                violations = itertools.islice(
+                    violations, limit - reporter.total
+                )
+            with span("report", file_path):
+                reporter.report(file_path, violations)
+
+            # Stop once the outcome of the run is known
+            if bool(limit) and reporter.total >= limit:
+                print(
+                    f"Stopped after {reporter.total} docstring violations.",
+                    file=sys.stderr,
+                )
+                break
+    finally:
+        stream.close()
+        if cache is not None:
+            cache.save()
+        if tracer is not None:
+            set_tracer(None)
+            if parse_cache is not None:
+                tracer.counter(
+                    "parse_cache",
+                    {"hits": parse_cache.hits, "misses": parse_cache.misses},
+                )
+            tracer.write(args.trace)
+            print(tracer.summary(args.trace_top), file=sys.stderr)
+        if memory is not None:
+            set_memory_report(None)
+            memory.stop()
+            print(memory.summary(), file=sys.stderr)
+
+    # Fail when any directory has violations
+    if bool(reporter.finish()):
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""Benchmark for check_docstrings.py.
+
+The benchmark generates a seeded corpus of synthetic Python modules in a
+temporary directory and times each phase of the docstring checker. The
+module shape is configurable: number of functions, signature length,
+share of documented functions and share of decorated functions. The same
+options and seed always produce byte-identical modules.
+
+Results are written as JSON, so runs of different checker versions can
+be compared offline:
+
+Usage:
+    python check_docstrings_benchmark.py --output before.json
+    python check_docstrings_benchmark.py --functions 500 --arguments 8
+"""
+
+import argparse
+import ast
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+
+import check_docstrings
+from synthetic_corpus import write_corpus
+
+# Docstring styles of documented functions, with their relative weights
+DOCSTRING_STYLES = {
+    "google": 6,
+    "missing_args": 1,
+    "missing_returns": 1,
+    "single_line": 1,
+    "wrong_argument": 1,
+}
+
+_BODY_LINES = [
+    "result = compute(value)",
+    "items = [item for item in values if item]",
+    "total = sum(items) + len(items)",
+    "mapping = {key: str(key) for key in range(10)}",
+    "# A regular comment about the next statement",
+]
+
+
+def _docstring(rng: random.Random, arguments: list[str]) -> list[str]:
+    """Generate the docstring lines of a function.
+
+    Args:
+        rng: Random generator.
+        arguments: Argument names of the function.
+
+    Returns:
+        lines: Docstring lines without indentation.
+    """
+    style = rng.choices(
+        list(DOCSTRING_STYLES), weights=list(DOCSTRING_STYLES.values())
+    )[0]
+    if style == "single_line":
+        return ['"""Do something."""']
+
+    documented = list(arguments)
+    if style == "wrong_argument" and documented:
+        documented[-1] = "unknown"
+
+    lines = ['"""Do something useful.', ""]
+    if style != "missing_args":
+        lines.append("Args:")
+        lines.extend(f"    {name}: Value of {name}" for name in documented)
+        if not documented:
+            lines.append("    None")
+        lines.append("")
+    if style != "missing_returns":
+        lines.extend(["Returns:", "    result: The result", ""])
+    lines.append('"""')
+    return lines
+
+
+def generate_module(
+    rng: random.Random,
+    functions: int,
+    arguments: int,
+    docstring_ratio: float,
+    decorator_ratio: float,
+) -> str:
+    """Generate the source of a synthetic module.
+
+    Args:
+        rng: Random generator.
+        functions: Number of functions in the module.
+        arguments: Number of arguments of each function.
+        docstring_ratio: Share of functions with a docstring.
+        decorator_ratio: Share of functions with a decorator.
+
+    Returns:
+        source: Python source code of the module.
+    """
+    lines = ['"""Synthetic module."""', ""]
+
+    for index in range(functions):
+        names = [f"value{_}" for _ in range(arguments)]
+        lines.extend(["", ""])
+        if rng.random() < decorator_ratio:
+            lines.append("@decorator")
+
+        # Long signatures are spread over several lines like black does
+        if arguments > 3:
+            lines.append(f"def function{index}(")
+            lines.extend(f"    {name}," for name in names)
+            lines.append("):")
+        else:
+            lines.append(f"def function{index}({', '.join(names)}):")
+
+        if rng.random() < docstring_ratio:
+            lines.extend(
+                f"    {_}" if _ else "" for _ in _docstring(rng, names)
+            )
+        for _ in range(rng.randint(1, 6)):
+            lines.append(f"    {rng.choice(_BODY_LINES)}")
+        lines.append("    return result")
+
+    return "\n".join(lines) + "\n"
+
+
+def build_corpus(
+    directory: str,
+    seed: int,
+    file_count: int,
+    functions: int = 50,
+    arguments: int = 3,
+    docstring_ratio: float = 0.8,
+    decorator_ratio: float = 0.1,
+) -> list[str]:
+    """Write a deterministic corpus of Python modules.
+
+    Args:
+        directory: Directory in which the corpus is created.
+        seed: Seed for the random generator.
+        file_count: Number of modules to generate.
+        functions: Number of functions in each module.
+        arguments: Number of arguments of each function.
+        docstring_ratio: Share of functions with a docstring.
+        decorator_ratio: Share of functions with a decorator.
+
+    Returns:
+        file_paths: Sorted list of generated file paths.
+    """
+
+    def generate(rng: random.Random, index: int) -> tuple:
+        """Generate one module.
+
+        Args:
+            rng: Random generator shared by the corpus.
+            index: Index of the file in the corpus.
+
+        Returns:
+            file: Relative path and content of the file.
+        """
+        source = generate_module(
+            rng, functions, arguments, docstring_ratio, decorator_ratio
+        )
+        return os.path.join(f"package{index % 4}", f"module{index}.py"), source
+
+    return write_corpus(directory, seed, file_count, generate)
+
+
+def _cold_parse_cache() -> None:
+    """Empty the docstring parse cache so the next run starts cold.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    check_docstrings.configure_parse_cache(
+        check_docstrings.PARSE_CACHE_MAX_ENTRIES
+    )
+
+
+def _best_time(function, repetitions: int, warm: bool = False) -> float:
+    """Time the fastest of several calls.
+
+    Every call starts with an empty parse cache unless warm is set, in
+    which case the cache is filled by one untimed call first and kept.
+
+    Args:
+        function: Callable without arguments.
+        repetitions: Number of calls.
+        warm: Whether to time calls against a filled parse cache.
+
+    Returns:
+        seconds: Duration of the fastest call.
+    """
+    best = None
+    _cold_parse_cache()
+    if warm:
+        function()
+    for _ in range(repetitions):
+        if not warm:
+            _cold_parse_cache()
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def _parse(file_path: str) -> ast.Module:
+    """Read and parse a module, the first step of the AST engine.
+
+    Args:
+        file_path: Path of the module.
+
+    Returns:
+        tree: Parsed module.
+    """
+    with open(file_path, encoding="utf-8") as f:
+        return ast.parse(f.read())
+
+
+def measure(directory: str, file_paths: list[str], repetitions: int) -> dict:
+    """Time each phase of the docstring checker over a corpus.
+
+    Each phase reports the fastest of several runs, in seconds, and the
+    number of functions checked per second. Reading and parsing is also
+    timed alone to separate it from the rest of the AST engine. Every run
+    starts with an empty parse cache; the phase suffixed "_warm" repeats
+    validate_docstring with the cache already filled, as in a long-lived
+    process.
+
+    Args:
+        directory: Directory holding the corpus.
+        file_paths: Modules of the corpus.
+        repetitions: Number of timed runs per phase.
+
+    Returns:
+        phases: Dictionary of phase names to their metrics.
+    """
+    functions = sum(
+        len(check_docstrings.function_spans(path)) for path in file_paths
+    )
+    phases = {
+        "discover": lambda: list(check_docstrings.discover_files(directory)),
+        "read_and_parse": lambda: [_parse(path) for path in file_paths],
+        "validate_docstring": lambda: [
+            check_docstrings.validate_docstring(path) for path in file_paths
+        ],
+        "validate_docstring_ast": lambda: [
+            check_docstrings.validate_docstring_ast(path)
+            for path in file_paths
+        ],
+        "check_directory": lambda: check_docstrings.check_directory(directory),
+    }
+    warm_phases = {"validate_docstring_warm": phases["validate_docstring"]}
+
+    result = {}
+    for name, function in {**phases, **warm_phases}.items():
+        seconds = _best_time(function, repetitions, name in warm_phases)
+        result[name] = {
+            "seconds": round(seconds, 6),
+            "functions_per_second": round(functions / seconds, 1),
+        }
+    return result
+
+
+def main() -> None:
+    """Run the benchmark and write the results as JSON.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark check_docstrings.py on synthetic modules"
+    )
+    parser.add_argument("--seed", type=int, default=2024)
+    parser.add_argument("--files", type=int, default=40)
+    parser.add_argument("--functions", type=int, default=50)
+    parser.add_argument("--arguments", type=int, default=3)
+    parser.add_argument("--docstring-ratio", type=float, default=0.8)
+    parser.add_argument("--decorator-ratio", type=float, default=0.1)
+    parser.add_argument("--repetitions", type=int, default=3)
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="JSON file to write the results to (default: stdout)",
+    )
+    args = parser.parse_args()
+
+    corpus = {
+        "seed": args.seed,
+        "files": args.files,
+        "functions": args.functions,
+        "arguments": args.arguments,
+        "docstring_ratio": args.docstring_ratio,
+        "decorator_ratio": args.decorator_ratio,
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        file_paths = build_corpus(
+            directory,
+            args.seed,
+            args.files,
+            functions=args.functions,
+            arguments=args.arguments,
+            docstring_ratio=args.docstring_ratio,
+            decorator_ratio=args.decorator_ratio,
+        )
+        phases = measure(directory, file_paths, args.repetitions)
+
+    results = {
+        "checker_version": check_docstrings.checker_version("ast"),
+        "python": platform.python_version(),
+        "corpus": corpus,
+        "phases": phases,
+    }
+    text = json.dumps(results, indent=2)
+    if args.output is None:
+        print(text)
+        return
+    with open(args.output, "w", encoding="utf-8") as f:
+        f.write(text + "\n")
+    print(f"Results written to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,516 @@
+#!/usr/bin/env python3
+"""Differential test harness for the check_docstrings.py engines.
+
+The reference is the line based engine scanning forward from every
+function, without the line index or the parse cache. Every other engine
+must report exactly the same violations on a seeded corpus of synthetic
+modules covering multi-line signatures, decorators, property getters and
+setters, class and static methods, 'Args: None' and 'Returns: None'
+sections and faulty docstrings of many kinds.
+
+Two corpora are generated. The full corpus also has missing, single line
+and unclosed docstrings and async functions. The AST engines deliberately
+differ from the line engine there: they evaluate async functions, report
+a missing docstring instead of attributing the next docstring to the
+function, and report a single line docstring once. On the full corpus
+their violations are compared with the reference adjusted for these
+fixes, in line order.
+
+Usage:
+    python check_docstrings_differential.py
+    python check_docstrings_differential.py --seed 7 --files 200
+"""
+
+import argparse
+import ast
+import os
+import random
+import sys
+import tempfile
+import time
+
+import check_docstrings
+from synthetic_corpus import write_corpus
+
+# Docstring kinds of each corpus, with their relative weights
+DOCSTRING_KINDS = {
+    "common": {
+        "google": 6,
+        "typed": 2,
+        "args_none": 2,
+        "returns_none": 2,
+        "missing_args": 1,
+        "missing_returns": 1,
+        "wrong_argument": 1,
+        "no_blank_line": 1,
+        "returns_unnamed": 1,
+        "no_description": 1,
+    },
+}
+DOCSTRING_KINDS["full"] = dict(
+    DOCSTRING_KINDS["common"], missing=2, single_line=2, unclosed=1
+)
+
+_ANNOTATIONS = ["", ": int", ": str", ": list"]
+_DEFAULTS = ["1", "None", '"x"']
+
+
+def _signature(name: str, arguments: list[str], indent: str) -> list[str]:
+    """Generate the lines of a def statement.
+
+    Args:
+        name: Name of the function.
+        arguments: Full text of each argument.
+        indent: Indentation of the def statement.
+
+    Returns:
+        lines: Lines of the signature.
+    """
+    if len(arguments) > 2:
+        return (
+            [f"{indent}def {name}("]
+            + [f"{indent}    {argument}," for argument in arguments]
+            + [f"{indent}):"]
+        )
+    return [f"{indent}def {name}({', '.join(arguments)}):"]
+
+
+def _docstring(kind: str, names: list[str], indent: str) -> list[str]:
+    """Generate the lines of a docstring.
+
+    Args:
+        kind: Kind of docstring from DOCSTRING_KINDS.
+        names: Names of the documented arguments.
+        indent: Indentation of the function body.
+
+    Returns:
+        lines: Lines of the docstring, empty for a missing docstring.
+    """
+    if kind == "missing":
+        return []
+    if kind == "single_line":
+        return [f'{indent}"""Do something."""']
+
+    lines = ['"""Do something useful.', ""]
+    if kind == "no_description":
+        lines = ['"""', ""]
+    elif kind == "no_blank_line":
+        lines = ['"""Do something useful.']
+
+    if kind == "wrong_argument":
+        names = names[:-1] + ["unknown"]
+    if kind != "missing_args":
+        lines.append("Args:")
+        if kind == "args_none" or not names:
+            lines.append("    None")
+        elif kind == "typed":
+            lines.extend(
+                f"    {name} (int): Value of {name}" for name in names
+            )
+        else:
+            lines.extend(f"    {name}: Value of {name}" for name in names)
+        lines.append("")
+
+    if kind == "returns_none":
+        lines.extend(["Returns:", "    None", ""])
+    elif kind == "returns_unnamed":
+        lines.extend(["Returns:", "    The result", ""])
+    elif kind != "missing_returns":
+        lines.extend(["Returns:", "    result: The result", ""])
+
+    if kind != "unclosed":
+        lines.append('"""')
+    return [f"{indent}{line}" if line else "" for line in lines]
+
+
+def _function(
+    rng: random.Random, corpus: str, name: str, indent: str, last: bool
+) -> list[str]:
+    """Generate a function with a random signature and docstring.
+
+    Args:
+        rng: Random generator.
+        corpus: Name of the corpus in DOCSTRING_KINDS.
+        name: Name of the function.
+        indent: Indentation of the def statement.
+        last: Whether nothing follows the function in the module.
+
+    Returns:
+        lines: Lines of the function.
+    """
+    kinds = dict(DOCSTRING_KINDS[corpus])
+    if not last:
+        kinds.pop("unclosed", None)
+    kind = rng.choices(list(kinds), weights=list(kinds.values()))[0]
+
+    names = [f"value{_}" for _ in range(rng.randint(0, 4))]
+    first_default = rng.randint(0, len(names))
+    arguments = []
+    for position, name_ in enumerate(names):
+        annotation = rng.choice(_ANNOTATIONS)
+        argument = name_ + annotation
+        # Only trailing arguments have defaults, spaced like black does
+        if position >= first_default:
+            equals = " = " if annotation else "="
+            argument += equals + rng.choice(_DEFAULTS)
+        arguments.append(argument)
+
+    lines = []
+    if indent and rng.random() < 0.2:
+        lines.append(f"{indent}@{rng.choice(['classmethod', 'staticmethod'])}")
+        arguments = (["cls"] if "classmethod" in lines[-1] else []) + arguments
+    elif indent:
+        arguments = ["self"] + arguments
+    elif rng.random() < 0.2:
+        lines.append("@decorator")
+
+    signature = _signature(name, arguments, indent)
+    if corpus == "full" and rng.random() < 0.1:
+        signature[0] = signature[0].replace("def ", "async def ", 1)
+    lines.extend(signature)
+    lines.extend(_docstring(kind, names, indent + "    "))
+    lines.append(f"{indent}    return None")
+    return lines
+
+
+def generate_module(rng: random.Random, functions: int, corpus: str) -> str:
+    """Generate a module of functions and classes.
+
+    Args:
+        rng: Random generator.
+        functions: Number of functions and methods in the module.
+        corpus: Name of the corpus in DOCSTRING_KINDS.
+
+    Returns:
+        source: Source code of the module.
+    """
+    lines = ['"""Synthetic module."""']
+    index = 0
+
+    while index < functions:
+        lines.extend(["", ""])
+
+        # Classes with methods and property getters and setters
+        if rng.random() < 0.3:
+            lines.extend([f"class Thing{index}:", '    """Thing."""'])
+            if rng.random() < 0.5:
+                lines.extend(
+                    [
+                        "",
+                        "    @property",
+                        "    def size(self):",
+                        "        return self._size",
+                        "",
+                        "    @size.setter",
+                        "    def size(self, value):",
+                        "        self._size = value",
+                    ]
+                )
+            for _ in range(rng.randint(1, 3)):
+                index += 1
+                lines.append("")
+                lines.extend(
+                    _function(
+                        rng,
+                        corpus,
+                        f"method{index}",
+                        "    ",
+                        index >= functions,
+                    )
+                )
+            continue
+
+        index += 1
+        lines.extend(
+            _function(rng, corpus, f"function{index}", "", index >= functions)
+        )
+
+    return "\n".join(lines) + "\n"
+
+
+def build_corpus(
+    directory: str, seed: int, file_count: int, functions: int, corpus: str
+) -> list[str]:
+    """Write a deterministic corpus of modules.
+
+    Args:
+        directory: Directory in which the corpus is created.
+        seed: Seed for the random generator.
+        file_count: Number of modules to generate.
+        functions: Number of functions and methods in each module.
+        corpus: Name of the corpus in DOCSTRING_KINDS.
+
+    Returns:
+        file_paths: Sorted list of generated file paths.
+    """
+
+    def generate(rng: random.Random, index: int) -> tuple:
+        """Generate one module.
+
+        Args:
+            rng: Random generator shared by the corpus.
+            index: Index of the file in the corpus.
+
+        Returns:
+            file: Relative path and content of the file.
+        """
+        source = generate_module(rng, functions, corpus)
+        return os.path.join(corpus, f"module{index}.py"), source
+
+    return write_corpus(directory, f"{seed}-{corpus}", file_count, generate)
+
+
+def _reference(file_path: str) -> list:
+    """Validate a file with the reference engine.
+
+    Args:
+        file_path: Path of the module.
+
+    Returns:
+        violations: Violations of the module.
+    """
+    return check_docstrings.validate_docstring(file_path, indexed=False)
+
+
+def _indexed(file_path: str) -> list:
+    """Validate a file with the line engine using the line index.
+
+    Args:
+        file_path: Path of the module.
+
+    Returns:
+        violations: Violations of the module.
+    """
+    return check_docstrings.validate_docstring(file_path, indexed=True)
+
+
+def _reused_functions(file_path: str) -> list:
+    """Validate a file reusing the function results of a first pass.
+
+    Both passes are timed, so the engine looks slower than it is.
+
+    Args:
+        file_path: Path of the module.
+
+    Returns:
+        violations: Violations of the module.
+    """
+    _, known = check_docstrings.validate_functions_ast(file_path, {})
+    violations, _ = check_docstrings.validate_functions_ast(
+        file_path, known or {}
+    )
+    return violations
+
+
+def _ast_expected(file_path: str, violations: list) -> list:
+    """Adjust the violations of the reference for the AST engines.
+
+    Args:
+        file_path: Path of the module.
+        violations: Violations of the module found by the reference.
+
+    Returns:
+        violations: Violations the AST engines must report, sorted.
+    """
+    with open(file_path, encoding="utf-8") as f:
+        source = f.read()
+
+    # Files that do not parse are validated by the line engine
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return sorted(violations)
+
+    # Let the reference see async functions, keeping line numbers
+    if "async def " in source:
+        with tempfile.TemporaryDirectory() as directory:
+            copy = os.path.join(directory, os.path.basename(file_path))
+            with open(copy, "w", encoding="utf-8", newline="\n") as f:
+                f.write(source.replace("async def ", "def "))
+            violations = _reference(copy)
+
+    # Replace the violations of functions with missing or single line
+    # docstrings by the single violation the AST engines report
+    lines = [_.rstrip() for _ in source.split("\n")]
+    fixed = {}
+    for node in ast.walk(tree):
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        decorator = check_docstrings.function_has_decorator(
+            node.lineno - 1, lines
+        )
+        if bool(decorator) and (
+            check_docstrings.decorator_in_docstring_exception_list(decorator)
+        ):
+            continue
+        docstring = ast.get_docstring(node, clean=False)
+        if docstring is None:
+            code = "DOC001"
+        elif "\n" not in docstring:
+            code = "DOC002"
+        else:
+            continue
+        fixed[node.name] = check_docstrings.Violation(
+            node.lineno, node.name, code
+        )
+
+    return sorted(
+        [_ for _ in violations if _.function not in fixed]
+        + list(fixed.values())
+    )
+
+
+# Engines compared with the reference on every corpus, and the function
+# adjusting the reference for their deliberate fixes, if any
+ENGINES = {
+    "line": (check_docstrings.validate_docstring, None),
+    "line-indexed": (_indexed, None),
+    "ast": (check_docstrings.validate_docstring_ast, _ast_expected),
+    "ast-reused-functions": (_reused_functions, _ast_expected),
+}
+
+
+def run_engine(validate, file_paths: list[str], parse_cache: int) -> tuple:
+    """Validate files with an engine and time it.
+
+    Args:
+        validate: Function returning the violations of a file.
+        file_paths: Modules to validate.
+        parse_cache: Size of the parse cache, 0 to disable it.
+
+    Returns:
+        result: Violations of each file and the duration in seconds.
+    """
+    check_docstrings.configure_parse_cache(parse_cache)
+    try:
+        start = time.perf_counter()
+        violations = [validate(path) for path in file_paths]
+        seconds = time.perf_counter() - start
+    finally:
+        check_docstrings.configure_parse_cache(
+            check_docstrings.PARSE_CACHE_MAX_ENTRIES
+        )
+    return violations, seconds
+
+
+def compare(
+    directory: str, seed: int, file_count: int, functions: int, engines=None
+) -> list[dict]:
+    """Compare engines with the reference on generated corpora.
+
+    Args:
+        directory: Directory in which the corpora are created.
+        seed: Seed for the random generator.
+        file_count: Number of modules in each corpus.
+        functions: Number of functions and methods in each module.
+        engines: Engines to compare, defaults to ENGINES.
+
+    Returns:
+        rows: One dictionary per engine and corpus with the durations and
+            the files whose violations differ from the reference.
+    """
+    engines = ENGINES if engines is None else engines
+    rows = []
+
+    for corpus in DOCSTRING_KINDS:
+        file_paths = build_corpus(
+            directory, seed, file_count, functions, corpus
+        )
+        expected, reference_seconds = run_engine(_reference, file_paths, 0)
+
+        for name, (validate, adjust) in engines.items():
+            actual, seconds = run_engine(
+                validate,
+                file_paths,
+                check_docstrings.PARSE_CACHE_MAX_ENTRIES,
+            )
+            wanted = expected
+            if adjust is not None:
+                wanted = [
+                    adjust(path, want)
+                    for path, want in zip(file_paths, expected)
+                ]
+                actual = [sorted(_) for _ in actual]
+            mismatches = [
+                (path, want, got)
+                for path, want, got in zip(file_paths, wanted, actual)
+                if want != got
+            ]
+            rows.append(
+                {
+                    "engine": name,
+                    "corpus": corpus,
+                    "violations": sum(len(_) for _ in expected),
+                    "reference_seconds": reference_seconds,
+                    "seconds": seconds,
+                    "mismatches": mismatches,
+                }
+            )
+
+    return rows
+
+
+def format_rows(rows: list[dict]) -> str:
+    """Render the comparison as a readable table.
+
+    Args:
+        rows: Output of compare.
+
+    Returns:
+        table: Multi-line table of the engines.
+    """
+    lines = [
+        f"{'engine':<22}{'corpus':<8}{'violations':>11}{'reference':>11}"
+        f"{'engine':>9}{'speedup':>9}  status"
+    ]
+    for row in rows:
+        status = (
+            f"{len(row['mismatches'])} files differ"
+            if row["mismatches"]
+            else "identical"
+        )
+        lines.append(
+            f"{row['engine']:<22}{row['corpus']:<8}{row['violations']:>11}"
+            f"{row['reference_seconds']:>10.3f}s{row['seconds']:>8.3f}s"
+            f"{row['reference_seconds'] / row['seconds']:>8.1f}x  {status}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """Compare every engine with the reference and report differences.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(
+        description="Check the check_docstrings.py engines report the same "
+        "violations as the reference engine"
+    )
+    parser.add_argument("--seed", type=int, default=2024)
+    parser.add_argument("--files", type=int, default=100)
+    parser.add_argument("--functions", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        rows = compare(directory, args.seed, args.files, args.functions)
+        print(format_rows(rows))
+
+        # Show the first difference of each engine
+        for row in rows:
+            if row["mismatches"]:
+                path, want, got = row["mismatches"][0]
+                print(f"\n{row['engine']} differs on {path}:")
+                with open(path, encoding="utf-8") as f:
+                    print(f.read())
+                print(f"reference: {want}\n{row['engine']}: {got}")
+
+    if any(row["mismatches"] for row in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
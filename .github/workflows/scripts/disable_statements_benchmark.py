@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""Performance regression gate for disable_statements_check.py.
+
+The benchmark generates a fixed, seeded corpus of JavaScript and
+TypeScript files in a temporary directory, checks it with
+DisableStatementsChecker and compares throughput and peak memory against
+a committed baseline. It needs no network access and the same seed always
+produces byte-identical files.
+
+Throughput depends on the machine, so the baseline is only meaningful on
+the machine that recorded it. Record one before making a change, then
+compare after it:
+
+Usage:
+    python disable_statements_benchmark.py --update-baseline
+    python disable_statements_benchmark.py
+    python disable_statements_benchmark.py --throughput-tolerance 0.25
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from disable_statements_check import DisableStatementsChecker
+from synthetic_corpus import write_corpus
+
+DEFAULT_BASELINE = os.path.normpath(
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        os.pardir,
+        "config",
+        "disable_statements_benchmark_baseline.json",
+    )
+)
+
+# Metrics where a larger value is better. All others must not grow.
+HIGHER_IS_BETTER = {"files_per_second", "megabytes_per_second"}
+
+_CLEAN_LINES = [
+    "const value = compute(input, options);",
+    "export function handler(request: Request): Response {",
+    "  return { status: 200, body: JSON.stringify(payload) };",
+    "}",
+    "import { describe, expect, it } from 'vitest';",
+    "// Regular comment explaining the next statement",
+    "/* A block comment that is not a directive */",
+    "const list = items.filter((item) => item.enabled).map(String);",
+    "",
+]
+
+_DIRECTIVE_LINES = [
+    "// biome-ignore lint/suspicious/noExplicitAny: legacy type",
+    "// @ts-ignore",
+    "/* istanbul ignore next */",
+    "// istanbul ignore next",
+    "// eslint-disable-next-line no-console",
+    "// check-sanitization-disable: output is escaped by the caller",
+    "// check-sanitization-disable",
+    "it.skip('pending case', () => {});",
+]
+
+
+def build_corpus(directory: str, seed: int, file_count: int) -> list[str]:
+    """Write a deterministic corpus of source files.
+
+    Args:
+        directory: Directory in which the corpus is created.
+        seed: Seed for the random generator.
+        file_count: Number of files to generate.
+
+    Returns:
+        file_paths: Sorted list of generated file paths.
+    """
+
+    def generate(rng: random.Random, index: int) -> tuple:
+        """Generate one source file.
+
+        Args:
+            rng: Random generator shared by the corpus.
+            index: Index of the file in the corpus.
+
+        Returns:
+            file: Relative path and content of the file.
+        """
+        # Spread files over a few nested directories
+        suffix = rng.choice([".ts", ".tsx", ".js", ".test.ts"])
+        file_path = os.path.join(
+            f"module{index % 8}", f"part{index % 3}", f"file{index}{suffix}"
+        )
+
+        lines = []
+        for _ in range(rng.randint(100, 1200)):
+            if rng.random() < 0.02:
+                lines.append(rng.choice(_DIRECTIVE_LINES))
+            else:
+                lines.append(rng.choice(_CLEAN_LINES))
+
+        # A few files carry very long lines to exercise the scanners
+        if rng.random() < 0.05:
+            lines.append("const blob = '" + "x" * rng.randint(500, 1500))
+
+        return file_path, "\n".join(lines) + "\n"
+
+    return write_corpus(directory, seed, file_count, generate)
+
+
+def measure(file_paths: list[str], repo: str, repetitions: int) -> dict:
+    """Measure throughput and peak memory for checking a corpus.
+
+    Throughput uses the fastest of several untraced runs, which is the
+    least noisy estimate on a single machine. Peak memory comes from one
+    extra run under tracemalloc so tracing does not skew the timings.
+
+    Args:
+        file_paths: Files to check.
+        repo: Repository type passed to the checker.
+        repetitions: Number of timed runs.
+
+    Returns:
+        metrics: Dictionary of metric names to values.
+    """
+    checker = DisableStatementsChecker()
+    total_bytes = sum(os.path.getsize(path) for path in file_paths)
+
+    best = None
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        checker.check_files(file_paths, repo=repo)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    tracemalloc.start()
+    try:
+        checker.check_files(file_paths, repo=repo)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "files_per_second": round(len(file_paths) / best, 1),
+        "megabytes_per_second": round(total_bytes / best / 1e6, 2),
+        "peak_memory_kib": round(peak / 1024, 1),
+    }
+
+
+def compare_metrics(baseline: dict, current: dict, tolerances: dict) -> list:
+    """Compare measured metrics against a baseline.
+
+    Args:
+        baseline: Baseline metric values.
+        current: Measured metric values.
+        tolerances: Allowed relative change per metric, e.g. 0.1 for 10%.
+
+    Returns:
+        rows: List of (metric, baseline, current, change, regressed)
+            tuples, where change is the relative difference.
+    """
+    rows = []
+    for metric in sorted(baseline):
+        if metric not in current:
+            continue
+        before = baseline[metric]
+        after = current[metric]
+        change = (after - before) / before if before else 0.0
+        allowed = tolerances.get(metric, 0.0)
+
+        if metric in HIGHER_IS_BETTER:
+            regressed = change < -allowed
+        else:
+            regressed = change > allowed
+        rows.append((metric, before, after, change, regressed))
+
+    return rows
+
+
+def format_comparison(rows: list, tolerances: dict) -> str:
+    """Render a comparison as a readable table.
+
+    Args:
+        rows: Output of compare_metrics.
+        tolerances: Allowed relative change per metric.
+
+    Returns:
+        table: Multi-line table of the metrics.
+    """
+    lines = [
+        f"{'metric':<22}{'baseline':>12}{'current':>12}"
+        f"{'change':>10}{'allowed':>10}  status"
+    ]
+    for metric, before, after, change, regressed in rows:
+        direction = "-" if metric in HIGHER_IS_BETTER else "+"
+        allowed = f"{direction}{tolerances.get(metric, 0.0):.0%}"
+        status = "REGRESSION" if regressed else "ok"
+        lines.append(
+            f"{metric:<22}{before:>12}{after:>12}"
+            f"{change:>+10.1%}{allowed:>10}  {status}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """Run the benchmark and compare it with the stored baseline.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark disable_statements_check.py against a "
+        "stored baseline"
+    )
+    parser.add_argument(
+        "--baseline",
+        default=DEFAULT_BASELINE,
+        help="Baseline JSON file to compare against or update",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Record the current measurements as the new baseline",
+    )
+    parser.add_argument("--seed", type=int, default=2024)
+    parser.add_argument("--files", type=int, default=300)
+    parser.add_argument("--repetitions", type=int, default=5)
+    parser.add_argument("--repo", choices=["api", "admin"], default="api")
+    parser.add_argument(
+        "--throughput-tolerance",
+        type=float,
+        default=0.15,
+        help="Allowed relative throughput drop (default: 0.15)",
+    )
+    parser.add_argument(
+        "--memory-tolerance",
+        type=float,
+        default=0.10,
+        help="Allowed relative peak memory growth (default: 0.10)",
+    )
+    args = parser.parse_args()
+
+    corpus = {"seed": args.seed, "files": args.files, "repo": args.repo}
+    tolerances = {
+        "files_per_second": args.throughput_tolerance,
+        "megabytes_per_second": args.throughput_tolerance,
+        "peak_memory_kib": args.memory_tolerance,
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        file_paths = build_corpus(directory, args.seed, args.files)
+        current = measure(file_paths, args.repo, args.repetitions)
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({"corpus": corpus, "metrics": current}, f, indent=2)
+            f.write("\n")
+        print(f"Baseline written to {args.baseline}")
+        print(json.dumps(current, indent=2))
+        return
+
+    try:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Cannot read baseline {args.baseline}: {e}")
+        print("Record one with --update-baseline.")
+        sys.exit(2)
+
+    if baseline.get("corpus") != corpus:
+        print(
+            f"Baseline corpus {baseline.get('corpus')} does not match "
+            f"{corpus}. Re-record it with --update-baseline."
+        )
+        sys.exit(2)
+
+    rows = compare_metrics(baseline["metrics"], current, tolerances)
+    print(format_comparison(rows, tolerances))
+
+    if any(regressed for *_, regressed in rows):
+        print("\nPerformance regression detected.")
+        sys.exit(1)
+    print("\nNo performance regression.")
+
+
+if __name__ == "__main__":
+    main()
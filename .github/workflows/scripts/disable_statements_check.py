@@ -12,14 +12,495 @@ This script checks for:
 Usage:
     python disable_statements_check.py --repo=api --files file1.js file2.ts
     python disable_statements_check.py --repo=admin --directory src/
+    python disable_statements_check.py --repo=api --directory src/ \
+        --file-timeout 5
+    python disable_statements_check.py --repo=api --directory src/ \
+        --verbose --skip-glob "*/fixtures/*"
+    python disable_statements_check.py --repo=api --directory src/ --jobs 0
+
+Async tooling can embed the checker without blocking its event loop:
+
+    checker = DisableStatementsChecker()
+    violations = await checker.check_files_async(paths, repo="api")
+    async for path, found in checker.iter_violations_async(paths):
+        ...
+
+Rules are selected per path. By default the repository type picks the
+rules and test files skip the istanbul check. Additional per-path policies
+are read from a [tool.disable_statements] table in pyproject.toml (or the
+file given with --config). Rules are named without their "check_" prefix,
+and later overrides take precedence over earlier ones:
+
+    [tool.disable_statements]
+    # Optional: replaces the --repo defaults
+    rules = ["biome_disable", "ts_ignore", "istanbul_ignore", "it_skip"]
+
+    [[tool.disable_statements.overrides]]
+    paths = ["scripts/**", "docs/**/*.js"]
+    disable = ["istanbul_ignore"]
+
+Globs containing a "/" are relative to the directory of the config file,
+"**" matches any number of directories, a trailing "/" names a whole
+directory, and globs without a "/" match the file name anywhere. Reading
+the table requires Python 3.11+ or tomli.
+
+Generated, minified and binary files are skipped before they are decoded.
+The classifier looks at the path, the file size and the first block of
+bytes only; use --scan-generated to check every file regardless.
+
+With --memory-report, the peak memory of reading, scanning and reporting
+and the files with the largest peaks are printed to stderr.
 """
 
 import argparse
+import asyncio
+import bisect
+import fnmatch
 import inspect
 import os
 import re
+import signal
 import sys
+import threading
+import time
+from concurrent.futures import Executor
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
 from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    Optional,
+)
+
+if TYPE_CHECKING:
+    from memory_report import MemoryReport
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+try:
+    import process_pool
+except ImportError:  # Downloaded without its sibling scripts
+    process_pool = None
+
+CONFIG_TABLE = "disable_statements"
+
+# Rules that do not apply to a repository type
+REPO_EXCLUDED_RULES = {
+    "api": ("eslint_disable",),
+    "admin": ("biome_disable", "ts_ignore", "sanitization_disable"),
+}
+
+# Built-in overrides applied before any configured ones
+DEFAULT_OVERRIDES = (
+    {
+        # Coverage directives are irrelevant in test files
+        "paths": ["*.test.ts", "*.spec.ts", "*.test.tsx", "*.spec.tsx"],
+        "disable": ["istanbul_ignore"],
+    },
+)
+
+
+class FileTimeoutError(Exception):
+    """Raised when checking a single file exceeds its time budget."""
+
+
+class _LineIndex:
+    """Lazy mapping from character offsets to 1-based line numbers.
+
+    The newline offsets are collected once, on the first lookup, so
+    resolving the line of every match costs O(log n) instead of
+    re-counting the newlines that precede it.
+    """
+
+    def __init__(self, content: str) -> None:
+        """Initialize the index.
+
+        Args:
+            content: File content the offsets refer to.
+
+        Returns:
+            None
+        """
+        self._content = content
+        self._newlines = None
+
+    def line_number(self, offset: int) -> int:
+        """Return the 1-based line number containing an offset.
+
+        Args:
+            offset: Character offset into the content.
+
+        Returns:
+            line_num: Line number of the offset.
+        """
+        if self._newlines is None:
+            self._newlines = [
+                match.start() for match in re.finditer("\n", self._content)
+            ]
+        return bisect.bisect_left(self._newlines, offset) + 1
+
+
+@dataclass(frozen=True)
+class SkipPolicy:
+    """Thresholds deciding which files are too generated to be scanned.
+
+    A threshold of 0 disables the corresponding test. Globs containing a
+    "/" are matched against the whole path, all others against the file
+    name only.
+    """
+
+    max_file_size: int = 1024 * 1024
+    max_line_length: int = 2000
+    sniff_bytes: int = 8192
+    generated_globs: tuple = (
+        "*.min.js",
+        "*.min.mjs",
+        "*.min.cjs",
+        "*.bundle.js",
+        "*.chunk.js",
+        "gql.tada.d.ts",
+        "gql.tada-cache.d.ts",
+        "graphql-env.d.ts",
+        "*/__generated__/*",
+    )
+    enabled: bool = True
+
+
+def _compile_glob(pattern: str) -> "re.Pattern":
+    """Translate a path glob into an anchored regular expression.
+
+    Args:
+        pattern: Glob where "*" and "?" stay within one path component
+            and "**" spans any number of them.
+
+    Returns:
+        regex: Compiled pattern matching the whole path.
+    """
+    parts = []
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if pattern.startswith("**/", index):
+            parts.append("(?:.*/)?")
+            index += 3
+            continue
+        if pattern.startswith("**", index):
+            parts.append(".*")
+            index += 2
+            continue
+        if char == "*":
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "[" and "]" in pattern[index + 2 :]:
+            end = pattern.index("]", index + 2)
+            body = pattern[index + 1 : end].replace("\\", "\\\\")
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            parts.append(f"[{body}]")
+            index = end
+        else:
+            parts.append(re.escape(char))
+        index += 1
+    return re.compile("".join(parts) + r"\Z")
+
+
+class _PrefixNode:
+    """Node of the path-prefix index used by RuleSelector."""
+
+    __slots__ = ("children", "entries")
+
+    def __init__(self) -> None:
+        """Initialize an empty node.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.children = {}
+        self.entries = []
+
+
+class RuleSelector:
+    """Resolve which rules apply to a file from path-glob overrides.
+
+    Every glob is split once into its literal leading directories and a
+    residual pattern. The literal part is stored in a trie keyed by path
+    component, so resolving a directory only visits the overrides whose
+    prefix it lies under instead of testing every glob. Candidates are
+    cached per directory, and rule sets are cached per combination of
+    matching overrides, so files in an already seen directory resolve in
+    near-constant time.
+    """
+
+    def __init__(
+        self,
+        rule_names: list[str],
+        overrides: tuple = DEFAULT_OVERRIDES,
+        root: str = ".",
+        default_rules: Optional[list[str]] = None,
+    ) -> None:
+        """Compile the overrides into the prefix index.
+
+        Args:
+            rule_names: Names of all available rules.
+            overrides: Sequence of mappings with "paths" and any of
+                "rules", "enable" or "disable".
+            root: Directory that globs containing a "/" are relative to.
+            default_rules: Rules to start from instead of the repository
+                defaults.
+
+        Returns:
+            None
+        """
+        self.rule_names = tuple(sorted(rule_names))
+        self.root = os.path.abspath(root)
+        self.default_rules = default_rules
+        self._actions = []
+        self._trie = _PrefixNode()
+        self._basename_entries = []
+        self._directory_cache = {}
+        self._rules_cache = {}
+
+        for order, override in enumerate(overrides):
+            self._actions.append(
+                (
+                    self._rule_set(override.get("rules"), "rules"),
+                    self._rule_set(override.get("enable", ()), "enable"),
+                    self._rule_set(override.get("disable", ()), "disable"),
+                )
+            )
+            paths = override.get("paths", ())
+            if isinstance(paths, str):
+                paths = [paths]
+            for pattern in paths:
+                self._add_pattern(order, pattern)
+
+        if default_rules is not None:
+            self._rule_set(default_rules, "rules")
+
+    def _rule_set(
+        self, names: Optional[list], field: str
+    ) -> Optional[frozenset]:
+        """Validate rule names from the configuration.
+
+        Args:
+            names: Rule names, or None when the field is absent.
+            field: Name of the configuration field, for error messages.
+
+        Returns:
+            rules: Frozen set of the names, or None if names is None.
+        """
+        if names is None:
+            return None
+        unknown = sorted(set(names) - set(self.rule_names))
+        if unknown:
+            raise ValueError(
+                f"Unknown rule(s) {', '.join(unknown)} in '{field}'. "
+                f"Known rules: {', '.join(self.rule_names)}"
+            )
+        return frozenset(names)
+
+    def _add_pattern(self, order: int, pattern: str) -> None:
+        """Insert one glob of an override into the index.
+
+        Args:
+            order: Position of the override in the configuration.
+            pattern: Path glob of the override.
+
+        Returns:
+            None
+        """
+        if pattern.endswith("/"):
+            # A trailing slash names a directory and everything below it
+            pattern += "**"
+        # Drop empty and "." components, as relpath does for the paths
+        pattern = "/".join(
+            _ for _ in pattern.split("/") if _ not in ("", os.curdir)
+        )
+        if "/" not in pattern:
+            self._basename_entries.append((order, _compile_glob(pattern)))
+            return
+
+        # Walk the literal directories into the trie. The last component
+        # always stays in the residual so it can match files too.
+        node = self._trie
+        components = pattern.split("/")
+        depth = 0
+        while depth < len(components) - 1 and not any(
+            char in components[depth] for char in "*?["
+        ):
+            node = node.children.setdefault(components[depth], _PrefixNode())
+            depth += 1
+
+        residual = "/".join(components[depth:])
+        if residual == "**":
+            # Matches everything below the prefix, so it is decided per
+            # directory without looking at file names
+            regex = None
+        elif not any(char in residual for char in "*?["):
+            # A literal path names a file or a whole directory
+            regex = re.compile(re.escape(residual) + r"(?:/.*)?\Z")
+        else:
+            regex = _compile_glob(residual)
+        node.entries.append((order, regex, depth))
+
+    def _candidates(self, directory: str) -> tuple:
+        """Collect the overrides that can apply to files in a directory.
+
+        Args:
+            directory: Absolute directory path.
+
+        Returns:
+            candidates: Tuple of (static orders, dynamic entries, relative
+                directory components).
+        """
+        cached = self._directory_cache.get(directory)
+        if cached is not None:
+            return cached
+
+        try:
+            relative = Path(os.path.relpath(directory, self.root)).as_posix()
+        except ValueError:  # Different drive on Windows
+            relative = os.pardir
+        components = () if relative == "." else tuple(relative.split("/"))
+
+        static = []
+        dynamic = [
+            (order, regex, None) for order, regex in self._basename_entries
+        ]
+        # Outside the root only file name globs can match
+        node = None if components[:1] == (os.pardir,) else self._trie
+        depth = 0
+        while node is not None:
+            for order, regex, prefix_depth in node.entries:
+                if regex is None:
+                    static.append(order)
+                else:
+                    dynamic.append((order, regex, prefix_depth))
+            if depth == len(components):
+                break
+            node = node.children.get(components[depth])
+            depth += 1
+
+        cached = (tuple(static), tuple(dynamic), components)
+        self._directory_cache[directory] = cached
+        return cached
+
+    def rules_for(self, file_path: str, repo: str = "admin") -> tuple:
+        """Return the rules that apply to a file.
+
+        Args:
+            file_path: Path of the file being checked.
+            repo: Repository type ("api" or "admin").
+
+        Returns:
+            rules: Sorted tuple of applicable rule names.
+        """
+        directory, name = os.path.split(os.path.abspath(file_path))
+        static, dynamic, components = self._candidates(directory)
+
+        matched = list(static)
+        for order, regex, prefix_depth in dynamic:
+            if prefix_depth is None:
+                target = name
+            else:
+                target = "/".join(components[prefix_depth:] + (name,))
+            if regex.match(target):
+                matched.append(order)
+
+        key = (repo, tuple(sorted(matched)))
+        rules = self._rules_cache.get(key)
+        if rules is None:
+            rules = self._resolve(repo, key[1])
+            self._rules_cache[key] = rules
+        return rules
+
+    def _resolve(self, repo: str, orders: tuple) -> tuple:
+        """Fold the matching overrides over the default rule set.
+
+        Args:
+            repo: Repository type ("api" or "admin").
+            orders: Positions of the matching overrides, ascending.
+
+        Returns:
+            rules: Sorted tuple of applicable rule names.
+        """
+        if self.default_rules is not None:
+            active = set(self.default_rules)
+        else:
+            excluded = REPO_EXCLUDED_RULES.get(repo, ())
+            active = {rule for rule in self.rule_names if rule not in excluded}
+
+        for order in orders:
+            replace, enable, disable = self._actions[order]
+            if replace is not None:
+                active = set(replace)
+            active |= enable
+            active -= disable
+
+        return tuple(sorted(active))
+
+
+def load_rule_selector(
+    rule_names: list[str], config_path: Optional[str] = None
+) -> RuleSelector:
+    """Build a RuleSelector from the built-in defaults and a config file.
+
+    Args:
+        rule_names: Names of all available rules.
+        config_path: TOML file with a [tool.disable_statements] table, or
+            None for the built-in defaults only.
+
+    Returns:
+        selector: RuleSelector for the configuration.
+    """
+    if not config_path:
+        return RuleSelector(rule_names)
+
+    with open(config_path, "rb") as f:
+        raw = f.read()
+
+    if tomllib is None:
+        if f"[tool.{CONFIG_TABLE}".encode() in raw:
+            raise RuntimeError(
+                f"{config_path} configures [tool.{CONFIG_TABLE}], which "
+                "requires Python 3.11+ or the tomli package"
+            )
+        return RuleSelector(rule_names)
+
+    table = tomllib.loads(raw.decode("utf-8"))
+    table = table.get("tool", {}).get(CONFIG_TABLE, {})
+    return RuleSelector(
+        rule_names,
+        overrides=DEFAULT_OVERRIDES + tuple(table.get("overrides", ())),
+        root=os.path.dirname(os.path.abspath(config_path)),
+        default_rules=table.get("rules"),
+    )
+
+
+def _raise_file_timeout(signum: int, frame: object) -> None:
+    """Interrupt the current file check when its time budget expires.
+
+    Args:
+        signum: Signal number that was delivered.
+        frame: Interrupted stack frame.
+
+    Returns:
+        None
+    """
+    raise FileTimeoutError(f"signal {signum}")
 
 
 class DisableStatementsChecker:
@@ -33,6 +514,93 @@ class DisableStatementsChecker:
         ".webp",
     }
 
+    # Files check_directory looks at
+    SOURCE_EXTENSIONS = (".js", ".jsx", ".ts", ".tsx")
+
+    # Every rule pattern must run in time linear in the size of the file.
+    # Each one is anchored on a literal prefix ("//", "/*" or "it."), has
+    # no nested quantifiers, and quantified runs are always followed by a
+    # literal that cannot be part of the run. A failed attempt therefore
+    # costs at most one whitespace run or the rest of one line, and every
+    # run follows a single anchor. The adversarial corpus in
+    # test/scripts/test_disable_statements_check.py guards this property.
+    ESLINT_DISABLE_PATTERN = re.compile(r"//\s*eslint-disable", re.IGNORECASE)
+    BIOME_IGNORE_PATTERN = re.compile(
+        r"//\s*biome-ignore.*$", re.IGNORECASE | re.MULTILINE
+    )
+    TS_IGNORE_PATTERN = re.compile(r"(?://|/\*)\s*@ts-ignore(?:\s+|$)")
+    # Case-sensitive pattern to enforce canonical lowercase form
+    SANITIZATION_DISABLE_PATTERN = re.compile(
+        r"//\s*check-sanitization-disable(?:\s*:\s*(.*))?$",
+        re.MULTILINE,
+    )
+    # Match both // and /* */ variants to support API patterns
+    ISTANBUL_IGNORE_PATTERN = re.compile(
+        r"//\s*istanbul\s+ignore(?:\s+(?:next|-line))?[^\n]*|"
+        r"/\*\s*istanbul\s+ignore\s+(?:next|-line)\s*\*/",
+        re.IGNORECASE,
+    )
+    IT_SKIP_PATTERN = re.compile(r"\bit\.skip\s*\(")
+
+    # check_* methods that drive the rules rather than implement one
+    NON_RULE_METHODS = (
+        "check_file",
+        "check_files",
+        "check_files_async",
+        "check_directory",
+    )
+
+    def __init__(
+        self,
+        file_timeout: Optional[float] = None,
+        skip_policy: Optional[SkipPolicy] = None,
+        verbose: bool = False,
+        rule_selector: Optional[RuleSelector] = None,
+        memory_report: Optional["MemoryReport"] = None,
+    ) -> None:
+        """Initialize the checker.
+
+        Args:
+            file_timeout: Optional time budget in seconds for checking a
+                single file. Files exceeding it are reported as timed out.
+            skip_policy: Policy for skipping generated and minified files.
+                Defaults to SkipPolicy().
+            verbose: Print the skip or scan decision for every file to
+                stderr.
+            rule_selector: Decides which rules apply to each path.
+                Defaults to the built-in per-repository rules.
+            memory_report: Optional memory_report.MemoryReport measuring
+                the read and scan phases of every file.
+
+        Returns:
+            None
+        """
+        self.file_timeout = file_timeout
+        self.skip_policy = skip_policy if skip_policy else SkipPolicy()
+        self.verbose = verbose
+        self.rule_selector = (
+            rule_selector if rule_selector else RuleSelector(self.rule_names())
+        )
+        self.memory_report = memory_report
+
+    @classmethod
+    def rule_names(cls) -> list[str]:
+        """Auto-discover the rules implemented by check_* methods.
+
+        Args:
+            None
+
+        Returns:
+            names: Rule names without their "check_" prefix.
+        """
+        return sorted(
+            name[len("check_") :]
+            for name, _ in inspect.getmembers(
+                cls, predicate=inspect.isfunction
+            )
+            if name.startswith("check_") and name not in cls.NON_RULE_METHODS
+        )
+
     def check_eslint_disable(self, content: str, file_path: str) -> list[str]:
         """Check for eslint-disable comments (Admin-specific).
 
@@ -44,10 +612,10 @@ class DisableStatementsChecker:
             violations: List of violation messages.
         """
         violations = []
-        pattern = re.compile(r"//\s*eslint-disable", re.IGNORECASE)
+        lines = _LineIndex(content)
 
-        for match in pattern.finditer(content):
-            line_num = content[: match.start()].count("\n") + 1
+        for match in self.ESLINT_DISABLE_PATTERN.finditer(content):
+            line_num = lines.line_number(match.start())
             violations.append(
                 f"{file_path}:{line_num}: Found eslint-disable comment"
             )
@@ -65,12 +633,10 @@ class DisableStatementsChecker:
             violations: List of violation messages.
         """
         violations = []
-        pattern = re.compile(
-            r"//\s*biome-ignore.*$", re.IGNORECASE | re.MULTILINE
-        )
+        lines = _LineIndex(content)
 
-        for match in pattern.finditer(content):
-            line_num = content[: match.start()].count("\n") + 1
+        for match in self.BIOME_IGNORE_PATTERN.finditer(content):
+            line_num = lines.line_number(match.start())
             violations.append(
                 f"{file_path}:{line_num}: Found biome-ignore comment. "
                 "Please remove and ensure code adheres to Biome rules."
@@ -89,10 +655,10 @@ class DisableStatementsChecker:
             violations: List of violation messages.
         """
         violations = []
-        pattern = re.compile(r"(?://|/\*)\s*@ts-ignore(?:\s+|$)")
+        lines = _LineIndex(content)
 
-        for match in pattern.finditer(content):
-            line_num = content[: match.start()].count("\n") + 1
+        for match in self.TS_IGNORE_PATTERN.finditer(content):
+            line_num = lines.line_number(match.start())
             violations.append(
                 f"{file_path}:{line_num}: Found @ts-ignore comment"
             )
@@ -114,14 +680,10 @@ class DisableStatementsChecker:
             violations: List of violation messages.
         """
         violations = []
-        # Case-sensitive pattern to enforce canonical lowercase form
-        pattern = re.compile(
-            r"//\s*check-sanitization-disable(?:\s*:\s*(.*))?$",
-            re.MULTILINE,
-        )
+        lines = _LineIndex(content)
 
-        for match in pattern.finditer(content):
-            line_num = content[: match.start()].count("\n") + 1
+        for match in self.SANITIZATION_DISABLE_PATTERN.finditer(content):
+            line_num = lines.line_number(match.start())
             justification = match.group(1)
 
             if not justification or not justification.strip():
@@ -150,15 +712,10 @@ class DisableStatementsChecker:
             violations: List of violation messages.
         """
         violations = []
-        # Match both // and /* */ variants to support API patterns
-        pattern = re.compile(
-            r"//\s*istanbul\s+ignore(?:\s+(?:next|-line))?[^\n]*|"
-            r"/\*\s*istanbul\s+ignore\s+(?:next|-line)\s*\*/",
-            re.IGNORECASE,
-        )
+        lines = _LineIndex(content)
 
-        for match in pattern.finditer(content):
-            line_num = content[: match.start()].count("\n") + 1
+        for match in self.ISTANBUL_IGNORE_PATTERN.finditer(content):
+            line_num = lines.line_number(match.start())
             violations.append(
                 f"{file_path}:{line_num}: Found istanbul ignore comment. "
                 "Please add appropriate tests."
@@ -177,10 +734,10 @@ class DisableStatementsChecker:
             violations: List of violation messages.
         """
         violations = []
-        pattern = re.compile(r"\bit\.skip\s*\(")
+        lines = _LineIndex(content)
 
-        for match in pattern.finditer(content):
-            line_num = content[: match.start()].count("\n") + 1
+        for match in self.IT_SKIP_PATTERN.finditer(content):
+            line_num = lines.line_number(match.start())
             violations.append(
                 f"{file_path}:{line_num}: Found it.skip statement"
             )
@@ -198,94 +755,424 @@ class DisableStatementsChecker:
         Returns:
             violations: List of violation messages.
         """
+        with self.measure("read", file_path):
+            content, violations = self._read_for_check(file_path)
+        if content is None:
+            return violations
+        with self.measure("scan", file_path):
+            return self.scan_content(content, file_path, repo=repo)
+
+    def measure(self, phase: str, file_path: Optional[str] = None):
+        """Measure the memory of a phase when a memory report is enabled.
+
+        Args:
+            phase: Name of the phase.
+            file_path: File the phase is about, if any.
+
+        Returns:
+            context: Context manager measuring the enclosed code.
+        """
+        if self.memory_report is None:
+            return nullcontext()
+        return self.memory_report.phase(phase, file_path)
+
+    def _read_for_check(self, file_path: str) -> tuple:
+        """Read a file unless it is excluded, generated or unreadable.
+
+        Args:
+            file_path: Path to the file to read.
+
+        Returns:
+            result: Tuple of (content, violations). content is None when
+                the file is not scanned, in which case violations holds
+                any read error.
+        """
         # Skip checking this script itself and Python test files
         basename = os.path.basename(file_path)
         if basename == "disable_statements_check.py" or file_path.endswith(
             ".py"
         ):
-            return []
+            return None, []
 
         # Skip known binary file types (e.g. screenshots)
         if Path(file_path).suffix.lower() in self.BINARY_EXTENSIONS:
-            return []
-
-        # Check if it's a test file
-        is_test_file = file_path.endswith(
-            (".test.ts", ".spec.ts", ".test.tsx", ".spec.tsx")
-        )
+            return None, []
 
         try:
-            with open(file_path, encoding="utf-8") as f:
-                content = f.read()
+            content = self._read_unless_skipped(file_path)
         except (OSError, UnicodeDecodeError) as e:
-            return [f"{file_path}: Error reading file - {e}"]
+            return None, [f"{file_path}: Error reading file - {e}"]
+        return content, []
+
+    def scan_content(
+        self, content: str, file_path: str, repo: str = "admin"
+    ) -> list[str]:
+        """Run the rules that apply to a file against its content.
+
+        This is the rule engine shared by the synchronous and asynchronous
+        APIs. It does no I/O and is safe to run in an executor.
 
+        Args:
+            content: Decoded file content.
+            file_path: Path the content was read from.
+            repo: Repository type ("api" or "admin").
+
+        Returns:
+            violations: List of violation messages.
+        """
         violations = []
+        try:
+            with self._time_budget() as deadline:
+                for rule in self.rule_selector.rules_for(file_path, repo):
+                    # Signals are unavailable off the main thread and on
+                    # Windows, so also enforce the budget between rules
+                    if deadline is not None and time.monotonic() > deadline:
+                        raise FileTimeoutError(file_path)
+
+                    method = getattr(self, f"check_{rule}")
+                    violations.extend(method(content, file_path))
+        except FileTimeoutError:
+            return [
+                f"{file_path}: Timed out after {self.file_timeout}s - "
+                "file was not fully checked"
+            ]
+
+        return violations
+
+    def skip_reason_for_path(self, file_path: str) -> Optional[str]:
+        """Decide from the path and size alone whether to skip a file.
+
+        Args:
+            file_path: Path to the file being classified.
+
+        Returns:
+            reason: Why the file should be skipped, or None to keep going.
+        """
+        policy = self.skip_policy
+        if not policy.enabled:
+            return None
+
+        posix_path = "/" + Path(file_path).as_posix().lstrip("/")
+        basename = posix_path.rsplit("/", 1)[-1]
+        for pattern in policy.generated_globs:
+            target = posix_path if "/" in pattern else basename
+            if fnmatch.fnmatchcase(target, pattern):
+                return f"generated path matches {pattern!r}"
+
+        if policy.max_file_size:
+            size = os.stat(file_path).st_size
+            if size > policy.max_file_size:
+                return (
+                    f"size {size} bytes exceeds {policy.max_file_size} bytes"
+                )
+
+        return None
+
+    def skip_reason_for_head(self, head: bytes) -> Optional[str]:
+        """Decide from the first block of a file whether to skip it.
+
+        Args:
+            head: Up to SkipPolicy.sniff_bytes bytes read from the start of
+                the file.
+
+        Returns:
+            reason: Why the file should be skipped, or None to scan it.
+        """
+        policy = self.skip_policy
+        if not policy.enabled:
+            return None
+
+        if b"\0" in head:
+            return "binary content (NUL byte in first block)"
+
+        if policy.max_line_length:
+            longest = max(len(line) for line in head.split(b"\n"))
+            if longest > policy.max_line_length:
+                return (
+                    f"minified (line of {longest}+ bytes exceeds "
+                    f"{policy.max_line_length})"
+                )
+
+        return None
 
-        # Auto-discover check methods
-        for name, method in inspect.getmembers(
-            self, predicate=inspect.ismethod
+    def _read_unless_skipped(self, file_path: str) -> Optional[str]:
+        """Classify a file and read it only if it should be scanned.
+
+        Args:
+            file_path: Path to the file to read.
+
+        Returns:
+            content: Decoded file content, or None if the file is skipped.
+        """
+        reason = self.skip_reason_for_path(file_path)
+        data = b""
+        if reason is None:
+            with open(file_path, "rb") as f:
+                data = f.read(self.skip_policy.sniff_bytes)
+                reason = self.skip_reason_for_head(data)
+                if reason is None:
+                    data += f.read()
+
+        if reason is not None:
+            self._report_decision(file_path, f"skip ({reason})")
+            return None
+
+        self._report_decision(file_path, "scan")
+        content = data.decode("utf-8")
+        # Match the newline translation of reading in text mode
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+        return content
+
+    def _report_decision(self, file_path: str, decision: str) -> None:
+        """Print the classification of a file in verbose mode.
+
+        Args:
+            file_path: Path to the classified file.
+            decision: Human readable decision.
+
+        Returns:
+            None
+        """
+        if self.verbose:
+            print(f"{file_path}: {decision}", file=sys.stderr)
+
+    @contextmanager
+    def _time_budget(self) -> Iterator[Optional[float]]:
+        """Bound the time spent inside the block by the file timeout.
+
+        Where SIGALRM is available and we are on the main thread, an
+        interval timer interrupts a long-running regex scan with
+        FileTimeoutError. Callers should additionally compare the yielded
+        deadline against time.monotonic() between units of work.
+
+        Args:
+            None
+
+        Returns:
+            deadline: Monotonic deadline, or None without a file timeout.
+        """
+        if not self.file_timeout:
+            yield None
+            return
+
+        deadline = time.monotonic() + self.file_timeout
+        if not hasattr(signal, "setitimer") or (
+            threading.current_thread() is not threading.main_thread()
         ):
-            if name.startswith("check_") and name not in (
-                "check_file",
-                "check_files",
-                "check_directory",
-            ):
-                # Skip repo-specific checks
-                if repo == "api" and name == "check_eslint_disable":
-                    continue
-                if repo == "admin" and name in (
-                    "check_biome_disable",
-                    "check_ts_ignore",
-                    "check_sanitization_disable",
-                ):
-                    continue
-
-                # Skip coverage checks for test files
-                if is_test_file and name == "check_istanbul_ignore":
-                    continue
-
-                violations.extend(method(content, file_path))
+            yield deadline
+            return
 
-        return violations
+        previous_handler = signal.signal(signal.SIGALRM, _raise_file_timeout)
+        signal.setitimer(signal.ITIMER_REAL, self.file_timeout)
+        try:
+            yield deadline
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
 
     def check_files(
-        self, file_paths: list[str], repo: str = "admin"
+        self, file_paths: list[str], repo: str = "admin", jobs: int = 1
     ) -> list[str]:
         """Check multiple files for disable statements.
 
         Args:
             file_paths: List of file paths to check.
             repo: Repository type ("api" or "admin").
+            jobs: Number of worker processes. 0 uses every CPU and a
+                negative number raises ValueError. Files are checked in
+                this process when a memory report is enabled or
+                process_pool.py is not next to this script.
 
         Returns:
-            all_violations: List of violation messages from all files.
+            all_violations: List of violation messages from all files, in
+                the order of file_paths.
         """
+        if jobs < 0:
+            raise ValueError(f"jobs must be 0 or more, not {jobs}")
+        if process_pool is not None and not self.memory_report:
+            jobs = process_pool.resolve_jobs(jobs)
+        else:
+            jobs = 1
+        if jobs == 1 or len(file_paths) < 2:
+            results = (self.check_file(_, repo=repo) for _ in file_paths)
+        else:
+            results = process_pool.map_in_pool(
+                self.check_file, jobs, file_paths, [repo] * len(file_paths)
+            )
+
         all_violations = []
-        for file_path in file_paths:
-            violations = self.check_file(file_path, repo=repo)
+        for violations in results:
             all_violations.extend(violations)
         return all_violations
 
+    async def check_files_async(
+        self,
+        file_paths: list[str],
+        repo: str = "admin",
+        max_concurrency: int = 8,
+        executor: Optional[Executor] = None,
+    ) -> list[str]:
+        """Check multiple files without blocking the event loop.
+
+        Args:
+            file_paths: List of file paths to check.
+            repo: Repository type ("api" or "admin").
+            max_concurrency: Maximum number of files in flight at once.
+            executor: Executor for the CPU-bound scanning. Defaults to the
+                event loop's default executor.
+
+        Returns:
+            all_violations: List of violation messages from all files, in
+                the order of file_paths.
+        """
+        results = [None] * len(file_paths)
+        async for index, _, violations in self._iter_indexed_async(
+            file_paths, repo, max_concurrency, executor
+        ):
+            results[index] = violations
+        return [violation for result in results for violation in result]
+
+    async def iter_violations_async(
+        self,
+        file_paths: Iterable[str],
+        repo: str = "admin",
+        max_concurrency: int = 8,
+        executor: Optional[Executor] = None,
+    ) -> AsyncIterator[tuple]:
+        """Yield the violations of each file as soon as it is checked.
+
+        Files are read in the default executor and scanned in executor,
+        with at most max_concurrency files in flight. Closing the iterator
+        or cancelling the consuming task cancels the pending files.
+
+        Args:
+            file_paths: File paths to check; consumed lazily.
+            repo: Repository type ("api" or "admin").
+            max_concurrency: Maximum number of files in flight at once.
+            executor: Executor for the CPU-bound scanning. Defaults to the
+                event loop's default executor.
+
+        Returns:
+            results: Async iterator of (file_path, violations) tuples in
+                completion order.
+        """
+        async for _, file_path, violations in self._iter_indexed_async(
+            file_paths, repo, max_concurrency, executor
+        ):
+            yield file_path, violations
+
+    async def _iter_indexed_async(
+        self,
+        file_paths: Iterable[str],
+        repo: str,
+        max_concurrency: int,
+        executor: Optional[Executor],
+    ) -> AsyncIterator[tuple]:
+        """Check files concurrently within a sliding window.
+
+        Args:
+            file_paths: File paths to check; consumed lazily.
+            repo: Repository type ("api" or "admin").
+            max_concurrency: Maximum number of files in flight at once.
+            executor: Executor for the CPU-bound scanning.
+
+        Returns:
+            results: Async iterator of (index, file_path, violations)
+                tuples in completion order.
+        """
+        loop = asyncio.get_running_loop()
+        paths = enumerate(file_paths)
+        pending = set()
+        try:
+            while True:
+                for index, file_path in paths:
+                    pending.add(
+                        loop.create_task(
+                            self._check_file_async(
+                                index, file_path, repo, executor
+                            )
+                        )
+                    )
+                    if len(pending) >= max(1, max_concurrency):
+                        break
+                if not pending:
+                    return
+
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _check_file_async(
+        self,
+        index: int,
+        file_path: str,
+        repo: str,
+        executor: Optional[Executor],
+    ) -> tuple:
+        """Read a file and scan it off the event loop.
+
+        Args:
+            index: Position of the file in the input.
+            file_path: Path to the file to check.
+            repo: Repository type ("api" or "admin").
+            executor: Executor for the CPU-bound scanning.
+
+        Returns:
+            result: Tuple of (index, file_path, violations).
+        """
+        loop = asyncio.get_running_loop()
+        content, violations = await loop.run_in_executor(
+            None, self._read_for_check, file_path
+        )
+        if content is not None:
+            violations = await loop.run_in_executor(
+                executor, self.scan_content, content, file_path, repo
+            )
+        return index, file_path, violations
+
     def check_directory(
-        self, directory: str, repo: str = "admin"
+        self, directory: str, repo: str = "admin", jobs: int = 1
     ) -> list[str]:
         """Check all relevant files in a directory.
 
         Args:
             directory: Directory path to check recursively.
             repo: Repository type ("api" or "admin").
+            jobs: Number of worker processes. 0 uses every CPU.
 
         Returns:
             violations: List of violation messages from all files in directory.
         """
-        extensions = {".js", ".jsx", ".ts", ".tsx"}
+        file_paths = self.discover_files(directory)
+        return self.check_files(file_paths, repo=repo, jobs=jobs)
+
+    def discover_files(self, directory: str) -> list[str]:
+        """Find the files check_directory checks, in sorted order.
+
+        Args:
+            directory: Directory path to search recursively.
+
+        Returns:
+            file_paths: Paths of the JavaScript and TypeScript files.
+        """
         file_paths = []
 
-        for ext in extensions:
-            file_paths.extend(Path(directory).rglob(f"*{ext}"))
+        # Walk once; the rule selector caches its decision per directory
+        for root, dirs, files in os.walk(directory):
+            dirs.sort()
+            for file in sorted(files):
+                if file.endswith(self.SOURCE_EXTENSIONS):
+                    file_paths.append(os.path.join(root, file))
 
-        return self.check_files([str(p) for p in file_paths], repo=repo)
+        return file_paths
 
 
 def main() -> None:
@@ -311,21 +1198,131 @@ def main() -> None:
         help="Repository type (determines which checks to run)",
     )
 
+    parser.add_argument(
+        "--file-timeout",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Report a file as timed out if checking it takes longer",
+    )
+
+    parser.add_argument(
+        "--max-file-size",
+        type=int,
+        default=SkipPolicy.max_file_size,
+        metavar="BYTES",
+        help="Skip files larger than this as generated (0 disables)",
+    )
+    parser.add_argument(
+        "--max-line-length",
+        type=int,
+        default=SkipPolicy.max_line_length,
+        metavar="BYTES",
+        help="Skip files whose first block has a longer line as minified "
+        "(0 disables)",
+    )
+    parser.add_argument(
+        "--skip-glob",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help="Additional glob of generated files to skip (repeatable)",
+    )
+    parser.add_argument(
+        "--scan-generated",
+        action="store_true",
+        help="Scan every file, including generated and minified ones",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print the skip or scan decision for every file",
+    )
+
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of processes checking files. 0 uses every CPU.",
+    )
+
+    parser.add_argument(
+        "--memory-report",
+        action="store_true",
+        help="Print the peak memory of each phase and the largest files",
+    )
+
+    parser.add_argument(
+        "--config",
+        default="pyproject.toml" if os.path.isfile("pyproject.toml") else None,
+        help="TOML file with a [tool.disable_statements] table "
+        "(default: ./pyproject.toml if present)",
+    )
+
     args = parser.parse_args()
+    if args.jobs < 0:
+        parser.error("--jobs must be 0 or more")
+    if args.jobs != 1 and process_pool is None:
+        parser.error("--jobs needs process_pool.py next to this script")
+    if args.file_timeout is not None and args.file_timeout < 0:
+        parser.error("--file-timeout must be 0 or more")
+    for name in ("max_file_size", "max_line_length"):
+        if getattr(args, name) < 0:
+            option = name.replace("_", "-")
+            parser.error(f"--{option} must be 0 or more")
+
+    try:
+        rule_selector = load_rule_selector(
+            DisableStatementsChecker.rule_names(), args.config
+        )
+    except (OSError, ValueError, RuntimeError) as e:
+        parser.error(f"invalid rule configuration: {e}")
+
+    skip_policy = SkipPolicy(
+        max_file_size=args.max_file_size,
+        max_line_length=args.max_line_length,
+        generated_globs=SkipPolicy.generated_globs + tuple(args.skip_glob),
+        enabled=not args.scan_generated,
+    )
+    memory_report = None
+    if args.memory_report:
+        try:
+            from memory_report import MemoryReport
+        except ImportError:
+            parser.error(
+                "--memory-report needs memory_report.py next to this script"
+            )
 
-    checker = DisableStatementsChecker()
+        memory_report = MemoryReport()
+        memory_report.start()
+
+    checker = DisableStatementsChecker(
+        file_timeout=args.file_timeout,
+        skip_policy=skip_policy,
+        verbose=args.verbose,
+        rule_selector=rule_selector,
+        memory_report=memory_report,
+    )
 
     if args.files:
-        violations = checker.check_files(args.files, repo=args.repo)
+        violations = checker.check_files(
+            args.files, repo=args.repo, jobs=args.jobs
+        )
     else:
-        violations = checker.check_directory(args.directory, repo=args.repo)
+        violations = checker.check_directory(
+            args.directory, repo=args.repo, jobs=args.jobs
+        )
 
-    if violations:
+    with checker.measure("report"):
         for violation in violations:
             print(violation)
+    if memory_report is not None:
+        memory_report.stop()
+        print(memory_report.summary(), file=sys.stderr)
+
+    if violations:
         sys.exit(1)
-    else:
-        print(f"No disable statements found ({args.repo} checks).")
+    print(f"No disable statements found ({args.repo} checks).")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+"""Scalability test for DisableStatementsChecker.check_directory.
+
+The script generates a seeded synthetic monorepo: packages with source
+trees of realistic depth, vendored node_modules directories and files
+that are not checked, such as READMEs and JSON. It then measures each
+phase of checking the tree at several worker counts:
+
+- discover: walking the tree with discover_files, always one process
+- read: reading and decoding every file with the skip policy applied
+- scan: running the rules over the decoded files
+- check_directory: the whole check, as run in CI
+
+Each phase is measured in a fresh interpreter so its peak resident set
+size is not inflated by earlier phases. The discover phase writes the
+files it found to a list that the read and scan phases load, so their
+time and memory do not include walking the tree. Their seconds are the
+wall time of the whole process pool. Every worker of the scan phase
+reads its files before scanning them, so the seconds the busiest worker
+spent inside the phase are reported separately as worker_seconds.
+Results are written as JSON.
+
+Usage:
+    python disable_statements_scale.py --files 100000 --output scale.json
+    python disable_statements_scale.py --files 5000 --workers 1 2
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+from disable_statements_check import DisableStatementsChecker
+from process_pool import chunk_size, map_in_pool, share, shared
+from synthetic_corpus import write_corpus
+
+PHASES = ("discover", "read", "scan", "check_directory")
+
+_SOURCE_LINES = [
+    "import { describe, expect, it } from 'vitest';",
+    "export const value = compute(input, options);",
+    "export function handler(request: Request): Response {",
+    "  return { status: 200, body: JSON.stringify(payload) };",
+    "}",
+    "// Regular comment explaining the next statement",
+    "const list = items.filter((item) => item.enabled).map(String);",
+    "",
+]
+
+_DIRECTIVE_LINES = [
+    "// @ts-ignore",
+    "/* istanbul ignore next */",
+    "// biome-ignore lint/suspicious/noExplicitAny: legacy type",
+    "it.skip('pending case', () => {});",
+]
+
+_DIRECTORY_NAMES = [
+    "components",
+    "graphql",
+    "hooks",
+    "internal",
+    "resolvers",
+    "services",
+    "types",
+    "utils",
+]
+
+
+def _grow_tree(rng: random.Random, root: str, count: int) -> list[str]:
+    """Pick directories of a tree of realistic depth.
+
+    Args:
+        rng: Random generator.
+        root: Top directory of the tree.
+        count: Number of directories in the tree.
+
+    Returns:
+        directories: Directory paths, starting with root.
+    """
+    directories = [root]
+    while len(directories) < count:
+        parent = rng.choice(directories)
+        if parent.count(os.sep) - root.count(os.sep) >= 7:
+            continue
+        name = f"{rng.choice(_DIRECTORY_NAMES)}{len(directories)}"
+        directories.append(os.path.join(parent, name))
+    return directories
+
+
+def build_monorepo(
+    directory: str,
+    seed: int,
+    file_count: int,
+    vendor_ratio: float = 0.3,
+    packages: int = 20,
+) -> dict:
+    """Write a deterministic synthetic monorepo.
+
+    Args:
+        directory: Directory in which the monorepo is created.
+        seed: Seed for the random generator.
+        file_count: Number of files to generate.
+        vendor_ratio: Share of files inside node_modules directories.
+        packages: Number of packages.
+
+    Returns:
+        counts: Number of source, vendor and other files written.
+    """
+    # The directory trees have their own generator, so they do not shift
+    # the sequence the files are drawn from
+    rng = random.Random(f"{seed}-trees")
+    per_directory = 15
+    trees = []
+    for index in range(packages):
+        package = os.path.join("packages", f"package{index}")
+        size = max(1, file_count // (packages * per_directory))
+        trees.append(
+            (
+                _grow_tree(rng, os.path.join(package, "src"), size),
+                _grow_tree(rng, os.path.join(package, "node_modules"), size),
+            )
+        )
+
+    counts = {"source": 0, "vendor": 0, "other": 0}
+
+    def generate(rng: random.Random, index: int) -> tuple:
+        """Generate one file of a package.
+
+        Args:
+            rng: Random generator shared by the monorepo.
+            index: Index of the file in the monorepo.
+
+        Returns:
+            file: Relative path and content of the file.
+        """
+        sources, vendored = rng.choice(trees)
+        if rng.random() < vendor_ratio:
+            kind, parent = "vendor", rng.choice(vendored)
+            name = f"index{index}.js"
+        elif rng.random() < 0.1:
+            kind, parent = "other", rng.choice(sources)
+            name = f"notes{index}{rng.choice(['.md', '.json'])}"
+        else:
+            kind, parent = "source", rng.choice(sources)
+            name = f"file{index}{rng.choice(['.ts', '.tsx', '.test.ts'])}"
+
+        lines = [
+            (
+                rng.choice(_DIRECTIVE_LINES)
+                if rng.random() < 0.01
+                else rng.choice(_SOURCE_LINES)
+            )
+            for _ in range(rng.randint(10, 120))
+        ]
+        counts[kind] += 1
+        return os.path.join(parent, name), "\n".join(lines) + "\n"
+
+    write_corpus(directory, seed, file_count, generate)
+    return counts
+
+
+def _peak_rss_kib(children: bool = False) -> float:
+    """Return the peak resident set size of this process or its children.
+
+    Args:
+        children: Report the largest child process instead.
+
+    Returns:
+        peak: Peak resident set size in KiB.
+    """
+    # Unavailable on Windows, so only imported when measuring
+    import resource
+
+    who = resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF
+    peak = resource.getrusage(who).ru_maxrss
+    # macOS reports bytes, Linux kibibytes
+    return peak / 1024 if sys.platform == "darwin" else float(peak)
+
+
+def _read_chunk(file_paths: list[str]) -> tuple:
+    """Read and decode files the way the checker does.
+
+    Args:
+        file_paths: Files to read.
+
+    Returns:
+        result: Tuple of the worker's process ID and the seconds spent.
+    """
+    checker = shared()
+    start = time.perf_counter()
+    for file_path in file_paths:
+        checker._read_for_check(file_path)
+    return os.getpid(), time.perf_counter() - start
+
+
+def _scan_chunk(file_paths: list[str], repo: str) -> tuple:
+    """Read files, then time scanning them alone.
+
+    Args:
+        file_paths: Files to scan.
+        repo: Repository type ("api" or "admin").
+
+    Returns:
+        result: Tuple of the worker's process ID and the seconds spent.
+    """
+    checker = shared()
+    contents = [checker._read_for_check(_)[0] for _ in file_paths]
+    start = time.perf_counter()
+    for file_path, content in zip(file_paths, contents):
+        if content is not None:
+            checker.scan_content(content, file_path, repo=repo)
+    return os.getpid(), time.perf_counter() - start
+
+
+def _run_in_pool(function, file_paths: list[str], jobs: int, *args):
+    """Run a phase function over chunks of files in a process pool.
+
+    Args:
+        function: Phase function returning (pid, seconds) per chunk.
+        file_paths: Files to process.
+        jobs: Number of worker processes.
+        *args: Extra arguments passed to every call.
+
+    Returns:
+        seconds: Tuple of the wall time of the pool, including starting
+            and stopping it, and the in-phase time of the busiest worker.
+    """
+    start = time.perf_counter()
+    size = chunk_size(len(file_paths), jobs)
+    chunks = [
+        file_paths[_ : _ + size] for _ in range(0, len(file_paths), size)
+    ]
+    totals = {}
+    extra = [[_] * len(chunks) for _ in args]
+    for pid, seconds in map_in_pool(
+        function,
+        jobs,
+        chunks,
+        *extra,
+        initializer=share,
+        initargs=(DisableStatementsChecker(),),
+    ):
+        totals[pid] = totals.get(pid, 0.0) + seconds
+    return time.perf_counter() - start, max(totals.values(), default=0.0)
+
+
+def _load_file_list(file_list: str) -> list[str]:
+    """Load the files found by the discover phase.
+
+    Args:
+        file_list: File listing one path per line.
+
+    Returns:
+        file_paths: Paths of the files to check.
+    """
+    with open(file_list, encoding="utf-8") as f:
+        return f.read().splitlines()
+
+
+def run_phase(
+    phase: str, directory: str, jobs: int, repo: str, file_list: str
+) -> dict:
+    """Measure one phase in the current process and its workers.
+
+    Args:
+        phase: Name of the phase in PHASES.
+        directory: Root of the monorepo.
+        jobs: Number of worker processes.
+        repo: Repository type ("api" or "admin").
+        file_list: File listing one path per line. The discover phase
+            writes it and the other phases load it.
+
+    Returns:
+        metrics: Wall time, files per second and peak RSS of the phase,
+            and the busiest worker's time for the read and scan phases.
+    """
+    checker = DisableStatementsChecker()
+    metrics = {}
+
+    if phase == "discover":
+        start = time.perf_counter()
+        file_paths = checker.discover_files(directory)
+        seconds = time.perf_counter() - start
+        with open(file_list, "w", encoding="utf-8") as f:
+            f.writelines(f"{_}\n" for _ in file_paths)
+    elif phase == "check_directory":
+        start = time.perf_counter()
+        checker.check_directory(directory, repo=repo, jobs=jobs)
+        seconds = time.perf_counter() - start
+        file_paths = _load_file_list(file_list)
+    else:
+        file_paths = _load_file_list(file_list)
+        if phase == "read":
+            seconds, busiest = _run_in_pool(_read_chunk, file_paths, jobs)
+        else:
+            seconds, busiest = _run_in_pool(
+                _scan_chunk, file_paths, jobs, repo
+            )
+        metrics["worker_seconds"] = round(busiest, 4)
+
+    metrics.update(
+        {
+            "seconds": round(seconds, 4),
+            "files_per_second": round(len(file_paths) / max(seconds, 1e-9), 1),
+            "peak_rss_kib": _peak_rss_kib(),
+            "worker_peak_rss_kib": _peak_rss_kib(children=True),
+        }
+    )
+    return metrics
+
+
+def measure(directory: str, workers: list[int], repo: str) -> dict:
+    """Measure every phase at every worker count in fresh interpreters.
+
+    Args:
+        directory: Root of the monorepo.
+        workers: Worker counts to measure.
+        repo: Repository type ("api" or "admin").
+
+    Returns:
+        runs: Phase metrics keyed by worker count.
+    """
+    runs = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_list = os.path.join(temp_dir, "files.txt")
+        for jobs in workers:
+            runs[str(jobs)] = {}
+            for phase in PHASES:
+                output = subprocess.run(
+                    [
+                        sys.executable,
+                        os.path.abspath(__file__),
+                        "--phase",
+                        phase,
+                        "--directory",
+                        directory,
+                        "--repo",
+                        repo,
+                        "--workers",
+                        str(jobs),
+                        "--file-list",
+                        file_list,
+                    ],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                ).stdout
+                runs[str(jobs)][phase] = json.loads(output)
+    return runs
+
+
+def main() -> None:
+    """Build a monorepo, measure it and write the results as JSON.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(
+        description="Measure how DisableStatementsChecker scales with the "
+        "size of the tree and the number of workers"
+    )
+    parser.add_argument("--seed", type=int, default=2024)
+    parser.add_argument("--files", type=int, default=100_000)
+    parser.add_argument("--vendor-ratio", type=float, default=0.3)
+    parser.add_argument("--repo", choices=["api", "admin"], default="api")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=sorted({1, 2, 4, cpus}),
+        help="Worker counts to measure (default: 1 2 4 and every CPU)",
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="JSON file to write the results to (default: stdout)",
+    )
+    parser.add_argument(
+        "--directory",
+        default=None,
+        help="Existing tree to measure instead of a generated one",
+    )
+    parser.add_argument("--phase", choices=PHASES, help=argparse.SUPPRESS)
+    parser.add_argument("--file-list", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    # Measure a single phase for the parent process
+    if args.phase is not None:
+        metrics = run_phase(
+            args.phase,
+            args.directory,
+            args.workers[0],
+            args.repo,
+            args.file_list,
+        )
+        print(json.dumps(metrics))
+        return
+
+    corpus = {"directory": args.directory}
+    with tempfile.TemporaryDirectory() as directory:
+        if args.directory is None:
+            start = time.perf_counter()
+            counts = build_monorepo(
+                directory, args.seed, args.files, args.vendor_ratio
+            )
+            corpus = {
+                "seed": args.seed,
+                "files": args.files,
+                "vendor_ratio": args.vendor_ratio,
+                "counts": counts,
+                "build_seconds": round(time.perf_counter() - start, 2),
+            }
+        runs = measure(args.directory or directory, args.workers, args.repo)
+
+    results = {
+        "python": platform.python_version(),
+        "cpu_count": cpus,
+        "corpus": corpus,
+        "runs": runs,
+    }
+    text = json.dumps(results, indent=2)
+    if args.output is None:
+        print(text)
+        return
+    with open(args.output, "w", encoding="utf-8") as f:
+        f.write(text + "\n")
+    print(f"Results written to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Peak memory accounting for the CI checker scripts.
+
+A MemoryReport measures the phases of a run with tracemalloc. Phases may
+be nested: each one records the memory it still holds when it ends and
+its peak above the memory traced when it started. Phases about a single
+file also count towards that file, so the files causing the largest
+peaks can be named.
+
+Usage:
+    report = MemoryReport()
+    report.start()
+    with report.phase("read", file_path):
+        ...
+    report.stop()
+    print(report.summary())
+"""
+
+import tracemalloc
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+
+class MemoryReport:
+    """Peak and net allocation of the phases of a run."""
+
+    def __init__(self) -> None:
+        """Start an empty report.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        # Phase name to [calls, net bytes, largest peak in bytes]
+        self.phases = {}
+        # File path to the largest peak of its phases in bytes
+        self.files = {}
+        self.peak = 0
+        # Traced size at the start and peak so far of each open phase
+        self._stack = []
+
+    def start(self) -> None:
+        """Start tracing allocations.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        tracemalloc.start()
+
+    def stop(self) -> None:
+        """Stop tracing allocations and record the overall peak.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.peak = max(self.peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    def begin(self) -> None:
+        """Open a phase.
+
+        The tracemalloc peak is reset so the phase only sees its own
+        allocations. The peak reached so far is kept for the enclosing
+        phase.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        current, peak = tracemalloc.get_traced_memory()
+        self.peak = max(self.peak, peak)
+        if self._stack:
+            self._stack[-1][1] = max(self._stack[-1][1], peak)
+        tracemalloc.reset_peak()
+        self._stack.append([current, current])
+
+    def end(self, name: str, detail: Optional[str] = None) -> None:
+        """Close the innermost phase and record it.
+
+        Args:
+            name: Name of the phase.
+            detail: File the phase is about, if any.
+
+        Returns:
+            None
+        """
+        current, peak = tracemalloc.get_traced_memory()
+        start, earlier_peak = self._stack.pop()
+        peak = max(peak, earlier_peak)
+        if self._stack:
+            self._stack[-1][1] = max(self._stack[-1][1], peak)
+
+        calls, net, largest = self.phases.get(name, (0, 0, 0))
+        self.phases[name] = (
+            calls + 1,
+            net + current - start,
+            max(largest, peak - start),
+        )
+        if detail is not None:
+            self.files[detail] = max(self.files.get(detail, 0), peak - start)
+
+    @contextmanager
+    def phase(self, name: str, detail: Optional[str] = None) -> Iterator:
+        """Measure the enclosed code as a phase.
+
+        Args:
+            name: Name of the phase.
+            detail: File the phase is about, if any.
+
+        Returns:
+            context: Context manager measuring the phase.
+        """
+        self.begin()
+        try:
+            yield self
+        finally:
+            self.end(name, detail)
+
+    def summary(self, top: int = 10) -> str:
+        """Summarize the phases and the files with the largest peaks.
+
+        Args:
+            top: Number of files listed.
+
+        Returns:
+            table: Multi-line report of the measurements.
+        """
+        lines = [
+            f"Peak traced memory: {self.peak / 1024:.1f} KiB",
+            f"{'phase':<32}{'calls':>8}{'net KiB':>12}{'peak KiB':>12}",
+        ]
+        for name, (calls, net, largest) in sorted(
+            self.phases.items(), key=lambda item: item[1][2], reverse=True
+        ):
+            lines.append(
+                f"{name:<32}{calls:>8}{net / 1024:>12.1f}"
+                f"{largest / 1024:>12.1f}"
+            )
+
+        files = sorted(self.files.items(), key=lambda item: -item[1])[:top]
+        if files:
+            lines.append("Files with the largest peaks:")
+            lines.extend(
+                f"{peak / 1024:>12.1f} KiB  {path}" for path, peak in files
+            )
+        return "\n".join(lines)
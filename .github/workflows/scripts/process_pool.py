@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Process pool shared by the CI checker scripts.
+
+check_docstrings.py, disable_statements_check.py, check_all.py and the
+scalability script spread files over worker processes the same way: a
+job count of 0 uses every CPU, each worker receives about four chunks of
+files, results come back in the order of the files, and files still
+queued are dropped when the consumer stops early. Objects that every
+task of a worker needs, such as a configured checker, are installed once
+per worker with share() instead of being pickled with each chunk.
+
+Usage:
+    jobs = resolve_jobs(args.jobs)
+    results = map_in_pool(check, jobs, file_paths, initializer=share,
+                          initargs=(checker,))
+"""
+
+import os
+from typing import Callable, Iterator
+
+# Object installed in a worker process by share()
+_SHARED = None
+
+
+def resolve_jobs(jobs: int) -> int:
+    """Turn a requested job count into a number of worker processes.
+
+    Args:
+        jobs: Requested number of processes. 0 uses every CPU and a
+            negative number raises ValueError.
+
+    Returns:
+        jobs: Number of worker processes, at least 1.
+    """
+    if jobs < 0:
+        raise ValueError(f"jobs must be 0 or more, not {jobs}")
+    return jobs or os.cpu_count() or 1
+
+
+def chunk_size(count: int, jobs: int) -> int:
+    """Size chunks so each worker receives about four of them.
+
+    Args:
+        count: Number of items to process.
+        jobs: Number of worker processes.
+
+    Returns:
+        size: Number of items per chunk, at least 1.
+    """
+    return max(1, count // (jobs * 4))
+
+
+def share(value) -> None:
+    """Install an object for every task of the current worker process.
+
+    Args:
+        value: Object returned by shared().
+
+    Returns:
+        None
+    """
+    global _SHARED
+    _SHARED = value
+
+
+def shared():
+    """Return the object installed by share().
+
+    Args:
+        None
+
+    Returns:
+        value: The shared object, or None if none was installed.
+    """
+    return _SHARED
+
+
+def map_in_pool(
+    function: Callable,
+    jobs: int,
+    *iterables,
+    initializer: Callable = None,
+    initargs: tuple = (),
+) -> Iterator:
+    """Call a function over lists of arguments in a process pool.
+
+    Args:
+        function: Picklable function called once per item.
+        jobs: Number of worker processes, as returned by resolve_jobs.
+        *iterables: Lists of equal length holding the arguments of each
+            call, as for map().
+        initializer: Optional function run once in each worker.
+        initargs: Arguments passed to initializer.
+
+    Returns:
+        results: Generator of the results in the order of the items.
+            Queued items are cancelled when it is closed early.
+    """
+    # Only pay for the process pool machinery when it is used
+    from concurrent.futures import ProcessPoolExecutor
+
+    count = len(iterables[0]) if bool(iterables) else 0
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=initializer, initargs=initargs
+    ) as executor:
+        results = executor.map(
+            function, *iterables, chunksize=chunk_size(count, jobs)
+        )
+        try:
+            yield from results
+        finally:
+            # Drop queued items when the consumer stops early
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""Test suite for check_all.py.
+
+This module tests the single walk driver running the docstring and
+disable statement checks over one pass of the files.
+"""
+
+import builtins
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+import unittest.mock
+from pathlib import Path
+
+# Add the scripts directory to the path
+SCRIPTS_DIR = (
+    Path(__file__).parent.parent.parent / ".github" / "workflows" / "scripts"
+)
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import check_all  # noqa: E402
+from disable_statements_check import DisableStatementsChecker  # noqa: E402
+
+FAULTY_PYTHON = '''\
+def func(value):
+    """Do something.
+
+    Returns:
+        None
+    """
+    return value
+'''
+
+
+class TestCheckAll(unittest.TestCase):
+    """Test cases for the combined checker driver."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = self.temp_dir.name
+        self.checker = DisableStatementsChecker()
+        self._write("a/tool.py", FAULTY_PYTHON)
+        self._write("a/index.ts", "// @ts-ignore\nconst x = 1;\n")
+        self._write("b/clean.ts", "const y = 2;\n")
+        self._write("node_modules/lib/index.ts", "// @ts-ignore\n")
+        self._write("README.md", "// @ts-ignore\n")
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+
+    def _write(self, name, content):
+        """Write a file below the temporary directory."""
+        path = os.path.join(self.root, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        return path
+
+    def _path(self, name):
+        """Return the path of a file below the temporary directory."""
+        return os.path.join(self.root, name)
+
+    def _run_main(self, *arguments):
+        """Run main and return its exit code and output."""
+        argv = ["check_all.py", "--config", os.devnull, *arguments]
+        output = io.StringIO()
+        code = 0
+        with unittest.mock.patch.object(
+            sys, "argv", argv
+        ), contextlib.redirect_stdout(output):
+            try:
+                check_all.main()
+            except SystemExit as raised:
+                code = raised.code
+        return code, output.getvalue()
+
+    def test_discover_finds_both_kinds_in_one_walk(self):
+        """Test one walk finds Python and TypeScript files only."""
+        with unittest.mock.patch.object(os, "walk", wraps=os.walk) as walk:
+            file_paths = check_all.discover(
+                [self.root], exclude_dirs=["node_modules"]
+            )
+        walk.assert_called_once_with(self.root)
+        self.assertEqual(
+            file_paths,
+            [
+                self._path("a/index.ts"),
+                self._path("a/tool.py"),
+                self._path("b/clean.ts"),
+            ],
+        )
+
+    def test_each_file_is_read_once(self):
+        """Test every file is opened a single time by one checker."""
+        file_paths = check_all.discover([self.root], ["node_modules"])
+        with unittest.mock.patch.object(
+            builtins, "open", wraps=builtins.open
+        ) as opened:
+            results = list(
+                check_all.check_files(file_paths, self.checker, repo="api")
+            )
+        opened_paths = [call.args[0] for call in opened.call_args_list]
+        self.assertEqual(sorted(opened_paths), sorted(file_paths))
+        self.assertEqual(
+            [(path, kind) for path, kind, _ in results],
+            [
+                (self._path("a/index.ts"), check_all.DISABLE_STATEMENTS),
+                (self._path("a/tool.py"), check_all.DOCSTRINGS),
+                (self._path("b/clean.ts"), check_all.DISABLE_STATEMENTS),
+            ],
+        )
+
+    def test_process_pool_matches_single_process(self):
+        """Test results are identical and ordered with several jobs."""
+        file_paths = check_all.discover([self.root], ["node_modules"]) * 3
+        serial = list(check_all.check_files(file_paths, self.checker, "api"))
+        pooled = list(
+            check_all.check_files(file_paths, self.checker, "api", jobs=2)
+        )
+        self.assertEqual(pooled, serial)
+
+    def test_main_merges_reports_and_fails(self):
+        """Test main reports both checks and exits with one status."""
+        code, output = self._run_main(
+            "--repo", "api", "--directories", self.root
+        )
+        self.assertEqual(code, 1)
+        self.assertIn(
+            f"File Docstring Error: {self._path('a/tool.py')}", output
+        )
+        self.assertIn(f"{self._path('a/index.ts')}:", output)
+        self.assertNotIn("node_modules", output)
+        self.assertIn(
+            "Found 2 docstring violations and 1 disable statements", output
+        )
+
+    def test_main_passes_clean_files(self):
+        """Test main exits cleanly when neither check finds anything."""
+        code, output = self._run_main(
+            "--repo", "api", "--files", self._path("b/clean.ts")
+        )
+        self.assertEqual(code, 0)
+        self.assertIn("No docstring violations or disable statements", output)
+
+    def test_main_rejects_negative_jobs(self):
+        """Test --jobs below 0 is a usage error, not a pool crash."""
+        with contextlib.redirect_stderr(io.StringIO()) as errors:
+            code, _ = self._run_main(
+                "--directories", self.root, "--jobs", "-1"
+            )
+        self.assertEqual(code, 2)
+        self.assertIn("--jobs must be 0 or more", errors.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
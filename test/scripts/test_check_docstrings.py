@@ -0,0 +1,1246 @@
+#!/usr/bin/env python3
+"""Test suite for check_docstrings.py.
+
+This module tests the engines that validate Google style docstrings in
+the repository's Python scripts.
+"""
+
+import contextlib
+import io
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import textwrap
+import time
+import tracemalloc
+import unittest
+import unittest.mock
+from pathlib import Path
+
+# Add the scripts directory to the path
+SCRIPTS_DIR = (
+    Path(__file__).parent.parent.parent / ".github" / "workflows" / "scripts"
+)
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import check_docstrings  # noqa: E402
+from check_docstrings import (  # noqa: E402
+    DEFAULT_EXCLUDE_DIRS,
+    MESSAGES,
+    ResultCache,
+    Violation,
+    build_line_index,
+    check_directories,
+    check_directory,
+    discover_files,
+    signature_end,
+    validate_docstring,
+    validate_docstring_ast,
+    validate_files,
+)
+
+# Bound on the cumulative import time of the checker, in microseconds.
+# It imports in about 25ms, this leaves room for slow CI machines.
+IMPORT_BUDGET_US = 150_000
+
+COMPLIANT = '''\
+def add(first, second=2):
+    """Add two numbers.
+
+    Args:
+        first: First number
+        second: Second number
+
+    Returns:
+        total: Sum of the numbers
+
+    """
+    return first + second
+
+
+class Greeter:
+    """Greeter."""
+
+    def greet(self, name):
+        """Greet someone.
+
+        Args:
+            name: Name to greet
+
+        Returns:
+            None
+
+        """
+        print(name)
+'''
+
+
+class TestCheckDocstrings(unittest.TestCase):
+    """Test cases for the docstring checker."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _create_temp_file(self, filename: str, content: str) -> str:
+        """Create a temporary file with given content."""
+        filepath = os.path.join(self.temp_dir, filename)
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        with open(filepath, "w", encoding="utf-8") as f:
+            f.write(textwrap.dedent(content))
+        return filepath
+
+    def _issues(self, violations):
+        """Return the (function, issue) pairs of violations."""
+        return [(v.function, v.issue) for v in violations]
+
+    # ========== AST Engine Tests ==========
+
+    def test_ast_compliant_file(self):
+        """Test a compliant file has no violations."""
+        filepath = self._create_temp_file("module.py", COMPLIANT)
+        self.assertEqual(validate_docstring_ast(filepath), [])
+
+    def test_ast_matches_line_engine_on_common_code(self):
+        """Test both engines agree on multi-line signatures and errors."""
+        filepath = self._create_temp_file(
+            "module.py",
+            '''\
+            def spread(
+                first: int,
+                second: str = "x",
+            ) -> str:
+                """Spread over lines.
+
+                Args:
+                    first: First value
+                    third: Not an argument
+
+                Returns:
+                    result: Value
+
+                """
+                return second
+
+
+            def no_returns(value):
+                """Missing the returns section.
+
+                Args:
+                    value: Value
+
+                """
+                return value
+            ''',
+        )
+        reference = validate_docstring(filepath)
+        self.assertEqual(len(reference), 2)
+        self.assertEqual(validate_docstring_ast(filepath), reference)
+
+    def test_ast_async_keyword_only_and_variadic(self):
+        """Test async defs, keyword-only and variadic arguments are read."""
+        filepath = self._create_temp_file(
+            "module.py",
+            '''\
+            async def fetch(url, *args, timeout=1, **kwargs):
+                """Fetch a URL.
+
+                Args:
+                    url: Address
+                    *args: Extra positional values
+                    timeout: Seconds to wait
+                    **kwargs: Extra options
+
+                Returns:
+                    body: Response body
+
+                """
+
+
+            async def broken(url, *, retries):
+                """Fetch a URL.
+
+                Args:
+                    url: Address
+
+                Returns:
+                    body: Response body
+
+                """
+            ''',
+        )
+        violations = validate_docstring_ast(filepath)
+        self.assertEqual(len(violations), 1)
+        self.assertEqual(violations[0].function, "broken")
+        self.assertIn("don't match", violations[0].issue)
+
+    def test_ast_missing_and_single_line_docstrings(self):
+        """Test functions without multi-line docstrings are reported."""
+        filepath = self._create_temp_file(
+            "module.py",
+            '''\
+            def undocumented(value):
+                return value
+
+
+            def terse(value):
+                """Too short."""
+                return value
+            ''',
+        )
+        violations = validate_docstring_ast(filepath)
+        self.assertEqual(
+            self._issues(violations),
+            [
+                ("undocumented", "Missing docstring"),
+                (
+                    "terse",
+                    "Single line docstring without 'Args:' or 'Results:' "
+                    "sections defined.",
+                ),
+            ],
+        )
+        self.assertEqual([v.line for v in violations], [1, 5])
+
+    def test_ast_skips_property_and_tests(self):
+        """Test decorator exceptions and test functions are skipped."""
+        filepath = self._create_temp_file(
+            "test_module.py",
+            """\
+            class Thing:
+                @property
+                def size(self):
+                    return 1
+
+                @size.setter
+                def size(self, value):
+                    pass
+
+                def setUp(self):
+                    pass
+
+                def test_size(self):
+                    pass
+            """,
+        )
+        self.assertEqual(validate_docstring_ast(filepath), [])
+
+    def test_ast_falls_back_on_syntax_error(self):
+        """Test files that do not parse use the line engine."""
+        filepath = self._create_temp_file(
+            "module.py",
+            '''\
+            def unclosed(value):
+                """Never closed.
+
+                Args:
+                    value: Value
+            ''',
+        )
+        violations = validate_docstring_ast(filepath)
+        self.assertEqual(violations, validate_docstring(filepath))
+        self.assertIn("Unclosed docstring", [v.issue for v in violations])
+
+    def test_line_engine_reports_unparsable_docstring(self):
+        """Test a docstring_parser error is DOC004 in both engines."""
+        filepath = self._create_temp_file(
+            "module.py",
+            'def func(value):\n    """Foo.\n\n    :    :raisesYields:)\n'
+            '    """\n',
+        )
+        violations = validate_docstring(filepath)
+        self.assertEqual([v.code for v in violations], ["DOC004"])
+        self.assertEqual(violations, validate_docstring_ast(filepath))
+
+    def test_check_directory_engines(self):
+        """Test check_directory dispatches to the selected engine."""
+        self._create_temp_file("pkg/good.py", COMPLIANT)
+        bad = self._create_temp_file(
+            "pkg/bad.py",
+            '''\
+            async def bad(value):
+                """Bad.
+
+                Returns:
+                    None
+
+                """
+            ''',
+        )
+        self.assertEqual(
+            list(check_directory(self.temp_dir, engine="ast")), [bad]
+        )
+        # The default line engine does not recognise async functions
+        self.assertEqual(check_directory(self.temp_dir), {})
+        self.assertEqual(set(check_docstrings.ENGINES), {"ast", "line"})
+
+    # ========== Indexed Line Engine Tests ==========
+
+    def test_indexed_matches_forward_scans(self):
+        """Test the line index reproduces the forward scan results."""
+        filepath = self._create_temp_file(
+            "module.py",
+            '''\
+            def undocumented(first, second):
+                return call(first)(second)
+
+
+            def spread(
+                self,
+                value=(1, 2),
+            ):
+                """Spread over lines.
+
+                Args:
+                    value: Value
+
+                Returns:
+                    None
+
+                """
+
+
+            @helper.setter
+            def helper(self, value):
+                pass
+
+
+            def terse(value):
+                """Too short."""
+            ''' + COMPLIANT,
+        )
+        reference = validate_docstring(filepath, indexed=False)
+        self.assertGreater(len(reference), 0)
+        self.assertEqual(validate_docstring(filepath, indexed=True), reference)
+
+    def test_short_files_are_not_indexed(self):
+        """Test the line index is only built for long files."""
+        filepath = self._create_temp_file("module.py", COMPLIANT)
+        with unittest.mock.patch.object(
+            check_docstrings,
+            "build_line_index",
+            wraps=check_docstrings.build_line_index,
+        ) as build:
+            validate_docstring(filepath)
+            build.assert_not_called()
+            with unittest.mock.patch.object(
+                check_docstrings, "LINE_INDEX_MIN_LINES", 1
+            ):
+                validate_docstring(filepath)
+            build.assert_called_once()
+
+    def test_signature_end_stops_at_second_parenthesis(self):
+        """Test signature ends are found from the precomputed index."""
+        lines = [
+            "def first(a):",
+            "    return a",
+            "",
+            "def second(b):",
+            '    """Doc.',
+        ]
+        index = build_line_index(lines)
+        self.assertEqual(index.delimiters, [4])
+        self.assertEqual(signature_end(0, index), 4)
+        self.assertEqual(signature_end(3, index), 4)
+        self.assertEqual(signature_end(4, index), 4)
+
+    def test_indexed_is_linear_for_undocumented_functions(self):
+        """Test thousands of undocumented functions are checked quickly."""
+        filepath = self._create_temp_file(
+            "module.py",
+            "".join(
+                f"def func{n}(value):\n    return value\n\n"
+                for n in range(5000)
+            ),
+        )
+        start = time.perf_counter()
+        violations = validate_docstring(filepath)
+        elapsed = time.perf_counter() - start
+        self.assertEqual(len(violations), 5000)
+        self.assertLess(elapsed, 2.0)
+
+    # ========== Parallel Validation Tests ==========
+
+    def test_validate_files_jobs_preserve_order(self):
+        """Test a process pool yields the same results in input order."""
+        file_paths = [
+            self._create_temp_file(
+                f"pkg/mod{n}.py",
+                f"def func{n}(value):\n    return value\n" + COMPLIANT,
+            )
+            for n in range(8)
+        ]
+        serial = list(validate_files(file_paths, jobs=1))
+        parallel = list(validate_files(file_paths, jobs=2))
+        self.assertEqual([path for path, _ in parallel], file_paths)
+        self.assertEqual(parallel, serial)
+
+    def test_check_directory_jobs(self):
+        """Test check_directory reports the same violations with jobs."""
+        for n in range(4):
+            self._create_temp_file(
+                f"pkg/mod{n}.py", f"def func{n}(value):\n    return value\n"
+            )
+        self.assertEqual(
+            check_directory(self.temp_dir, jobs=2),
+            check_directory(self.temp_dir, jobs=1),
+        )
+
+    # ========== Result Cache Tests ==========
+
+    def test_cache_skips_unchanged_files(self):
+        """Test unchanged files are answered from the cache."""
+        filepath = self._create_temp_file(
+            "module.py", "def func(value):\n    return value\n"
+        )
+        cache_file = os.path.join(self.temp_dir, "cache", "results.json")
+        first = ResultCache(cache_file, "v1")
+        expected = list(validate_files([filepath], cache=first))
+        first.save()
+
+        second = ResultCache(cache_file, "v1")
+        with unittest.mock.patch.dict(
+            check_docstrings.ENGINES, {"line": self.fail}
+        ):
+            self.assertEqual(
+                list(validate_files([filepath], cache=second)), expected
+            )
+        self.assertEqual((second.hits, second.misses), (1, 0))
+
+    def test_cache_detects_changed_content(self):
+        """Test edited files are validated again."""
+        filepath = self._create_temp_file(
+            "module.py", "def func(value):\n    return value\n"
+        )
+        cache_file = os.path.join(self.temp_dir, "results.json")
+        cache = ResultCache(cache_file, "v1")
+        [(_, violations)] = validate_files([filepath], cache=cache)
+        self.assertEqual(len(violations), 1)
+        cache.save()
+
+        self._create_temp_file("module.py", COMPLIANT)
+        cache = ResultCache(cache_file, "v1")
+        self.assertEqual(
+            list(validate_files([filepath], cache=cache)), [(filepath, [])]
+        )
+        self.assertEqual(cache.misses, 1)
+
+    def test_cache_touched_file_is_hashed_not_validated(self):
+        """Test a new modification time alone does not revalidate."""
+        filepath = self._create_temp_file("module.py", COMPLIANT)
+        cache_file = os.path.join(self.temp_dir, "results.json")
+        cache = ResultCache(cache_file, "v1")
+        list(validate_files([filepath], cache=cache))
+        cache.save()
+
+        os.utime(filepath, (1, 1))
+        cache = ResultCache(cache_file, "v1")
+        self.assertEqual(cache.get(filepath), [])
+        self.assertEqual(cache.hits, 1)
+
+    def test_cache_version_mismatch_discards_entries(self):
+        """Test results of another checker version are ignored."""
+        filepath = self._create_temp_file("module.py", COMPLIANT)
+        cache_file = os.path.join(self.temp_dir, "results.json")
+        cache = ResultCache(cache_file, "v1")
+        list(validate_files([filepath], cache=cache))
+        cache.save()
+
+        self.assertIsNone(ResultCache(cache_file, "v2").get(filepath))
+        self.assertEqual(ResultCache(cache_file, "v1").get(filepath), [])
+
+    def test_checker_version_includes_docstring_parser(self):
+        """Test a docstring_parser upgrade expires cached results."""
+        versions = []
+        for version in ("1.0", "2.0"):
+            site = os.path.join(self.temp_dir, version)
+            os.makedirs(
+                os.path.join(site, f"docstring_parser-{version}.dist-info")
+            )
+            with unittest.mock.patch.object(sys, "path", [site]):
+                self.assertEqual(
+                    check_docstrings.installed_version("docstring_parser"),
+                    version,
+                )
+                versions.append(check_docstrings.checker_version("ast"))
+        self.assertNotEqual(versions[0], versions[1])
+        with unittest.mock.patch.object(sys, "path", [self.temp_dir]):
+            self.assertEqual(
+                check_docstrings.installed_version("docstring_parser"),
+                "unknown",
+            )
+
+    def test_cache_size_is_bounded(self):
+        """Test the least recently used entries are evicted on save."""
+        file_paths = [
+            self._create_temp_file(f"pkg/mod{n}.py", COMPLIANT)
+            for n in range(5)
+        ]
+        cache_file = os.path.join(self.temp_dir, "results.json")
+        cache = ResultCache(cache_file, "v1", max_entries=3)
+        for file_path in file_paths:
+            list(validate_files([file_path], cache=cache))
+        cache.save()
+
+        cache = ResultCache(cache_file, "v1", max_entries=3)
+        self.assertEqual(
+            sorted(cache.entries),
+            sorted(os.path.abspath(path) for path in file_paths[-3:]),
+        )
+
+    # ========== Discovery Tests ==========
+
+    def test_discover_prunes_excluded_directories(self):
+        """Test excluded names and paths are never searched."""
+        expected = [
+            self._create_temp_file("b.py", COMPLIANT),
+            self._create_temp_file("a/mod.py", COMPLIANT),
+        ]
+        self._create_temp_file("node_modules/pkg/mod.py", "def bad(x):\n")
+        self._create_temp_file("a/.venv/lib/mod.py", "def bad(x):\n")
+        self._create_temp_file("skip/mod.py", "def bad(x):\n")
+        self._create_temp_file("a/notes.txt", "")
+        exclude_dirs = list(DEFAULT_EXCLUDE_DIRS) + [
+            os.path.join(self.temp_dir, "skip")
+        ]
+        found = discover_files(self.temp_dir, exclude_dirs=exclude_dirs)
+        self.assertNotIsInstance(found, list)
+        self.assertEqual(list(found), expected)
+
+    def test_discover_with_git_honours_gitignore(self):
+        """Test git listing skips ignored files and keeps untracked ones."""
+        try:
+            subprocess.run(
+                ["git", "init", "-q", self.temp_dir],
+                check=True,
+                capture_output=True,
+            )
+        except (OSError, subprocess.CalledProcessError):
+            self.skipTest("git is not available")
+        self._create_temp_file(".gitignore", "generated/\n")
+        kept = self._create_temp_file("pkg/mod.py", COMPLIANT)
+        self._create_temp_file("generated/mod.py", "def bad(x):\n")
+        self.assertEqual(
+            list(discover_files(self.temp_dir, use_git=True)), [kept]
+        )
+
+    def test_discover_with_git_falls_back_outside_work_tree(self):
+        """Test directories outside git are walked instead."""
+        kept = self._create_temp_file("mod.py", COMPLIANT)
+        with unittest.mock.patch.object(
+            check_docstrings, "git_files", return_value=None
+        ):
+            self.assertEqual(
+                list(discover_files(self.temp_dir, use_git=True)), [kept]
+            )
+
+    # ========== Multi-directory Tests ==========
+
+    def test_check_directories_deduplicates_overlaps(self):
+        """Test a file reached through several directories is checked once."""
+        bad = self._create_temp_file(
+            "pkg/sub/mod.py", "def func(value):\n    return value\n"
+        )
+        seen = []
+        with unittest.mock.patch.dict(
+            check_docstrings.ENGINES,
+            {
+                "line": lambda path: seen.append(path)
+                or validate_docstring(path)
+            },
+        ):
+            violations = check_directories(
+                [
+                    os.path.join(self.temp_dir, "pkg"),
+                    os.path.join(self.temp_dir, "pkg", "sub"),
+                    self.temp_dir + os.sep + "pkg" + os.sep,
+                ]
+            )
+        self.assertEqual(seen, [bad])
+        self.assertEqual(list(violations), [bad])
+
+    def test_main_reports_every_directory(self):
+        """Test main reports all directories before exiting."""
+        first = self._create_temp_file(
+            "one/mod.py", "def one(value):\n    return value\n"
+        )
+        second = self._create_temp_file(
+            "two/mod.py", "def two(value):\n    return value\n"
+        )
+        argv = [
+            "check_docstrings.py",
+            "--directories",
+            os.path.dirname(first),
+            os.path.dirname(second),
+        ]
+        output = io.StringIO()
+        with unittest.mock.patch.object(
+            sys, "argv", argv
+        ), contextlib.redirect_stdout(output):
+            with self.assertRaises(SystemExit) as raised:
+                check_docstrings.main()
+        self.assertEqual(raised.exception.code, 1)
+        self.assertIn(first, output.getvalue())
+        self.assertIn(second, output.getvalue())
+        self.assertIn("There are 2 docstring violations", output.getvalue())
+
+    # ========== Structured Output Tests ==========
+
+    def _run_main(self, *arguments):
+        """Run main and return its exit code and output."""
+        argv = ["check_docstrings.py", *arguments]
+        output = io.StringIO()
+        code = 0
+        with unittest.mock.patch.object(
+            sys, "argv", argv
+        ), contextlib.redirect_stdout(output):
+            try:
+                check_docstrings.main()
+            except SystemExit as raised:
+                code = raised.code
+        return code, output.getvalue()
+
+    def test_violation_messages_come_from_the_table(self):
+        """Test violations store a code and format the shared messages."""
+        violation = Violation(3, "func", "DOC206", ["extra"])
+        self.assertEqual(violation, (3, "func", "DOC206", ("extra",)))
+        self.assertEqual(
+            violation.issue,
+            "Argument 'extra' defined in the docstring is not an argument "
+            "in the function",
+        )
+        self.assertEqual(
+            violation.action, "Remove argument 'extra' from the docstring"
+        )
+        self.assertFalse(hasattr(violation, "__dict__"))
+        self.assertTrue(all(code.startswith("DOC") for code in MESSAGES))
+
+    def test_every_reported_code_is_in_the_table(self):
+        """Test the engines only report known rule codes."""
+        filepath = self._create_temp_file(
+            "module.py",
+            '''\
+            def undocumented(value):
+                return value
+
+
+            def wrong(value):
+                """Wrong arguments.
+
+                Args:
+                    other: Other
+
+                Returns:
+                    None
+
+                """
+            ''',
+        )
+        violations = validate_docstring_ast(filepath)
+        self.assertEqual([v.code for v in violations], ["DOC001", "DOC205"])
+
+    def test_format_json(self):
+        """Test the JSON report lists every violation."""
+        bad = self._create_temp_file(
+            "mod.py", "def func(value):\n    return value\n"
+        )
+        code, output = self._run_main(
+            "--directories",
+            self.temp_dir,
+            "--format",
+            "json",
+            "--engine",
+            "ast",
+        )
+        self.assertEqual(code, 1)
+        self.assertEqual(
+            json.loads(output),
+            [
+                {
+                    "path": bad,
+                    "line": 1,
+                    "function": "func",
+                    "code": "DOC001",
+                    "issue": MESSAGES["DOC001"][0],
+                    "action": MESSAGES["DOC001"][1],
+                }
+            ],
+        )
+
+    def test_format_json_without_violations(self):
+        """Test a clean JSON report is an empty array."""
+        self._create_temp_file("mod.py", COMPLIANT)
+        code, output = self._run_main(
+            "--directories", self.temp_dir, "--format", "json"
+        )
+        self.assertEqual((code, json.loads(output)), (0, []))
+
+    def test_format_sarif(self):
+        """Test the SARIF report has results and rule descriptions."""
+        self._create_temp_file("one.py", "def one(value):\n    return value\n")
+        self._create_temp_file("two.py", "def two(value):\n    return value\n")
+        code, output = self._run_main(
+            "--directories",
+            self.temp_dir,
+            "--format",
+            "sarif",
+            "--engine",
+            "ast",
+        )
+        self.assertEqual(code, 1)
+        run = json.loads(output)["runs"][0]
+        self.assertEqual(
+            [result["ruleId"] for result in run["results"]],
+            ["DOC001", "DOC001"],
+        )
+        location = run["results"][0]["locations"][0]["physicalLocation"]
+        self.assertTrue(location["artifactLocation"]["uri"].endswith("one.py"))
+        self.assertEqual(location["region"]["startLine"], 1)
+        self.assertEqual(
+            {rule["id"] for rule in run["tool"]["driver"]["rules"]},
+            set(MESSAGES),
+        )
+
+    def test_negative_jobs_is_a_usage_error(self):
+        """Test --jobs below 0 is rejected before any file is checked."""
+        with contextlib.redirect_stderr(io.StringIO()) as errors:
+            code, _ = self._run_main(
+                "--directories", self.temp_dir, "--jobs", "-1"
+            )
+        self.assertEqual(code, 2)
+        self.assertIn("--jobs must be 0 or more", errors.getvalue())
+
+    def test_negative_max_violations_is_a_usage_error(self):
+        """Test --max-violations below 0 is rejected."""
+        with contextlib.redirect_stderr(io.StringIO()) as errors:
+            code, _ = self._run_main(
+                "--directories", self.temp_dir, "--max-violations", "-1"
+            )
+        self.assertEqual(code, 2)
+        self.assertIn("--max-violations must be 0 or more", errors.getvalue())
+
+    def test_cache_size_below_one_is_a_usage_error(self):
+        """Test --cache-size must leave room for at least one entry."""
+        for size in ("0", "-1"):
+            with contextlib.redirect_stderr(io.StringIO()) as errors:
+                code, _ = self._run_main(
+                    "--directories", self.temp_dir, "--cache-size", size
+                )
+            self.assertEqual(code, 2)
+            self.assertIn("--cache-size must be 1 or more", errors.getvalue())
+
+    def test_text_report_is_sorted_by_file(self):
+        """Test the text report lists files in sorted order."""
+        second = self._create_temp_file(
+            "pkg/b.py", "def two(value):\n    return value\n"
+        )
+        first = self._create_temp_file(
+            "pkg/a.py", "def one(value):\n    return value\n"
+        )
+        code, output = self._run_main("--files", second, first)
+        self.assertEqual(code, 1)
+        self.assertEqual(
+            re.findall(r"File Docstring Error: (.*)", output), [first, second]
+        )
+
+    def test_reporter_requires_write(self):
+        """Test reporters must implement write."""
+        with self.assertRaises(TypeError):
+            check_docstrings.Reporter(io.StringIO())
+
+    # ========== Changed Files Tests ==========
+
+    def _git(self, *arguments):
+        """Run git in the temporary directory."""
+        subprocess.run(
+            [
+                "git",
+                "-c",
+                "user.name=test",
+                "-c",
+                "user.email=t@t",
+                *arguments,
+            ],
+            cwd=self.temp_dir,
+            check=True,
+            capture_output=True,
+        )
+
+    def _init_repository(self):
+        """Commit two files with two undocumented functions each."""
+        try:
+            self._git("init", "-q")
+        except (OSError, subprocess.CalledProcessError):
+            self.skipTest("git is not available")
+        for name in ("one.py", "two.py"):
+            self._create_temp_file(
+                name,
+                "def first(value):\n    return value\n\n\n"
+                "def second(value):\n    return value\n",
+            )
+        self._git("add", ".")
+        self._git("commit", "-q", "-m", "initial")
+        cwd = os.getcwd()
+        os.chdir(self.temp_dir)
+        self.addCleanup(os.chdir, cwd)
+
+    def test_files_option_limits_validation(self):
+        """Test --files validates only the listed Python files."""
+        bad = self._create_temp_file(
+            "bad.py", "def func(value):\n    return value\n"
+        )
+        self._create_temp_file("other.py", "def func(value):\n    pass\n")
+        self._create_temp_file("notes.txt", "")
+        code, output = self._run_main(
+            "--format",
+            "json",
+            "--files",
+            bad,
+            os.path.join(self.temp_dir, "notes.txt"),
+        )
+        self.assertEqual(code, 1)
+        self.assertEqual([item["path"] for item in json.loads(output)], [bad])
+
+    def test_since_lists_changed_and_untracked_files(self):
+        """Test --since validates modified and new files only."""
+        self._init_repository()
+        with open("two.py", "a", encoding="utf-8") as f:
+            f.write("\n\ndef third(value):\n    return value\n")
+        self._create_temp_file("new/three.py", COMPLIANT)
+        self.assertEqual(
+            check_docstrings.changed_files("HEAD"),
+            ["new/three.py", "two.py"],
+        )
+        code, output = self._run_main("--format", "json", "--since", "HEAD")
+        self.assertEqual(code, 1)
+        self.assertEqual(
+            [item["function"] for item in json.loads(output)],
+            ["first", "second", "third"],
+        )
+
+    def test_changed_functions_only_reports_touched_functions(self):
+        """Test --changed-functions drops untouched functions."""
+        self._init_repository()
+        self._create_temp_file("new.py", "def func(value):\n    pass\n")
+        self._create_temp_file(
+            "one.py",
+            "def first(value):\n    return value\n\n\n"
+            "def second(value):\n    return value + 1\n",
+        )
+        code, output = self._run_main(
+            "--format",
+            "json",
+            "--files",
+            "one.py",
+            "two.py",
+            "new.py",
+            "--changed-functions",
+            "--engine",
+            "ast",
+        )
+        self.assertEqual(code, 1)
+        self.assertEqual(
+            [(item["path"], item["function"]) for item in json.loads(output)],
+            [("new.py", "func"), ("one.py", "second")],
+        )
+
+    def test_since_rejects_unknown_reference(self):
+        """Test an unknown git reference is a usage error."""
+        self._init_repository()
+        with contextlib.redirect_stderr(io.StringIO()):
+            code, _ = self._run_main("--since", "no-such-ref")
+        self.assertEqual(code, 2)
+
+    # ========== Tracing Tests ==========
+
+    def test_span_is_a_shared_no_op_when_disabled(self):
+        """Test disabled tracing allocates nothing per span."""
+        self.assertIs(check_docstrings.span("a"), check_docstrings.span("b"))
+
+    def test_tracer_records_phases(self):
+        """Test enabled tracing records the phases of the AST engine."""
+        filepath = self._create_temp_file("module.py", COMPLIANT)
+        tracer = check_docstrings.Tracer()
+        check_docstrings.set_tracer(tracer)
+        self.addCleanup(check_docstrings.set_tracer, None)
+        validate_docstring_ast(filepath)
+        names = {event["name"] for event in tracer.events}
+        self.assertTrue(
+            {
+                "read",
+                "ast.parse",
+                "ast_docstring",
+                "docstring_parser.parse",
+                "evaluate_docstring_args",
+                "match_arguments_to_docstring",
+            }.issubset(names)
+        )
+        self.assertTrue(all(event["ph"] == "X" for event in tracer.events))
+        self.assertTrue(all(event["dur"] >= 0 for event in tracer.events))
+        summary = tracer.summary(top=2).splitlines()
+        self.assertEqual(len(summary), 3)
+
+    def test_main_writes_chrome_trace(self):
+        """Test --trace writes a trace and validates in one process."""
+        self._create_temp_file("pkg/mod.py", COMPLIANT)
+        trace = os.path.join(self.temp_dir, "trace.json")
+        errors = io.StringIO()
+        with unittest.mock.patch.object(
+            check_docstrings, "_validate_uncached"
+        ) as pool, contextlib.redirect_stderr(errors):
+            code, _ = self._run_main(
+                "--directories",
+                os.path.join(self.temp_dir, "pkg"),
+                "--jobs",
+                "4",
+                "--trace",
+                trace,
+            )
+        self.assertEqual(code, 0)
+        pool.assert_not_called()
+        with open(trace, encoding="utf-8") as f:
+            events = json.load(f)["traceEvents"]
+        self.assertIn("file", {event["name"] for event in events})
+        self.assertIn("calls", errors.getvalue())
+        self.assertIsNone(check_docstrings._TRACER)
+
+    def test_main_prints_memory_report(self):
+        """Test --memory-report names phases and files in one process."""
+        filepath = self._create_temp_file("pkg/mod.py", COMPLIANT)
+        errors = io.StringIO()
+        with unittest.mock.patch.object(
+            check_docstrings, "_validate_uncached"
+        ) as pool, contextlib.redirect_stderr(errors):
+            code, _ = self._run_main(
+                "--directories",
+                os.path.dirname(filepath),
+                "--jobs",
+                "4",
+                "--memory-report",
+                "--engine",
+                "ast",
+            )
+        self.assertEqual(code, 0)
+        pool.assert_not_called()
+        report = errors.getvalue()
+        for phase in ("read", "ast.parse", "report"):
+            self.assertRegex(report, rf"\n{re.escape(phase)} +\d")
+        self.assertIn(f"KiB  {filepath}", report)
+        self.assertIsNone(check_docstrings._MEMORY)
+        self.assertFalse(tracemalloc.is_tracing())
+
+    # ========== Function Results Tests ==========
+
+    def _module(self, count, edited=None, header=""):
+        """Return a module of functions with one faulty docstring each."""
+        functions = []
+        for n in range(count):
+            name = "value" if n == edited else "other"
+            functions.append(
+                f'def func{n}(value):\n    """Do it.\n\n    Args:\n'
+                f"        {name}: Value\n\n    Returns:\n"
+                '        None\n\n    """\n    return value\n\n\n'
+            )
+        return header + "".join(functions)
+
+    def _validate_counting(self, file_paths, cache):
+        """Validate with a cache and count evaluated functions."""
+        with unittest.mock.patch.object(
+            check_docstrings,
+            "evaluate_function_ast",
+            wraps=check_docstrings.evaluate_function_ast,
+        ) as evaluate:
+            results = list(
+                validate_files(file_paths, engine="ast", cache=cache)
+            )
+        return results, evaluate.call_count
+
+    def test_only_changed_functions_are_evaluated(self):
+        """Test an edit re-evaluates only the edited function."""
+        filepath = self._create_temp_file("module.py", self._module(40))
+        cache_file = os.path.join(self.temp_dir, "results.json")
+        _, evaluated = self._validate_counting(
+            [filepath], ResultCache(cache_file, "v1")
+        )
+        self.assertEqual(evaluated, 40)
+
+        cache = ResultCache(cache_file, "v1")
+        list(validate_files([filepath], engine="ast", cache=cache))
+        cache.save()
+        self._create_temp_file("module.py", self._module(40, edited=7))
+        cache = ResultCache(cache_file, "v1")
+        results, evaluated = self._validate_counting([filepath], cache)
+        self.assertEqual(evaluated, 1)
+        self.assertEqual(
+            results, [(filepath, validate_docstring_ast(filepath))]
+        )
+
+    def test_unchanged_functions_move_with_their_lines(self):
+        """Test reused violations are remapped to the new line numbers."""
+        filepath = self._create_temp_file("module.py", self._module(5))
+        cache_file = os.path.join(self.temp_dir, "results.json")
+        cache = ResultCache(cache_file, "v1")
+        list(validate_files([filepath], engine="ast", cache=cache))
+        cache.save()
+
+        self._create_temp_file(
+            "module.py", self._module(5, header="# Moved\n\n\n")
+        )
+        cache = ResultCache(cache_file, "v1")
+        [(_, violations)], evaluated = self._validate_counting(
+            [filepath], cache
+        )
+        self.assertEqual(evaluated, 0)
+        self.assertEqual(violations, validate_docstring_ast(filepath))
+        self.assertEqual(violations[0].line, 4)
+
+    def test_functions_are_not_fingerprinted_without_cache(self):
+        """Test uncached validation skips the function fingerprints."""
+        filepath = self._create_temp_file("module.py", self._module(5))
+        with unittest.mock.patch.object(
+            check_docstrings, "function_fingerprint"
+        ) as fingerprint:
+            violations = validate_docstring_ast(filepath)
+            list(check_docstrings.iter_violations_ast(filepath))
+        fingerprint.assert_not_called()
+        self.assertEqual(len(violations), 5)
+
+    # ========== Streaming Tests ==========
+
+    def test_iter_violations_ast_is_lazy(self):
+        """Test functions are only evaluated as violations are consumed."""
+        filepath = self._create_temp_file("module.py", self._module(10))
+        with unittest.mock.patch.object(
+            check_docstrings,
+            "evaluate_function_ast",
+            wraps=check_docstrings.evaluate_function_ast,
+        ) as evaluate:
+            violations = check_docstrings.iter_violations_ast(filepath)
+            self.assertEqual(evaluate.call_count, 0)
+            first = next(violations)
+            self.assertEqual(evaluate.call_count, 1)
+        self.assertEqual(first, validate_docstring_ast(filepath)[0])
+
+    def test_iter_violations_matches_line_engine(self):
+        """Test the line engine generator yields the same violations."""
+        filepath = self._create_temp_file("module.py", self._module(5))
+        self.assertEqual(
+            list(check_docstrings.iter_violations(filepath)),
+            validate_docstring(filepath),
+        )
+
+    def test_fail_fast_stops_at_first_violation(self):
+        """Test --fail-fast reports one violation and evaluates no more."""
+        self._create_temp_file("one.py", self._module(5))
+        self._create_temp_file("two.py", self._module(5))
+        with unittest.mock.patch.object(
+            check_docstrings,
+            "evaluate_function_ast",
+            wraps=check_docstrings.evaluate_function_ast,
+        ) as evaluate, contextlib.redirect_stderr(io.StringIO()):
+            code, output = self._run_main(
+                "--directories",
+                self.temp_dir,
+                "--format",
+                "json",
+                "--fail-fast",
+                "--engine",
+                "ast",
+            )
+        self.assertEqual(code, 1)
+        self.assertEqual(len(json.loads(output)), 1)
+        self.assertEqual(evaluate.call_count, 1)
+
+    def test_max_violations_limits_the_report(self):
+        """Test --max-violations stops across files at the limit."""
+        self._create_temp_file("one.py", self._module(2))
+        self._create_temp_file("two.py", self._module(2))
+        with contextlib.redirect_stderr(io.StringIO()) as errors:
+            code, output = self._run_main(
+                "--directories",
+                self.temp_dir,
+                "--format",
+                "json",
+                "--max-violations",
+                "3",
+            )
+        self.assertEqual(code, 1)
+        self.assertEqual(len(json.loads(output)), 3)
+        self.assertIn("Stopped after 3", errors.getvalue())
+
+    def test_max_violations_stops_discovery(self):
+        """Test a directory run stops walking once the limit is reached."""
+        for name in ("a", "b", "c", "d"):
+            self._create_temp_file(f"{name}/mod.py", self._module(1))
+        found = []
+        discover_files = check_docstrings.discover_files
+
+        def recording_discover_files(*args, **kwargs):
+            """Record each file as discovery produces it."""
+            for file_path in discover_files(*args, **kwargs):
+                found.append(file_path)
+                yield file_path
+
+        with unittest.mock.patch.object(
+            check_docstrings, "discover_files", recording_discover_files
+        ), contextlib.redirect_stderr(io.StringIO()):
+            code, output = self._run_main(
+                "--directories",
+                self.temp_dir,
+                "--format",
+                "json",
+                "--max-violations",
+                "1",
+            )
+        self.assertEqual(code, 1)
+        self.assertEqual(
+            [_["path"] for _ in json.loads(output)],
+            [os.path.join(self.temp_dir, "a", "mod.py")],
+        )
+        self.assertEqual(len(found), 1)
+
+    # ========== Startup Tests ==========
+
+    def _run_python(self, *arguments):
+        """Run Python in the scripts directory and return its output."""
+        return subprocess.run(
+            [sys.executable, *arguments],
+            cwd=str(SCRIPTS_DIR),
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+
+    def test_import_skips_heavy_dependencies(self):
+        """Test importing the checker stays within its import budget."""
+        result = self._run_python(
+            "-X", "importtime", "-c", "import check_docstrings"
+        )
+        imports = {}
+        for line in result.stderr.splitlines():
+            if line.startswith("import time:") and "|" in line:
+                _, cumulative, name = line.split("|")
+                if cumulative.strip().isdigit():
+                    imports[name.strip()] = int(cumulative)
+        self.assertNotIn("docstring_parser", imports)
+        self.assertNotIn("subprocess", imports)
+        self.assertLess(imports["check_docstrings"], IMPORT_BUDGET_US)
+
+    def test_no_op_run_does_not_import_docstring_parser(self):
+        """Test docstring_parser is only imported to parse a docstring."""
+        self._create_temp_file("empty/notes.txt", "")
+        self._create_temp_file("full/mod.py", COMPLIANT)
+        script = (
+            "import sys, check_docstrings\n"
+            "sys.argv = ['check_docstrings.py', '--directories', sys.argv[1]]\n"
+            "check_docstrings.main()\n"
+            "print('docstring_parser' in sys.modules)\n"
+        )
+        for directory, imported in (("empty", "False"), ("full", "True")):
+            result = self._run_python(
+                "-c", script, os.path.join(self.temp_dir, directory)
+            )
+            self.assertEqual(result.stdout.strip(), imported)
+
+    def test_cached_run_imports_no_metadata_parser_or_ast(self):
+        """Test a fully cached run skips the slow imports."""
+        self._create_temp_file("full/mod.py", COMPLIANT)
+        cache_file = os.path.join(self.temp_dir, "results.json")
+        script = (
+            "import sys, check_docstrings\n"
+            "sys.argv = ['check_docstrings.py', '--directories', sys.argv[1],"
+            " '--cache-file', sys.argv[2]]\n"
+            "check_docstrings.main()\n"
+            "print('docstring_parser' in sys.modules,"
+            " 'importlib.metadata' in sys.modules, 'ast' in sys.modules)\n"
+        )
+        directory = os.path.join(self.temp_dir, "full")
+        self._run_python("-c", script, directory, cache_file)
+        result = self._run_python("-c", script, directory, cache_file)
+        self.assertEqual(result.stdout.strip(), "False False False")
+
+    # ========== Docstring Sections Tests ==========
+
+    def test_docstring_sections_single_pass(self):
+        """Test the sections match the former normalised text searches."""
+        sections = check_docstrings.docstring_sections(
+            '"""Summary.\n\n    Args:\n        None\n\n    Returns:\n'
+            '        result: Value\n    """',
+            None,
+        )
+        self.assertEqual(sections[1:], (True, True, True, False, "Value"))
+
+    def test_docstring_sections_edge_cases(self):
+        """Test marker words must be followed by two more words."""
+        sections = check_docstrings.docstring_sections
+        # 'None' is the last word, so it does not empty the section
+        self.assertFalse(sections("Args: None", None).args_none)
+        # The description of the last 'Returns:' entry is used
+        self.assertEqual(
+            sections(
+                "Text Returns: a: first Returns: b: -second", None
+            ).returns_name,
+            "",
+        )
+        # 'Returns:' as the first word is not an entry
+        self.assertIsNone(sections("Returns: value: text", None).returns_name)
+        # The entry name needs at least one character before the colon
+        self.assertIsNone(sections("x Returns: : text", None).returns_name)
+
+    # ========== Parse Cache Tests ==========
+
+    def test_parse_cache_shares_indented_copies(self):
+        """Test identical docstrings at any indentation share a result."""
+        cache = check_docstrings.ParseCache(max_entries=4)
+        text = '"""Do it.\n\n    Args:\n        value: Value\n    """'
+        indented = text.replace("\n    ", "\n            ")
+        first = cache.parse(text)
+        self.assertIs(cache.parse("        " + indented), first)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual([_.arg_name for _ in first.params], ["value"])
+
+    def test_parse_cache_is_bounded_lru(self):
+        """Test the least recently used docstring is evicted."""
+        cache = check_docstrings.ParseCache(max_entries=2)
+        cache.parse('"""One."""')
+        cache.parse('"""Two."""')
+        cache.parse('"""One."""')
+        cache.parse('"""Three."""')
+        self.assertEqual(list(cache.entries), ['"""One."""', '"""Three."""'])
+
+    def test_parse_cache_remembers_errors(self):
+        """Test parsing errors are raised again without reparsing."""
+        cache = check_docstrings.ParseCache()
+        text = '"""Do it.\n\n    :: :\n    """'
+        with self.assertRaises(Exception) as first:
+            cache.parse(text)
+        with self.assertRaises(Exception) as second:
+            cache.parse(text)
+        self.assertEqual(str(first.exception), str(second.exception))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_trace_reports_parse_cache_counts(self):
+        """Test the trace and its summary include the parse cache counts."""
+        self._create_temp_file("one.py", COMPLIANT)
+        self._create_temp_file("two.py", COMPLIANT)
+        trace = os.path.join(self.temp_dir, "trace.json")
+        self.addCleanup(check_docstrings.configure_parse_cache, 1024)
+        with contextlib.redirect_stderr(io.StringIO()) as errors:
+            self._run_main("--directories", self.temp_dir, "--trace", trace)
+        with open(trace, encoding="utf-8") as f:
+            events = json.load(f)["traceEvents"]
+        counters = [_ for _ in events if _["name"] == "parse_cache"]
+        self.assertEqual(counters[0]["args"], {"hits": 2, "misses": 2})
+        self.assertIn("parse_cache: hits=2, misses=2", errors.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
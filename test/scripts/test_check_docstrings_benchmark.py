@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Test suite for check_docstrings_benchmark.py.
+
+This module tests the synthetic module generator and the JSON results of
+the docstring checker benchmark.
+"""
+
+import ast
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add the scripts directory to the path
+SCRIPTS_DIR = (
+    Path(__file__).parent.parent.parent / ".github" / "workflows" / "scripts"
+)
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import check_docstrings  # noqa: E402
+from check_docstrings import validate_docstring_ast  # noqa: E402
+from check_docstrings_benchmark import (  # noqa: E402
+    _best_time,
+    build_corpus,
+    generate_module,
+)
+
+
+class TestCheckDocstringsBenchmark(unittest.TestCase):
+    """Test cases for the docstring checker benchmark."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+
+    def test_generate_module_shape(self):
+        """Test the module has the requested functions and signatures."""
+        source = generate_module(
+            random.Random(1),
+            functions=20,
+            arguments=5,
+            docstring_ratio=1.0,
+            decorator_ratio=1.0,
+        )
+        functions = [
+            node
+            for node in ast.parse(source).body
+            if isinstance(node, ast.FunctionDef)
+        ]
+        self.assertEqual(len(functions), 20)
+        self.assertTrue(all(len(node.args.args) == 5 for node in functions))
+        self.assertTrue(all(node.decorator_list for node in functions))
+        self.assertTrue(all(ast.get_docstring(node) for node in functions))
+
+    def test_generated_modules_have_violations_to_find(self):
+        """Test the default corpus mixes compliant and faulty functions."""
+        directory = os.path.join(self.temp_dir.name, "corpus")
+        file_paths = build_corpus(directory, seed=3, file_count=2)
+        codes = {
+            violation.code
+            for path in file_paths
+            for violation in validate_docstring_ast(path)
+        }
+        self.assertIn("DOC001", codes)
+        self.assertGreater(len(codes), 2)
+
+    def test_best_time_starts_each_run_cold(self):
+        """Test every run sees an empty parse cache unless warm."""
+        misses = []
+
+        def run():
+            """Parse one docstring and record the cache misses so far."""
+            check_docstrings._PARSE_CACHE.parse("Summary.")
+            misses.append(check_docstrings._PARSE_CACHE.misses)
+
+        _best_time(run, 3)
+        self.assertEqual(misses, [1, 1, 1])
+
+        misses.clear()
+        _best_time(run, 3, warm=True)
+        self.assertEqual(misses, [1, 1, 1, 1])
+        self.assertEqual(check_docstrings._PARSE_CACHE.hits, 3)
+
+    def test_main_writes_json(self):
+        """Test the benchmark writes timings for every phase."""
+        output = os.path.join(self.temp_dir.name, "results.json")
+        subprocess.run(
+            [
+                sys.executable,
+                str(SCRIPTS_DIR / "check_docstrings_benchmark.py"),
+                "--files",
+                "2",
+                "--functions",
+                "5",
+                "--repetitions",
+                "1",
+                "--output",
+                output,
+            ],
+            check=True,
+            capture_output=True,
+        )
+        with open(output, encoding="utf-8") as f:
+            results = json.load(f)
+        self.assertEqual(results["corpus"]["files"], 2)
+        self.assertEqual(
+            set(results["phases"]),
+            {
+                "discover",
+                "read_and_parse",
+                "validate_docstring",
+                "validate_docstring_warm",
+                "validate_docstring_ast",
+                "check_directory",
+            },
+        )
+        for phase in results["phases"].values():
+            self.assertGreater(phase["functions_per_second"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
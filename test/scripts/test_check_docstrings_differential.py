@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""Test suite for check_docstrings_differential.py.
+
+This module tests the synthetic corpora of the differential harness and
+that every docstring checker engine matches the reference engine on them.
+"""
+
+import ast
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+
+# Add the scripts directory to the path
+SCRIPTS_DIR = (
+    Path(__file__).parent.parent.parent / ".github" / "workflows" / "scripts"
+)
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from check_docstrings import Violation, validate_docstring_ast  # noqa: E402
+from check_docstrings_differential import (  # noqa: E402
+    DOCSTRING_KINDS,
+    ENGINES,
+    _ast_expected,
+    _reference,
+    build_corpus,
+    compare,
+)
+
+# Documented function following the function under test
+DOCUMENTED = '''
+
+def other(value):
+    """Do it.
+
+    Args:
+        value: Value
+
+    Returns:
+        None
+
+    """
+    return value
+'''
+
+
+class TestCheckDocstringsDifferential(unittest.TestCase):
+    """Test cases for the docstring checker differential harness."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+
+    def _source(self, corpus):
+        """Build a corpus and return its concatenated source.
+
+        Args:
+            corpus: Name of the corpus.
+
+        Returns:
+            source: Source of every module of the corpus.
+        """
+        file_paths = build_corpus(self.temp_dir.name, 5, 20, 12, corpus)
+        return "".join(Path(path).read_text() for path in file_paths)
+
+    def test_corpora_cover_tricky_constructs(self):
+        """Test the corpora exercise the constructs engines disagree on."""
+        common = self._source("common")
+        for construct in (
+            "    @size.setter\n",
+            "    @property\n",
+            "    @classmethod\n",
+            "@decorator\n",
+            "(\n        value0",
+            "Args:\n        None\n",
+            "Returns:\n        None\n",
+        ):
+            self.assertIn(construct, common)
+        self.assertNotIn("async def", common)
+
+        full = self._source("full")
+        self.assertIn("async def", full)
+        self.assertIn('"""Do something."""', full)
+
+    def test_common_corpus_parses(self):
+        """Test the AST engines do not fall back to the line engine."""
+        file_paths = build_corpus(self.temp_dir.name, 5, 20, 12, "common")
+        for path in file_paths:
+            ast.parse(Path(path).read_text())
+
+    def test_engines_match_reference(self):
+        """Test every engine reports the violations of the reference."""
+        rows = compare(self.temp_dir.name, 11, 10, 12)
+        self.assertEqual(
+            {(row["engine"], row["corpus"]) for row in rows},
+            {(name, corpus) for name in ENGINES for corpus in DOCSTRING_KINDS},
+        )
+        for row in rows:
+            self.assertGreater(row["violations"], 0)
+            self.assertEqual(row["mismatches"], [], row["engine"])
+
+    def test_ast_engine_differs_on_full_corpus(self):
+        """Test the full corpus has the cases the AST engine fixes."""
+        engines = {"ast": (validate_docstring_ast, None)}
+        rows = compare(self.temp_dir.name, 11, 10, 12, engines)
+        self.assertEqual(
+            [(row["corpus"], bool(row["mismatches"])) for row in rows],
+            [("common", False), ("full", True)],
+        )
+
+    def test_ast_expected_fixtures(self):
+        """Test the adjusted reference on each case the AST engine fixes."""
+        cases = {
+            "missing": (
+                "def func(value):\n    return value\n" + DOCUMENTED,
+                [Violation(1, "func", "DOC001")],
+            ),
+            "single_line": (
+                'def func(value):\n    """Do it."""\n' + DOCUMENTED,
+                [Violation(1, "func", "DOC002")],
+            ),
+            "async": (
+                textwrap.dedent('''\
+                    async def func(value):
+                        """Do it.
+
+                        Returns:
+                            None
+
+                        """
+                    '''),
+                [
+                    Violation(1, "func", "DOC201"),
+                    Violation(1, "func", "DOC205"),
+                ],
+            ),
+            "unclosed": (
+                'def func(value):\n    """Do it.\n\n    Args:\n',
+                [
+                    Violation(1, "func", "DOC002"),
+                    Violation(1, "func", "DOC003"),
+                ],
+            ),
+        }
+        for case, (source, violations) in cases.items():
+            with self.subTest(case):
+                path = os.path.join(self.temp_dir.name, f"{case}.py")
+                Path(path).write_text(source)
+                expected = _ast_expected(path, _reference(path))
+                self.assertEqual(expected, violations)
+                self.assertEqual(
+                    sorted(validate_docstring_ast(path)), expected
+                )
+
+    def test_mismatch_is_reported(self):
+        """Test an engine losing violations is caught."""
+        engines = {
+            "lossy": (lambda path: validate_docstring_ast(path)[1:], None)
+        }
+        rows = compare(self.temp_dir.name, 11, 3, 12, engines)
+        path, want, got = rows[0]["mismatches"][0]
+        self.assertEqual(want[1:], got)
+
+    def test_main_succeeds(self):
+        """Test the harness prints a table and exits cleanly."""
+        result = subprocess.run(
+            [
+                sys.executable,
+                str(SCRIPTS_DIR / "check_docstrings_differential.py"),
+                "--files",
+                "3",
+                "--functions",
+                "8",
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        self.assertIn("identical", result.stdout)
+        self.assertNotIn("differ", result.stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Test suite for disable_statements_benchmark.py.
+
+This module tests corpus generation and baseline comparison of the
+performance regression gate.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add the scripts directory to the path
+SCRIPTS_DIR = (
+    Path(__file__).parent.parent.parent / ".github" / "workflows" / "scripts"
+)
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from disable_statements_benchmark import (  # noqa: E402
+    build_corpus,
+    compare_metrics,
+    format_comparison,
+)
+
+TOLERANCES = {
+    "files_per_second": 0.15,
+    "megabytes_per_second": 0.15,
+    "peak_memory_kib": 0.10,
+}
+
+
+class TestDisableStatementsBenchmark(unittest.TestCase):
+    """Test cases for the disable statements benchmark."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+
+    def test_build_corpus_shape(self):
+        """Test the corpus has the requested number of source files."""
+        file_paths = build_corpus(self.temp_dir.name, seed=7, file_count=20)
+        self.assertEqual(len(file_paths), 20)
+        self.assertTrue(
+            all(path.endswith((".ts", ".tsx", ".js")) for path in file_paths)
+        )
+        self.assertTrue(
+            any("// @ts-ignore" in Path(_).read_text() for _ in file_paths)
+        )
+
+    def test_compare_metrics_within_tolerance(self):
+        """Test small changes are not regressions."""
+        baseline = {"files_per_second": 100.0, "peak_memory_kib": 500.0}
+        current = {"files_per_second": 90.0, "peak_memory_kib": 540.0}
+        rows = compare_metrics(baseline, current, TOLERANCES)
+        self.assertFalse(any(row[-1] for row in rows))
+
+    def test_compare_metrics_throughput_regression(self):
+        """Test a throughput drop beyond tolerance is a regression."""
+        rows = compare_metrics(
+            {"files_per_second": 100.0},
+            {"files_per_second": 80.0},
+            TOLERANCES,
+        )
+        self.assertEqual(rows[0][0], "files_per_second")
+        self.assertTrue(rows[0][-1])
+
+    def test_compare_metrics_memory_regression(self):
+        """Test peak memory growth beyond tolerance is a regression."""
+        rows = compare_metrics(
+            {"peak_memory_kib": 500.0}, {"peak_memory_kib": 600.0}, TOLERANCES
+        )
+        self.assertTrue(rows[0][-1])
+        # Using less memory is never a regression
+        rows = compare_metrics(
+            {"peak_memory_kib": 500.0}, {"peak_memory_kib": 100.0}, TOLERANCES
+        )
+        self.assertFalse(rows[0][-1])
+
+    def test_format_comparison_marks_regression(self):
+        """Test the comparison table names regressed metrics."""
+        rows = compare_metrics(
+            {"files_per_second": 100.0},
+            {"files_per_second": 50.0},
+            TOLERANCES,
+        )
+        table = format_comparison(rows, TOLERANCES)
+        self.assertIn("files_per_second", table)
+        self.assertIn("-50.0%", table)
+        self.assertIn("REGRESSION", table)
+
+    def test_main_exits_non_zero_on_regression(self):
+        """Test the command fails against an unreachable baseline."""
+        baseline = os.path.join(self.temp_dir.name, "baseline.json")
+        with open(baseline, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "corpus": {"seed": 1, "files": 5, "repo": "api"},
+                    "metrics": {
+                        "files_per_second": 1e12,
+                        "megabytes_per_second": 1e12,
+                        "peak_memory_kib": 1e12,
+                    },
+                },
+                f,
+            )
+        result = subprocess.run(
+            [
+                sys.executable,
+                str(SCRIPTS_DIR / "disable_statements_benchmark.py"),
+                "--baseline",
+                baseline,
+                "--seed",
+                "1",
+                "--files",
+                "5",
+                "--repetitions",
+                "1",
+            ],
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("REGRESSION", result.stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()
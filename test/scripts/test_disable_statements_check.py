@@ -5,10 +5,18 @@ This module tests the DisableStatementsChecker class that validates
 disable statements in API and Admin code.
 """
 
+import asyncio
+import contextlib
+import io
 import os
+import signal
 import sys
 import tempfile
+import threading
+import time
 import unittest
+import unittest.mock
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Add the scripts directory to the path
@@ -17,7 +25,19 @@ SCRIPTS_DIR = (
 )
 sys.path.insert(0, str(SCRIPTS_DIR))
 
-from disable_statements_check import DisableStatementsChecker  # noqa: E402
+import disable_statements_check  # noqa: E402
+from disable_statements_check import (  # noqa: E402
+    DisableStatementsChecker,
+    RuleSelector,
+    SkipPolicy,
+    load_rule_selector,
+    main,
+)
+from memory_report import MemoryReport  # noqa: E402
+
+# Generous per-input budget; a quadratic matcher needs minutes on this corpus
+ADVERSARIAL_BUDGET_SECONDS = 2.0
+MEGABYTE = 1024 * 1024
 
 
 class TestDisableStatementsChecker(unittest.TestCase):
@@ -288,6 +308,268 @@ const y = 2;
         self.assertEqual(len(violations), 1)
         self.assertIn("Error reading file", violations[0])
 
+    # ========== Generated File Classification Tests ==========
+
+    def test_check_file_skips_generated_glob(self):
+        """Test generated GraphQL typings are skipped by path."""
+        os.makedirs(os.path.join(self.temp_dir, "graphql"))
+        filepath = self._create_temp_file(
+            os.path.join("graphql", "gql.tada.d.ts"), "// @ts-ignore\n"
+        )
+        self.assertIsNotNone(self.checker.skip_reason_for_path(filepath))
+        self.assertEqual(self.checker.check_file(filepath, repo="api"), [])
+
+    def test_check_file_skips_directory_glob(self):
+        """Test globs containing a slash match against the whole path."""
+        os.makedirs(os.path.join(self.temp_dir, "fixtures"))
+        filepath = self._create_temp_file(
+            os.path.join("fixtures", "data.ts"), "// @ts-ignore\n"
+        )
+        checker = DisableStatementsChecker(
+            skip_policy=SkipPolicy(generated_globs=("*/fixtures/*",))
+        )
+        self.assertEqual(checker.check_file(filepath, repo="api"), [])
+        self.assertGreater(len(self.checker.check_file(filepath, "api")), 0)
+
+    def test_check_file_skips_large_file(self):
+        """Test files above the size threshold are skipped."""
+        filepath = self._create_temp_file(
+            "large.ts", "// @ts-ignore\n" + "const x = 1;\n" * 100
+        )
+        checker = DisableStatementsChecker(
+            skip_policy=SkipPolicy(max_file_size=100)
+        )
+        self.assertIn("size", checker.skip_reason_for_path(filepath))
+        self.assertEqual(checker.check_file(filepath, repo="api"), [])
+
+    def test_check_file_skips_nul_bytes(self):
+        """Test files with a NUL byte in the first block are skipped."""
+        filepath = os.path.join(self.temp_dir, "blob.ts")
+        with open(filepath, "wb") as f:
+            f.write(b"// @ts-ignore\n\x00\xff\xfe")
+        self.assertEqual(self.checker.check_file(filepath, repo="api"), [])
+
+    def test_check_file_skips_minified(self):
+        """Test files whose first block has a very long line are skipped."""
+        filepath = self._create_temp_file(
+            "bundle.js", "/* @ts-ignore */" + "var a=1;" * 1000
+        )
+        self.assertIn(
+            "minified", self.checker.skip_reason_for_head(b"var a=1;" * 1000)
+        )
+        self.assertEqual(self.checker.check_file(filepath, repo="api"), [])
+
+    def test_check_file_scan_generated_policy(self):
+        """Test a disabled skip policy scans generated files."""
+        filepath = self._create_temp_file(
+            "vendor.min.js", "/* @ts-ignore */" + "var a=1;" * 1000
+        )
+        checker = DisableStatementsChecker(
+            skip_policy=SkipPolicy(enabled=False)
+        )
+        self.assertEqual(len(checker.check_file(filepath, repo="api")), 1)
+
+    def test_check_file_verbose_reports_decision(self):
+        """Test verbose mode reports skip and scan decisions."""
+        generated = self._create_temp_file("app.min.js", "var a=1;")
+        scanned = self._create_temp_file("app.ts", "const a = 1;")
+        checker = DisableStatementsChecker(verbose=True)
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            checker.check_files([generated, scanned], repo="api")
+        self.assertIn(f"{generated}: skip (generated path", stderr.getvalue())
+        self.assertIn(f"{scanned}: scan", stderr.getvalue())
+
+    def test_check_file_crlf_line_numbers(self):
+        """Test CRLF files report the same line numbers as LF files."""
+        filepath = os.path.join(self.temp_dir, "crlf.ts")
+        with open(filepath, "wb") as f:
+            f.write(b"const a = 1;\r\n// @ts-ignore\r\nconst b = 2;\r\n")
+        violations = self.checker.check_file(filepath, repo="api")
+        self.assertEqual(len(violations), 1)
+        self.assertIn("crlf.ts:2:", violations[0])
+
+    # ========== Rule Selection Tests ==========
+
+    def _write_config(self, body: str) -> str:
+        """Write a pyproject.toml with the given body to the temp dir."""
+        return self._create_temp_file("pyproject.toml", body)
+
+    def _selector(self, body: str) -> RuleSelector:
+        """Build a rule selector from a config body."""
+        return load_rule_selector(
+            DisableStatementsChecker.rule_names(), self._write_config(body)
+        )
+
+    def test_rule_names_auto_discovered(self):
+        """Test rule names are derived from the check_* methods."""
+        self.assertEqual(
+            DisableStatementsChecker.rule_names(),
+            [
+                "biome_disable",
+                "eslint_disable",
+                "istanbul_ignore",
+                "it_skip",
+                "sanitization_disable",
+                "ts_ignore",
+            ],
+        )
+
+    def test_default_rules_match_repo_policy(self):
+        """Test built-in defaults reproduce the per-repository rules."""
+        selector = RuleSelector(DisableStatementsChecker.rule_names())
+        api = selector.rules_for("src/app.ts", repo="api")
+        admin = selector.rules_for("src/app.ts", repo="admin")
+        self.assertNotIn("eslint_disable", api)
+        self.assertIn("biome_disable", api)
+        self.assertIn("eslint_disable", admin)
+        self.assertNotIn("ts_ignore", admin)
+        self.assertNotIn(
+            "istanbul_ignore", selector.rules_for("src/app.test.tsx", "api")
+        )
+
+    def test_config_overrides_by_path(self):
+        """Test overrides apply to directory, nested and file name globs."""
+        selector = self._selector("""
+[tool.disable_statements]
+
+[[tool.disable_statements.overrides]]
+paths = ["scripts/**"]
+disable = ["it_skip"]
+
+[[tool.disable_statements.overrides]]
+paths = ["src/**/legacy/*.js", "docs/"]
+rules = ["ts_ignore"]
+
+[[tool.disable_statements.overrides]]
+paths = ["*.stories.tsx"]
+enable = ["eslint_disable"]
+""")
+        root = self.temp_dir
+        scripts = selector.rules_for(
+            os.path.join(root, "scripts/a/b.ts"), "api"
+        )
+        self.assertNotIn("it_skip", scripts)
+        self.assertIn("ts_ignore", scripts)
+
+        legacy = os.path.join(root, "src/x/y/legacy/old.js")
+        self.assertEqual(selector.rules_for(legacy, "api"), ("ts_ignore",))
+        self.assertIn(
+            "it_skip",
+            selector.rules_for(os.path.join(root, "src/legacy/new.ts"), "api"),
+        )
+        self.assertEqual(
+            selector.rules_for(os.path.join(root, "docs/a/b.js"), "api"),
+            ("ts_ignore",),
+        )
+        self.assertIn(
+            "eslint_disable",
+            selector.rules_for(os.path.join(root, "src/a.stories.tsx"), "api"),
+        )
+
+    def test_config_patterns_relative_to_current_directory(self):
+        """Test patterns starting with "./" match like the bare pattern."""
+        selector = self._selector("""
+[tool.disable_statements]
+rules = ["it_skip"]
+
+[[tool.disable_statements.overrides]]
+paths = ["./src/**/*.ts", "./scripts/", "./tool.js"]
+disable = ["it_skip"]
+""")
+        root = self.temp_dir
+        for relative in ("src/a/b.ts", "scripts/c.js", "tool.js"):
+            self.assertEqual(
+                selector.rules_for(os.path.join(root, relative)), ()
+            )
+        self.assertEqual(
+            selector.rules_for(os.path.join(root, "src/a/b.js")),
+            ("it_skip",),
+        )
+
+    def test_config_later_override_wins(self):
+        """Test later overrides take precedence over earlier ones."""
+        selector = self._selector("""
+[tool.disable_statements]
+rules = ["it_skip"]
+
+[[tool.disable_statements.overrides]]
+paths = ["src/**"]
+disable = ["it_skip"]
+
+[[tool.disable_statements.overrides]]
+paths = ["src/keep/**"]
+enable = ["it_skip"]
+""")
+        root = self.temp_dir
+        self.assertEqual(
+            selector.rules_for(os.path.join(root, "a.ts")), ("it_skip",)
+        )
+        self.assertEqual(
+            selector.rules_for(os.path.join(root, "src/a.ts")), ()
+        )
+        self.assertEqual(
+            selector.rules_for(os.path.join(root, "src/keep/a.ts")),
+            ("it_skip",),
+        )
+
+    def test_config_outside_root_uses_file_name_globs_only(self):
+        """Test files outside the config root only match file name globs."""
+        selector = self._selector("""
+[[tool.disable_statements.overrides]]
+paths = ["**/*.ts"]
+rules = []
+""")
+        outside = os.path.join(os.path.dirname(self.temp_dir), "other.ts")
+        self.assertIn("ts_ignore", selector.rules_for(outside, "api"))
+        self.assertNotIn(
+            "istanbul_ignore", selector.rules_for("elsewhere/a.test.ts", "api")
+        )
+
+    def test_config_unknown_rule(self):
+        """Test unknown rule names are rejected."""
+        with self.assertRaises(ValueError):
+            self._selector("""
+[[tool.disable_statements.overrides]]
+paths = ["src/**"]
+disable = ["no_such_rule"]
+""")
+
+    def test_config_without_table_uses_defaults(self):
+        """Test a pyproject.toml without the table keeps the defaults."""
+        selector = self._selector("[tool.black]\nline-length = 79\n")
+        self.assertNotIn("eslint_disable", selector.rules_for("a.ts", "api"))
+
+    def test_directory_decisions_are_cached(self):
+        """Test files in one directory share one cached resolution."""
+        selector = self._selector("""
+[[tool.disable_statements.overrides]]
+paths = ["src/**"]
+disable = ["it_skip"]
+""")
+        for index in range(50):
+            selector.rules_for(os.path.join(self.temp_dir, f"src/f{index}.ts"))
+        self.assertEqual(len(selector._directory_cache), 1)
+        self.assertEqual(len(selector._rules_cache), 1)
+
+    def test_check_directory_applies_config(self):
+        """Test check_directory honours per-path rule configuration."""
+        selector = self._selector("""
+[[tool.disable_statements.overrides]]
+paths = ["generated/**"]
+rules = []
+""")
+        os.makedirs(os.path.join(self.temp_dir, "generated"))
+        os.makedirs(os.path.join(self.temp_dir, "src"))
+        self._create_temp_file(
+            os.path.join("generated", "a.ts"), "// @ts-ignore\n"
+        )
+        self._create_temp_file(os.path.join("src", "b.ts"), "// @ts-ignore\n")
+        checker = DisableStatementsChecker(rule_selector=selector)
+        violations = checker.check_directory(self.temp_dir, repo="api")
+        self.assertEqual(len(violations), 1)
+        self.assertIn("b.ts", violations[0])
+
     # ========== check_files Tests ==========
 
     def test_check_files_multiple(self):
@@ -307,6 +589,108 @@ const y = 2;
         violations = self.checker.check_files([], repo="api")
         self.assertEqual(len(violations), 0)
 
+    # ========== Async API Tests ==========
+
+    def _create_violating_files(self, count: int) -> list:
+        """Create files that each contain one @ts-ignore violation."""
+        return [
+            self._create_temp_file(f"file{index}.ts", "// @ts-ignore\n")
+            for index in range(count)
+        ]
+
+    def test_check_files_async_matches_sync(self):
+        """Test the async API reports the same violations in input order."""
+        file_paths = self._create_violating_files(20)
+        file_paths.append(self._create_temp_file("clean.ts", "const a = 1;"))
+        expected = self.checker.check_files(file_paths, repo="api")
+        result = asyncio.run(
+            self.checker.check_files_async(
+                file_paths, repo="api", max_concurrency=3
+            )
+        )
+        self.assertEqual(result, expected)
+        self.assertEqual(len(result), 20)
+
+    def test_iter_violations_async_yields_every_file(self):
+        """Test the async iterator yields one result per file."""
+        file_paths = self._create_violating_files(10)
+
+        async def collect():
+            return [
+                item
+                async for item in self.checker.iter_violations_async(
+                    iter(file_paths), repo="api", max_concurrency=4
+                )
+            ]
+
+        results = asyncio.run(collect())
+        self.assertEqual(
+            sorted(path for path, _ in results), sorted(file_paths)
+        )
+        self.assertTrue(all(len(found) == 1 for _, found in results))
+
+    def test_check_files_async_bounds_concurrency(self):
+        """Test no more than max_concurrency files are scanned at once."""
+        file_paths = self._create_violating_files(12)
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+        scan_content = self.checker.scan_content
+
+        def slow_scan(content, file_path, repo="admin"):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.01)
+            with lock:
+                state["active"] -= 1
+            return scan_content(content, file_path, repo)
+
+        self.checker.scan_content = slow_scan
+        asyncio.run(
+            self.checker.check_files_async(
+                file_paths, repo="api", max_concurrency=2
+            )
+        )
+        self.assertLessEqual(state["peak"], 2)
+
+    def test_check_files_async_cancellation(self):
+        """Test cancelling the caller stops pending files being scanned."""
+        file_paths = self._create_violating_files(100)
+        scanned = []
+        scan_content = self.checker.scan_content
+
+        def slow_scan(content, file_path, repo="admin"):
+            time.sleep(0.01)
+            scanned.append(file_path)
+            return scan_content(content, file_path, repo)
+
+        self.checker.scan_content = slow_scan
+
+        async def run_and_cancel():
+            task = asyncio.ensure_future(
+                self.checker.check_files_async(
+                    file_paths, repo="api", max_concurrency=2
+                )
+            )
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run_and_cancel())
+        self.assertLess(len(scanned), len(file_paths))
+
+    def test_check_files_async_process_pool(self):
+        """Test scanning can run in a process pool executor."""
+        file_paths = self._create_violating_files(4)
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            result = asyncio.run(
+                self.checker.check_files_async(
+                    file_paths, repo="api", executor=executor
+                )
+            )
+        self.assertEqual(result, self.checker.check_files(file_paths, "api"))
+
     # ========== check_directory Tests ==========
 
     def test_check_directory_finds_files(self):
@@ -327,6 +711,222 @@ const y = 2;
         # Should not check Python files
         self.assertEqual(len(violations), 0)
 
+    def test_check_directory_with_workers_matches_serial(self):
+        """Test a process pool reports the same violations in order."""
+        for index in range(12):
+            os.makedirs(
+                os.path.join(self.temp_dir, f"dir{index % 3}"), exist_ok=True
+            )
+            self._create_temp_file(
+                os.path.join(f"dir{index % 3}", f"file{index}.ts"),
+                f"// @ts-ignore\nconst x{index} = 1;\n" * (index % 4),
+            )
+        serial = self.checker.check_directory(self.temp_dir, repo="api")
+        pooled = self.checker.check_directory(
+            self.temp_dir, repo="api", jobs=2
+        )
+        self.assertEqual(len(serial), 18)
+        self.assertEqual(pooled, serial)
+
+    def test_check_files_rejects_negative_jobs(self):
+        """Test a negative number of workers is refused up front."""
+        file_path = self._create_temp_file("a.ts", "const x = 1;\n")
+        with self.assertRaises(ValueError):
+            self.checker.check_files([file_path, file_path], jobs=-1)
+
+    def _main_usage_error(self, *arguments):
+        """Run main with arguments it must reject and return its stderr."""
+        argv = ["disable_statements_check.py", *arguments]
+        argv += ["--config", os.devnull, "--directory", self.temp_dir]
+        with unittest.mock.patch.object(
+            sys, "argv", argv
+        ), contextlib.redirect_stderr(io.StringIO()) as errors:
+            with self.assertRaises(SystemExit) as raised:
+                main()
+        self.assertEqual(raised.exception.code, 2)
+        return errors.getvalue()
+
+    def test_main_rejects_negative_jobs(self):
+        """Test --jobs below 0 is a usage error, not a pool crash."""
+        self.assertIn(
+            "--jobs must be 0 or more", self._main_usage_error("--jobs", "-1")
+        )
+
+    def test_main_rejects_negative_file_timeout(self):
+        """Test --file-timeout below 0 is a usage error, not a crash."""
+        self.assertIn(
+            "--file-timeout must be 0 or more",
+            self._main_usage_error("--file-timeout", "-1"),
+        )
+
+    def test_main_rejects_negative_skip_limits(self):
+        """Test negative size limits cannot silently skip every file."""
+        for option in ("--max-file-size", "--max-line-length"):
+            self.assertIn(
+                f"{option} must be 0 or more",
+                self._main_usage_error(option, "-1"),
+            )
+
+    def test_main_memory_report_without_helper(self):
+        """Test a standalone copy explains the missing memory_report.py."""
+        argv = ["disable_statements_check.py", "--memory-report"]
+        argv += ["--config", os.devnull, "--directory", self.temp_dir]
+        with unittest.mock.patch.object(
+            sys, "argv", argv
+        ), unittest.mock.patch.dict(
+            sys.modules, {"memory_report": None}
+        ), contextlib.redirect_stderr(
+            io.StringIO()
+        ) as errors:
+            with self.assertRaises(SystemExit) as raised:
+                main()
+        self.assertEqual(raised.exception.code, 2)
+        self.assertIn("memory_report.py", errors.getvalue())
+
+    def test_standalone_copy_checks_in_this_process(self):
+        """Test a copy without process_pool.py still checks every file."""
+        file_paths = self._create_violating_files(4)
+        expected = self.checker.check_files(file_paths, "api")
+        with unittest.mock.patch.object(
+            disable_statements_check, "process_pool", None
+        ):
+            self.assertEqual(
+                self.checker.check_files(file_paths, "api", jobs=2), expected
+            )
+            self.assertIn(
+                "process_pool.py", self._main_usage_error("--jobs", "2")
+            )
+
+    def test_discover_files_is_sorted(self):
+        """Test discovery lists JS/TS files by directory, then name."""
+        os.makedirs(os.path.join(self.temp_dir, "sub"))
+        for name in ("b.ts", "a.js", "sub/c.tsx", "README.md"):
+            self._create_temp_file(name, "")
+        self.assertEqual(
+            [
+                os.path.relpath(_, self.temp_dir)
+                for _ in self.checker.discover_files(self.temp_dir)
+            ],
+            ["a.js", "b.ts", os.path.join("sub", "c.tsx")],
+        )
+
+    # ========== Linear-time Tests ==========
+
+    def _rule_methods(self):
+        """Return every rule method of the checker."""
+        return [
+            getattr(self.checker, f"check_{name}")
+            for name in DisableStatementsChecker.rule_names()
+        ]
+
+    def _adversarial_corpus(self):
+        """Return adversarial inputs of roughly one megabyte each."""
+        return {
+            "long_line": "const x = '" + "a" * MEGABYTE + "';",
+            "long_comment_line": "// " + "biome " * (MEGABYTE // 6),
+            "slashes": "/" * MEGABYTE,
+            "block_openers": "/*" * (MEGABYTE // 2),
+            "whitespace_after_anchor": "//" + " \t" * (MEGABYTE // 2),
+            "whitespace_after_keyword": "// istanbul" + " " * MEGABYTE + "x",
+            "whitespace_after_skip": "it.skip" + " " * MEGABYTE,
+            "whitespace_before_colon": "// check-sanitization-disable"
+            + " " * MEGABYTE
+            + ": reason",
+            "newline_run": "\n" * MEGABYTE,
+            "many_matches": "// biome-ignore x\n" * (MEGABYTE // 18),
+            "many_block_matches": "/* istanbul ignore next */\n"
+            * (MEGABYTE // 28),
+        }
+
+    def test_rules_are_linear_on_adversarial_inputs(self):
+        """Test every rule finishes quickly on adversarial inputs."""
+        for label, content in self._adversarial_corpus().items():
+            for method in self._rule_methods():
+                with self.subTest(input=label, rule=method.__name__):
+                    start = time.perf_counter()
+                    method(content, "adversarial.ts")
+                    elapsed = time.perf_counter() - start
+                    self.assertLess(elapsed, ADVERSARIAL_BUDGET_SECONDS)
+
+    def test_line_numbers_with_many_matches(self):
+        """Test line numbers stay correct when resolved from the index."""
+        content = "const a = 1;\n// biome-ignore x\n" * 1000
+        violations = self.checker.check_biome_disable(content, "test.ts")
+        self.assertEqual(len(violations), 1000)
+        self.assertIn("test.ts:2:", violations[0])
+        self.assertIn("test.ts:2000:", violations[-1])
+
+    # ========== File Timeout Tests ==========
+
+    def test_check_file_timeout_reports_file(self):
+        """Test a file exceeding its time budget is reported, not scanned."""
+        filepath = self._create_temp_file(
+            "big.ts", "// biome-ignore x\n" * (MEGABYTE // 18)
+        )
+        checker = DisableStatementsChecker(file_timeout=1e-6)
+        violations = checker.check_file(filepath, repo="api")
+        self.assertEqual(len(violations), 1)
+        self.assertIn("Timed out", violations[0])
+        self.assertIn(filepath, violations[0])
+
+    def test_check_file_timeout_off_main_thread(self):
+        """Test the time budget is enforced where signals are unavailable."""
+        filepath = self._create_temp_file(
+            "big.ts", "// biome-ignore x\n" * (MEGABYTE // 18)
+        )
+        checker = DisableStatementsChecker(file_timeout=1e-6)
+        results = []
+        worker = threading.Thread(
+            target=lambda: results.extend(
+                checker.check_file(filepath, repo="api")
+            )
+        )
+        worker.start()
+        worker.join()
+        self.assertEqual(len(results), 1)
+        self.assertIn("Timed out", results[0])
+
+    def test_check_file_within_timeout(self):
+        """Test files checked within their budget report normally."""
+        filepath = self._create_temp_file(
+            "small.ts", "// biome-ignore lint: temp\nconst x = 1;"
+        )
+        checker = DisableStatementsChecker(file_timeout=30)
+        violations = checker.check_file(filepath, repo="api")
+        self.assertEqual(len(violations), 1)
+        self.assertIn("biome-ignore", violations[0])
+
+    @unittest.skipUnless(hasattr(signal, "SIGALRM"), "requires SIGALRM")
+    def test_check_file_timeout_restores_signal_handler(self):
+        """Test the previous SIGALRM handler is restored after a check."""
+        filepath = self._create_temp_file("small.ts", "const x = 1;")
+        previous = signal.getsignal(signal.SIGALRM)
+        DisableStatementsChecker(file_timeout=30).check_file(filepath)
+        self.assertIs(signal.getsignal(signal.SIGALRM), previous)
+        self.assertEqual(signal.getitimer(signal.ITIMER_REAL), (0.0, 0.0))
+
+    # ========== Memory Report Tests ==========
+
+    def test_memory_report_measures_read_and_scan(self):
+        """Test the checker measures the phases of each file."""
+        report = MemoryReport()
+        checker = DisableStatementsChecker(memory_report=report)
+        filepath = self._create_temp_file("file.ts", "// @ts-ignore\n" * 500)
+        report.start()
+        try:
+            violations = checker.check_files([filepath], repo="api")
+        finally:
+            report.stop()
+        self.assertEqual(len(violations), 500)
+        self.assertEqual(set(report.phases), {"read", "scan"})
+        self.assertEqual(list(report.files), [filepath])
+        self.assertGreater(report.files[filepath], 0)
+
+    def test_measure_is_a_no_op_without_report(self):
+        """Test measuring does nothing unless a report is enabled."""
+        with self.checker.measure("read", "file.ts") as context:
+            self.assertIsNone(context)
+
     # ========== Integration Tests ==========
 
     def test_multiple_violations_in_single_file(self):
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Test suite for disable_statements_scale.py.
+
+This module tests the synthetic monorepo generator and the phase
+measurements of the scalability test. The full 100k file run is slow and
+only runs when the RUN_SLOW_TESTS environment variable is set; its
+results are written to SCALE_TEST_OUTPUT if that is set too.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+import unittest.mock
+from pathlib import Path
+
+# Add the scripts directory to the path
+SCRIPTS_DIR = (
+    Path(__file__).parent.parent.parent / ".github" / "workflows" / "scripts"
+)
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from disable_statements_check import DisableStatementsChecker  # noqa: E402
+from disable_statements_scale import (  # noqa: E402
+    PHASES,
+    build_monorepo,
+    run_phase,
+)
+
+try:
+    import resource  # noqa: F401
+except ImportError:  # Windows
+    resource = None
+
+
+class TestDisableStatementsScale(unittest.TestCase):
+    """Test cases for the disable statements scalability test."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+
+    def test_build_monorepo_shape(self):
+        """Test the tree is deep and has vendored and unchecked files."""
+        directory = self.temp_dir.name
+        counts = build_monorepo(directory, seed=3, file_count=2000)
+        self.assertTrue(all(bool(_) for _ in counts.values()))
+        self.assertEqual(sum(counts.values()), 2000)
+        depths = [
+            len(path.relative_to(directory).parts)
+            for path in Path(directory).rglob("*.ts*")
+        ]
+        self.assertGreater(max(depths), 6)
+        vendored = list(Path(directory).rglob("node_modules/**/*.js"))
+        self.assertEqual(len(vendored), counts["vendor"])
+
+    @unittest.skipIf(resource is None, "requires the resource module")
+    def test_run_phase_reports_every_metric(self):
+        """Test each phase reports time, throughput and peak memory."""
+        directory = os.path.join(self.temp_dir.name, "tree")
+        file_list = os.path.join(self.temp_dir.name, "files.txt")
+        build_monorepo(directory, seed=5, file_count=200)
+        for phase in PHASES:
+            metrics = run_phase(phase, directory, 2, "api", file_list)
+            self.assertGreater(metrics["files_per_second"], 0, phase)
+            self.assertGreater(metrics["peak_rss_kib"], 0, phase)
+            if phase in ("read", "scan"):
+                self.assertLessEqual(
+                    metrics["worker_seconds"], metrics["seconds"], phase
+                )
+
+    def test_read_and_scan_use_the_discovered_files(self):
+        """Test only the discover phase walks the tree."""
+        directory = os.path.join(self.temp_dir.name, "tree")
+        file_list = os.path.join(self.temp_dir.name, "files.txt")
+        build_monorepo(directory, seed=5, file_count=50)
+        run_phase("discover", directory, 1, "api", file_list)
+        with open(file_list, encoding="utf-8") as f:
+            discovered = f.read().splitlines()
+        self.assertEqual(
+            discovered, DisableStatementsChecker().discover_files(directory)
+        )
+        with unittest.mock.patch.object(
+            DisableStatementsChecker, "discover_files"
+        ) as discover:
+            for phase in ("read", "scan"):
+                run_phase(phase, directory, 1, "api", file_list)
+        discover.assert_not_called()
+
+    @unittest.skipUnless(
+        os.environ.get("RUN_SLOW_TESTS"),
+        "slow; set RUN_SLOW_TESTS=1 to run",
+    )
+    def test_scale_100k_files(self):
+        """Test checking a 100k file monorepo at 1, 2, 4 and N workers."""
+        output = os.environ.get("SCALE_TEST_OUTPUT") or os.path.join(
+            self.temp_dir.name, "scale.json"
+        )
+        subprocess.run(
+            [
+                sys.executable,
+                str(SCRIPTS_DIR / "disable_statements_scale.py"),
+                "--files",
+                "100000",
+                "--output",
+                output,
+            ],
+            check=True,
+            capture_output=True,
+        )
+        with open(output, encoding="utf-8") as f:
+            results = json.load(f)
+        self.assertEqual(sum(results["corpus"]["counts"].values()), 100_000)
+        self.assertTrue({"1", "2", "4"}.issubset(results["runs"]))
+        for phases in results["runs"].values():
+            self.assertEqual(set(phases), set(PHASES))
+            for metrics in phases.values():
+                self.assertGreater(metrics["files_per_second"], 0)
+            for phase in ("read", "scan"):
+                self.assertIn("worker_seconds", phases[phase])
+
+
+if __name__ == "__main__":
+    unittest.main()
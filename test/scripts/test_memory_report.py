@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Test suite for memory_report.py.
+
+This module tests the peak and net allocation measured for nested phases
+and the files they are about.
+"""
+
+import sys
+import tracemalloc
+import unittest
+from pathlib import Path
+
+# Add the scripts directory to the path
+SCRIPTS_DIR = (
+    Path(__file__).parent.parent.parent / ".github" / "workflows" / "scripts"
+)
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from memory_report import MemoryReport  # noqa: E402
+
+MEGABYTE = 1024 * 1024
+
+
+class TestMemoryReport(unittest.TestCase):
+    """Test cases for MemoryReport."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.report = MemoryReport()
+        self.report.start()
+        self.addCleanup(self._stop)
+
+    def _stop(self):
+        """Stop tracing if a test left it running."""
+        if tracemalloc.is_tracing():
+            self.report.stop()
+
+    def test_phase_records_peak_and_net(self):
+        """Test a freed allocation counts towards the peak only."""
+        with self.report.phase("scan", "a.ts"):
+            data = bytearray(MEGABYTE)
+            del data
+        calls, net, peak = self.report.phases["scan"]
+        self.assertEqual(calls, 1)
+        self.assertLess(net, MEGABYTE // 10)
+        self.assertGreaterEqual(peak, MEGABYTE)
+        self.assertEqual(self.report.files["a.ts"], peak)
+
+    def test_nested_peak_reaches_enclosing_phase(self):
+        """Test an inner phase does not hide its peak from the outer one."""
+        with self.report.phase("file", "a.ts"):
+            with self.report.phase("read", "a.ts"):
+                data = bytearray(2 * MEGABYTE)
+                del data
+            with self.report.phase("scan", "a.ts"):
+                kept = bytearray(MEGABYTE // 2)
+        self.assertGreaterEqual(self.report.phases["file"][2], 2 * MEGABYTE)
+        self.assertLess(self.report.phases["scan"][2], MEGABYTE)
+        self.assertGreaterEqual(self.report.phases["file"][1], len(kept))
+
+    def test_largest_peak_of_each_file_is_kept(self):
+        """Test files are ranked by their largest phase peak."""
+        for name, size in (("small.ts", 1024), ("large.ts", MEGABYTE)):
+            with self.report.phase("read", name):
+                data = bytearray(size)
+                del data
+        with self.report.phase("read", "small.ts"):
+            pass
+        self.report.stop()
+        self.assertGreater(self.report.peak, MEGABYTE)
+        lines = self.report.summary(top=1).splitlines()
+        self.assertEqual(lines[-2], "Files with the largest peaks:")
+        self.assertTrue(lines[-1].endswith("KiB  large.ts"))
+
+    def test_summary_without_files(self):
+        """Test phases without a file are listed without a file section."""
+        with self.report.phase("report"):
+            pass
+        summary = self.report.summary()
+        self.assertIn("report", summary)
+        self.assertNotIn("Files with the largest peaks", summary)
+
+
+if __name__ == "__main__":
+    unittest.main()
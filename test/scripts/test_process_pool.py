@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Test suite for process_pool.py.
+
+This module tests the process pool shared by the CI checker scripts.
+"""
+
+import os
+import sys
+import unittest
+import unittest.mock
+from pathlib import Path
+
+# Add the scripts directory to the path
+SCRIPTS_DIR = (
+    Path(__file__).parent.parent.parent / ".github" / "workflows" / "scripts"
+)
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from process_pool import (  # noqa: E402
+    chunk_size,
+    map_in_pool,
+    resolve_jobs,
+    share,
+    shared,
+)
+
+
+def add_shared(value, offset):
+    """Add the worker's shared object and an offset to a value."""
+    return value + shared() + offset
+
+
+def worker_pid(_):
+    """Return the process ID of the worker."""
+    return os.getpid()
+
+
+class TestProcessPool(unittest.TestCase):
+    """Test cases for the shared process pool."""
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        share(None)
+
+    def test_resolve_jobs(self):
+        """Test 0 uses every CPU and negative counts are refused."""
+        self.assertEqual(resolve_jobs(3), 3)
+        with unittest.mock.patch.object(os, "cpu_count", return_value=6):
+            self.assertEqual(resolve_jobs(0), 6)
+        with unittest.mock.patch.object(os, "cpu_count", return_value=None):
+            self.assertEqual(resolve_jobs(0), 1)
+        with self.assertRaises(ValueError):
+            resolve_jobs(-1)
+
+    def test_chunk_size(self):
+        """Test each worker receives about four chunks."""
+        self.assertEqual(chunk_size(800, 2), 100)
+        self.assertEqual(chunk_size(3, 4), 1)
+        self.assertEqual(chunk_size(0, 1), 1)
+
+    def test_map_in_pool_keeps_order_and_shares(self):
+        """Test results follow the items and see the shared object."""
+        values = list(range(20))
+        results = map_in_pool(
+            add_shared,
+            2,
+            values,
+            [100] * len(values),
+            initializer=share,
+            initargs=(1000,),
+        )
+        self.assertEqual(list(results), [_ + 1100 for _ in values])
+        self.assertIsNone(shared())
+
+    def test_map_in_pool_stops_early(self):
+        """Test closing the results shuts the pool down."""
+        results = map_in_pool(worker_pid, 2, list(range(200)))
+        pid = next(results)
+        results.close()
+        self.assertNotEqual(pid, os.getpid())
+        with self.assertRaises(StopIteration):
+            next(results)
+
+
+if __name__ == "__main__":
+    unittest.main()
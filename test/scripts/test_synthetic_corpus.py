@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Test suite for synthetic_corpus.py.
+
+This module tests the seeded corpus writer shared by the benchmark,
+differential and scalability scripts.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add the scripts directory to the path
+SCRIPTS_DIR = (
+    Path(__file__).parent.parent.parent / ".github" / "workflows" / "scripts"
+)
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from synthetic_corpus import write_corpus  # noqa: E402
+
+
+def generate(rng, index):
+    """Generate a small file in one of three nested directories."""
+    path = os.path.join(f"part{index % 3}", "sub", f"file{index}.txt")
+    return path, "".join(rng.choice("ab\n") for _ in range(50))
+
+
+class TestSyntheticCorpus(unittest.TestCase):
+    """Test cases for the seeded corpus writer."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+
+    def _tree(self, directory):
+        """Return the relative paths and contents of a tree."""
+        return sorted(
+            (str(path.relative_to(directory)), path.read_bytes())
+            for path in Path(directory).rglob("*")
+            if path.is_file()
+        )
+
+    def test_same_seed_writes_identical_trees(self):
+        """Test the same seed produces byte-identical corpora."""
+        first = os.path.join(self.temp_dir.name, "first")
+        second = os.path.join(self.temp_dir.name, "second")
+        write_corpus(first, 7, 12, generate)
+        write_corpus(second, 7, 12, generate)
+        self.assertEqual(self._tree(first), self._tree(second))
+
+        third = os.path.join(self.temp_dir.name, "third")
+        write_corpus(third, "7-other", 12, generate)
+        self.assertNotEqual(self._tree(first), self._tree(third))
+
+    def test_returns_sorted_paths_with_unix_newlines(self):
+        """Test every file is listed in order and written verbatim."""
+        directory = self.temp_dir.name
+        file_paths = write_corpus(directory, 3, 12, generate)
+        self.assertEqual(len(file_paths), 12)
+        self.assertEqual(file_paths, sorted(file_paths))
+        self.assertEqual(
+            sorted(str(path) for path in Path(directory).rglob("*.txt")),
+            file_paths,
+        )
+        content = Path(file_paths[0]).read_bytes()
+        self.assertNotIn(b"\r", content)
+
+
+if __name__ == "__main__":
+    unittest.main()